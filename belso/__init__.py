@@ -3,19 +3,18 @@
 from belso.version import __version__
 from belso.utils import configure_logger, get_logger
 
-# Initialize logger with default settings
-configure_logger()
-
-# Get the main logger for the package
+# Importing belso does not install any handler: applications opt in to belso's
+# console output by calling `belso.utils.configure_logger()`.
 _logger = get_logger()
-_logger.info(f"belso v{__version__} initialized.")
+_logger.debug("belso v%s initialized.", __version__)
 
 # Import and expose main components
-from belso.core import SchemaProcessor, Schema, Field
+from belso.core import SchemaProcessor, Schema, FrozenSchema, Field
 
 __all__ = [
     "__version__",
     "SchemaProcessor",
     "Field",
-    "Schema"
+    "Schema",
+    "FrozenSchema"
 ]
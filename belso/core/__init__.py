@@ -1,15 +1,31 @@
 # belso.core.__init__
 
-from belso.core.schema import Schema
+from belso.core.schema import Schema, FrozenSchema, freeze_field
 from belso.core.field import BaseField, NestedField, ArrayField, Field
+from belso.core.spec import schema_to_spec, schema_from_spec, schema_fingerprint, forget_fingerprint
+from belso.core.ir import SchemaIR, compile_ir, invalidate_ir
+from belso.core.traversal import fold
+from belso.core.template import SchemaTemplate
 
-from belso.core.processor import SchemaProcessor
+from belso.core.processor import SchemaProcessor, ConversionError
 
 __all__ = [
     "Schema",
+    "FrozenSchema",
+    "freeze_field",
     "BaseField",
     "NestedField",
     "ArrayField",
     "Field",
-    "SchemaProcessor"
+    "schema_to_spec",
+    "schema_from_spec",
+    "schema_fingerprint",
+    "forget_fingerprint",
+    "SchemaIR",
+    "compile_ir",
+    "invalidate_ir",
+    "fold",
+    "SchemaTemplate",
+    "SchemaProcessor",
+    "ConversionError"
 ]
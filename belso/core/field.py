@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import builtins
-from typing import Type, Optional, Any, List, Dict, Union, get_origin, get_args
+from operator import is_not
+from itertools import compress, repeat
+from typing import Type, Optional, Any, Iterable, List, Dict, Sequence, Tuple, Union, get_origin, get_args
 
 from beartype import beartype
 
@@ -12,6 +14,36 @@ from belso.core.schema import Schema, BaseField
 
 _logger = get_logger(__name__)
 
+def _type_params(type_: Type) -> List[str]:
+    """
+    Get the constraint parameters that apply to a type, besides the common ones.\n
+    ---
+    ### Args
+    - `type_` (`Type`): type of the field.\n
+    ---
+    ### Returns
+    - `List[str]`: the names of the parameters.
+    """
+    params = []
+
+    if type_ in (str, bytes):
+        # Parametri validi per stringhe
+        params += ['length_range', 'regex', 'format_']
+
+    if type_ in (int, float):
+        # Parametri validi per numeri
+        params += ['range_', 'exclusive_range', 'multiple_of']
+
+    if type_ == list or get_origin(type_) in (list, List):
+        # Parametri validi per liste
+        params += ['items_range']
+
+    if type_ == dict or (isinstance(type_, type) and issubclass(type_, Schema)):
+        # Parametri validi per oggetti/dizionari
+        params += ['properties_range']
+
+    return params
+
 def _validate_field_params(
         type_: Type,
         **kwargs
@@ -30,43 +62,14 @@ def _validate_field_params(
 
     # Parametri comuni per tutti i tipi
     common_params = ['name', 'description', 'required', 'default', 'enum']
-    for param in common_params:
+    for param in common_params + _type_params(type_):
         if param in kwargs and kwargs[param] is not None:
             valid_params[param] = kwargs[param]
 
-    # Validazione specifica per tipo
-    if type_ in (str, bytes):
-        # Parametri validi per stringhe
-        string_params = ['length_range', 'regex', 'format_']
-        for param in string_params:
-            if param in kwargs and kwargs[param] is not None:
-                valid_params[param] = kwargs[param]
-
-    if type_ in (int, float):
-        # Parametri validi per numeri
-        number_params = ['range_', 'exclusive_range', 'multiple_of']
-        for param in number_params:
-            if param in kwargs and kwargs[param] is not None:
-                valid_params[param] = kwargs[param]
-
-    if type_ == list or get_origin(type_) in (list, List):
-        # Parametri validi per liste
-        list_params = ['items_range']
-        for param in list_params:
-            if param in kwargs and kwargs[param] is not None:
-                valid_params[param] = kwargs[param]
-
-    if type_ == dict or (isinstance(type_, type) and issubclass(type_, Schema)):
-        # Parametri validi per oggetti/dizionari
-        object_params = ['properties_range']
-        for param in object_params:
-            if param in kwargs and kwargs[param] is not None:
-                valid_params[param] = kwargs[param]
-
     # Logga eventuali parametri ignorati
     for param, value in kwargs.items():
         if param not in valid_params and param not in common_params and value is not None:
-            _logger.warning(f"Parametro '{param}' ignorato per il tipo {type_.__name__}")
+            _logger.warning("Parametro '%s' ignorato per il tipo %s", param, type_.__name__)
 
     return valid_params
 
@@ -160,7 +163,8 @@ class ArrayField(BaseField):
             properties_range: Optional[tuple] = None,
             regex: Optional[str] = None,
             multiple_of: Optional[float] = None,
-            format_: Optional[str] = None
+            format_: Optional[str] = None,
+            items_schema: Optional[Type[Schema]] = None
         ) -> None:
         # Valida i parametri per il tipo list
         valid_params = _validate_field_params(
@@ -188,7 +192,17 @@ class ArrayField(BaseField):
             default=default,
             **{k: v for k, v in valid_params.items() if k not in ['name', 'description', 'required', 'default']}
         )
-        self.items_type = items_type
+        # An explicit items schema takes precedence over a generic `items_type`
+        self.items_type = items_schema if items_schema is not None else items_type
+
+    @property
+    def items_schema(self) -> Optional[Type[Schema]]:
+        """
+        The schema of the array items, or `None` for arrays of primitives.
+        """
+        if isinstance(self.items_type, type) and issubclass(self.items_type, Schema):
+            return self.items_type
+        return None
 
 class Field:
     """
@@ -261,12 +275,8 @@ class Field:
         # Lists
         if origin in (list, List):
             item_type = args[0] if args else str
-            is_schema = (
-                isinstance(item_type, builtins.type)
-                and issubclass(item_type, Schema)
-            )
-            kwargs["items_type"] = dict if is_schema else item_type
-            _logger.debug(f"[Field] -> ArrayField<{item_type}>")
+            kwargs["items_type"] = item_type
+            _logger.debug("[Field] -> ArrayField<%s>", item_type)
             return ArrayField(**kwargs)
 
         # Schemas
@@ -274,11 +284,11 @@ class Field:
             isinstance(type, builtins.type)
             and issubclass(type, Schema)
         ):
-            _logger.debug(f"[Field] -> NestedField<{type.__name__}>")
+            _logger.debug("[Field] -> NestedField<%s>", type.__name__)
             return NestedField(schema=type, **kwargs)
 
         # Primitives or custom types
-        _logger.debug(f"[Field] -> BaseField<{type}>")
+        _logger.debug("[Field] -> BaseField<%s>", type)
 
         # Valida i parametri per il tipo specifico
         valid_params = _validate_field_params(
@@ -296,3 +306,164 @@ class Field:
         })
 
         return BaseField(**valid_params)
+
+# Parameters of `Field`, in order, as accepted by `Schema.from_spec`
+_FIELD_PARAMS = (
+    "name",
+    "type",
+    "description",
+    "required",
+    "default",
+    "enum",
+    "range",
+    "exclusive_range",
+    "length_range",
+    "items_range",
+    "properties_range",
+    "regex",
+    "multiple_of",
+    "format",
+)
+
+# Defaults of the parameters of `Field` after `name` and `type`
+_FIELD_DEFAULTS = ("", True) + (None,) * 10
+
+# Types accepted for each parameter, by position, as checked by `Field`
+_PARAM_TYPES = {
+    0: (str,),
+    2: (str,),
+    3: (bool,),
+    5: (list, type(None)),
+    6: (tuple, type(None)),
+    7: (tuple, type(None)),
+    8: (tuple, type(None)),
+    9: (tuple, type(None)),
+    10: (tuple, type(None)),
+    11: (str, type(None)),
+    12: (float, type(None)),
+    13: (str, type(None)),
+}
+
+# Positions of the constraints that only apply to some types, and the field attribute each one sets
+_CONSTRAINT_ATTRS = {
+    6: "range_",
+    7: "exclusive_range",
+    8: "length_range",
+    9: "items_range",
+    10: "properties_range",
+    11: "regex",
+    12: "multiple_of",
+    13: "format_",
+}
+
+# Field kinds, by the field class `Field` would instantiate
+_BASE, _NESTED, _ARRAY = 0, 1, 2
+
+def _field_plan(type_: Any) -> Tuple[int, Any, Type, Tuple[int, ...]]:
+    """
+    Decide once, for all the fields of a type, what `Field` would build.\n
+    ---
+    ### Args
+    - `type_` (`Any`): the type of the fields.\n
+    ---
+    ### Returns
+    - `Tuple[int, Any, Type, Tuple[int, ...]]`: the field kind, the type stored by the field (the items type of arrays, the schema of nested fields), the type its constraints are checked for and the positions of the constraints it ignores.
+    """
+    if get_origin(type_) in (list, List):
+        args = get_args(type_)
+        kind, stored, checked = _ARRAY, args[0] if args else str, list
+    elif isinstance(type_, builtins.type) and issubclass(type_, Schema):
+        kind, stored, checked = _NESTED, type_, dict
+    else:
+        kind, stored, checked = _BASE, type_, type_
+
+    kept = _type_params(checked)
+    ignored = tuple(position for position, attr in _CONSTRAINT_ATTRS.items() if attr not in kept)
+    return kind, stored, checked, ignored
+
+def _fields_from_rows(rows: Iterable[Union[Dict[str, Any], Sequence[Any]]]) -> List[BaseField]:
+    """
+    Build the fields described by rows, as `Field` would, validating the
+    rows column by column and deciding the field class once per distinct
+    type instead of once per field.\n
+    ---
+    ### Args
+    - `rows` (`Iterable[Union[Dict[str, Any], Sequence[Any]]]`): the fields, as dicts of `Field` arguments, or as sequences of them in `Field` order (at least `name` and `type`).\n
+    ---
+    ### Returns
+    - `List[BaseField]`: the fields, in row order.
+    ---
+    ### Raises
+    - `ValueError`: if a row has unknown or missing parameters, or if two fields share a name.
+    - `TypeError`: if a parameter has the wrong type.
+    """
+    size = len(_FIELD_PARAMS)
+    table = []
+    unknown = set()
+    for row in rows:
+        if isinstance(row, dict):
+            unknown.update(row.keys())
+            row = tuple(row.get(param, default) for param, default in zip(_FIELD_PARAMS, (None, None) + _FIELD_DEFAULTS))
+        elif 2 <= len(row) <= size:
+            row = tuple(row) + _FIELD_DEFAULTS[len(row) - 2:]
+        else:
+            raise ValueError(f"A field row needs between 2 and {size} values, got {len(row)}.")
+        table.append(row)
+
+    unknown.difference_update(_FIELD_PARAMS)
+    if unknown:
+        raise ValueError(f"Unknown field parameters: {', '.join(sorted(unknown))}.")
+    if not table:
+        return []
+
+    columns = list(zip(*table))
+    for position, expected in _PARAM_TYPES.items():
+        for value_type in set(map(type, columns[position])):
+            if not issubclass(value_type, expected):
+                row = next(row for row in table if type(row[position]) is value_type)
+                raise TypeError(
+                    f"Field {row[0]!r}: parameter '{_FIELD_PARAMS[position]}' must be of type "
+                    f"{' or '.join(t.__name__ for t in expected)}, not {value_type.__name__}."
+                )
+    if None in columns[1]:
+        row = next(row for row in table if row[1] is None)
+        raise ValueError(f"Field {row[0]!r} has no type.")
+    if len(set(columns[0])) != len(table):
+        seen = set()
+        duplicate = next(name for name in columns[0] if name in seen or seen.add(name))
+        raise ValueError(f"Duplicate field name: {duplicate!r}.")
+
+    plans = {type_: _field_plan(type_) for type_ in set(columns[1])}
+
+    # Constraints set on fields of types they do not apply to are dropped,
+    # as by `Field`: only the rows setting a constraint are looked at
+    dropped = {}
+    for position in _CONSTRAINT_ATTRS:
+        for index in compress(range(len(table)), map(is_not, columns[position], repeat(None))):
+            row = table[index]
+            _, _, checked, ignored = plans[row[1]]
+            if position in ignored:
+                dropped[(position, checked)] = None
+                table[index] = row[:position] + (None,) + row[position + 1:]
+
+    fields = []
+    new = object.__new__
+    init = BaseField.__init__
+    for row, (kind, stored, _, _) in zip(table, map(plans.__getitem__, columns[1])):
+        if kind == _BASE:
+            fields.append(BaseField(*row))
+        elif kind == _ARRAY:
+            field = new(ArrayField)
+            init(field, row[0], list, *row[2:])
+            field.items_type = stored
+            fields.append(field)
+        else:
+            field = new(NestedField)
+            init(field, row[0], dict, *row[2:])
+            field.schema = stored
+            fields.append(field)
+
+    # Once per parameter and type, rather than once per field
+    for position, checked in dropped:
+        _logger.warning("Parametro '%s' ignorato per il tipo %s", _CONSTRAINT_ATTRS[position], getattr(checked, "__name__", checked))
+    return fields
@@ -0,0 +1,205 @@
+# belso.core.ir
+
+from weakref import WeakValueDictionary
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from belso.core.schema import Schema, BaseField, FrozenSchemaMeta, _fields_version
+from belso.core.field import NestedField, ArrayField
+
+# Field kinds
+PRIMITIVE = 0
+OBJECT = 1
+ARRAY = 2
+OBJECT_ARRAY = 3
+
+# Optional field attributes, carried by the `attrs` column when set
+_OPTIONAL_ATTRS = (
+    "default",
+    "enum",
+    "range_",
+    "exclusive_range",
+    "length_range",
+    "items_range",
+    "properties_range",
+    "regex",
+    "multiple_of",
+    "format_",
+)
+
+# Roots of the compiled schema graphs, by id. Each graph is stored on its
+# root class (`_belso_ir`), so it lives and dies with the class: a cache
+# holding it would keep the class alive through its `schemas`
+_COMPILED: "WeakValueDictionary[int, type]" = WeakValueDictionary()
+
+class SchemaIR:
+    """
+    Flat description of a schema graph, compiled once by `compile_ir` and
+    shared by the providers, the serializers and the validators.\n
+    Every distinct schema of the graph is numbered, the root being `0`. The
+    fields of all schemas are stored as rows of parallel column tuples: the
+    fields of schema `i` are the rows `offsets[i]` to `offsets[i + 1]`.
+    Nested schemas are referenced by number in the `children` column, so
+    shared and recursive schemas are described once.
+    """
+    __slots__ = (
+        "schemas",
+        "indices",
+        "offsets",
+        "required",
+        "fields",
+        "names",
+        "kinds",
+        "types",
+        "children",
+        "links",
+        "attrs",
+        "_state",
+    )
+
+    def __init__(self, schema: Type[Schema]) -> None:
+        schemas: List[Type[Schema]] = [schema]
+        indices: Dict[type, int] = {schema: 0}
+        offsets = [0]
+        required = []
+        fields: List[BaseField] = []
+        kinds: List[int] = []
+        types: List[Any] = []
+        children: List[int] = []
+        links = []
+        attrs: List[Dict[str, Any]] = []
+
+        # `schemas` grows while the graph is walked
+        for current in schemas:
+            nested = []
+            for field in current.fields:
+                if isinstance(field, NestedField):
+                    kind, type_ = OBJECT, field.schema
+                elif isinstance(field, ArrayField) and field.items_schema is not None:
+                    kind, type_ = OBJECT_ARRAY, field.items_schema
+                elif isinstance(field, ArrayField):
+                    kind, type_ = ARRAY, field.items_type
+                else:
+                    kind, type_ = PRIMITIVE, field.type_
+
+                child = -1
+                if kind == OBJECT or kind == OBJECT_ARRAY:
+                    child = indices.get(type_, -1)
+                    if child < 0:
+                        child = indices[type_] = len(schemas)
+                        schemas.append(type_)
+                    nested.append(len(fields))
+
+                fields.append(field)
+                kinds.append(kind)
+                types.append(type_)
+                children.append(child)
+                values = {}
+                for attr in _OPTIONAL_ATTRS:
+                    value = getattr(field, attr)
+                    if value is not None:
+                        values[attr] = value
+                attrs.append(values)
+            offsets.append(len(fields))
+            links.append(tuple(nested))
+            required.append(current.get_required_fields())
+
+        # The schemas of the graph
+        self.schemas: Tuple[Type[Schema], ...] = tuple(schemas)
+        # The number of each schema
+        self.indices = indices
+        # The first row of each schema, and the end of the last one
+        self.offsets: Tuple[int, ...] = tuple(offsets)
+        # The names of the required fields of each schema
+        self.required: Tuple[Tuple[str, ...], ...] = tuple(required)
+        # Field columns, one row per field
+        self.fields: Tuple[BaseField, ...] = tuple(fields)
+        self.names: Tuple[str, ...] = tuple(field.name for field in fields)
+        self.kinds: Tuple[int, ...] = tuple(kinds)
+        # The field type, the items type of arrays, or the nested schema
+        self.types: Tuple[Any, ...] = tuple(types)
+        # The number of the nested schema, or `-1`
+        self.children: Tuple[int, ...] = tuple(children)
+        # The rows of each schema that nest another schema
+        self.links: Tuple[Tuple[int, ...], ...] = tuple(links)
+        # The optional attributes that are set
+        self.attrs: Tuple[Dict[str, Any], ...] = tuple(attrs)
+        # Graphs of frozen schemas cannot change
+        self._state = None if all(isinstance(s, FrozenSchemaMeta) for s in schemas) else tuple((s, s.fields, _fields_version(s.fields)) for s in schemas)
+
+    def rows(self, index: int) -> range:
+        """
+        Get the rows of the fields of a schema.\n
+        ---
+        ### Args
+        - `index` (`int`): the number of the schema.\n
+        ---
+        ### Returns
+        - `range`: the rows.
+        """
+        return range(self.offsets[index], self.offsets[index + 1])
+
+    def is_frozen(self) -> bool:
+        """
+        Whether every schema of the graph is frozen, so that the graph cannot change.
+        """
+        return self._state is None
+
+    def is_current(self) -> bool:
+        """
+        Whether no `fields` list of the graph was replaced or mutated since compilation.
+        """
+        if self._state is None:
+            return True
+        for schema, fields, version in self._state:
+            if schema.fields is not fields or _fields_version(fields) != version:
+                return False
+        return True
+
+def compile_ir(schema: Type[Schema]) -> SchemaIR:
+    """
+    Compile a schema graph into its flat description. The result is cached
+    on the schema and rebuilt if a `fields` list of the graph is replaced or
+    mutated. Changes to the attributes of a field are not tracked: drop the
+    graphs with `invalidate_ir` (or `SchemaProcessor.clear_cache`) after
+    making some.\n
+    ---
+    ### Args
+    - `schema` (`Type[belso.Schema]`): the root schema.\n
+    ---
+    ### Returns
+    - `SchemaIR`: the compiled schema graph.
+    """
+    ir = schema.__dict__.get("_belso_ir")
+    if ir is None or not ir.is_current():
+        ir = SchemaIR(schema)
+        type.__setattr__(schema, "_belso_ir", ir)
+        _COMPILED[id(schema)] = schema
+    return ir
+
+def _compiled_graphs() -> List[SchemaIR]:
+    """
+    Get the compiled graphs of the schemas still alive.
+    """
+    graphs = []
+    for root in list(_COMPILED.values()):
+        ir = root.__dict__.get("_belso_ir")
+        if ir is not None:
+            graphs.append(ir)
+    return graphs
+
+def invalidate_ir(schema: Optional[type] = None) -> int:
+    """
+    Drop the compiled graphs that contain a schema, e.g. after changing the
+    attributes of its fields in place.\n
+    ---
+    ### Args
+    - `schema` (`Optional[type]`): the schema, as the root or a nested schema of the graphs. Defaults to `None` (every graph).\n
+    ---
+    ### Returns
+    - `int`: the number of dropped graphs.
+    """
+    stale = [ir.schemas[0] for ir in _compiled_graphs() if schema is None or schema in ir.indices]
+    for root in stale:
+        type.__delattr__(root, "_belso_ir")
+        _COMPILED.pop(id(root), None)
+    return len(stale)
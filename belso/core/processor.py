@@ -1,27 +1,411 @@
 # belso.core.processor
 
+import os
+import sys
+import json
+import hashlib
 from pathlib import Path
-from typing import Any, Dict, Type, Union, Optional
+from collections import deque
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Tuple, Type, Union, Optional, TYPE_CHECKING
 
-from pydantic import BaseModel
-
-from belso.core.schema import Schema
-from belso.tools import display_schema, validate_schema
+from belso.core.schema import Schema, SchemaMeta, FieldList
+from belso.core.spec import _canonical, schema_fingerprint, forget_fingerprint, schema_to_spec, schema_from_spec
+from belso.core.ir import SchemaIR, compile_ir, invalidate_ir, _compiled_graphs
+from belso.tools import (
+    display_schema,
+    validate_many,
+    collect_errors,
+    compile_validator,
+    clear_validators,
+    CompiledValidator,
+    BatchValidationResult,
+    RecordError,
+    ValidationIssue,
+    IncrementalValidator,
+    iter_fields,
+    aiter_fields
+)
 from belso.utils import (
     detect_schema_format,
     FORMATS,
-    get_logger
+    get_logger,
+    LRUCache,
+    CacheInfo,
+    DiskCache
 )
 from belso.utils.mappings.extra_mappings import (
     _CONVERT_TO_MAP,
     _CONVERT_FROM_MAP,
     _SAVE_TO_MAP,
-    _LOAD_FROM_MAP
+    _LOAD_FROM_MAP,
+    _DISK_CODEC_MAP
 )
 
+if TYPE_CHECKING:
+    from pydantic import BaseModel
 
 _logger = get_logger(__name__)
 
+# Converted schemas, keyed by `(schema, target format, source format)`
+_CONVERSION_CACHE = LRUCache(maxsize=256)
+
+# Converted schemas shared between processes, keyed by schema fingerprint and
+# target format; enabled by `SchemaProcessor.enable_disk_cache()` or by the
+# `BELSO_CACHE_DIR` environment variable
+_DISK_CACHE: Optional[DiskCache] = DiskCache(os.environ["BELSO_CACHE_DIR"]) if os.environ.get("BELSO_CACHE_DIR") else None
+
+# Target formats built from Pydantic models, which are shared between
+# conversions unless their translator is passed `cache=False`
+_MODEL_FORMATS = frozenset({FORMATS.OPENAI, FORMATS.LANGCHAIN})
+
+# Options of the target formats with side effects (e.g. writing a file),
+# which must run on every conversion: conversions given them are not cached
+_SIDE_EFFECT_OPTIONS = frozenset({"file_path"})
+
+def _graph_state(schema: Any) -> Optional[SchemaIR]:
+    """
+    Capture the state of the graph of a belso schema class: its compiled
+    graph, which is replaced when a `fields` list of the graph is replaced or
+    mutated, so that a cached conversion is then dropped. Graphs of frozen
+    schemas cannot change, and share the conversions of equal frozen
+    schemas; other classes (pydantic models) are not tracked.
+    """
+    if not isinstance(schema, SchemaMeta):
+        return None
+    ir = compile_ir(schema)
+    return None if ir.is_frozen() else ir
+
+def _cache_key(
+        schema: Any,
+        to: str,
+        from_format: Optional[str],
+        options: Dict[str, Any]
+    ) -> Optional[Tuple[Any, ...]]:
+    """
+    Build the conversion cache key of a schema, or `None` if the conversion
+    is not cached: only classes are, and only without side-effecting options.
+    """
+    if not isinstance(schema, type) or not _SIDE_EFFECT_OPTIONS.isdisjoint(options):
+        return None
+    return (schema, to, from_format, *sorted(options.items()))
+
+def _cached_conversion(
+        schema: type,
+        key: Tuple[Any, ...]
+    ) -> Any:
+    """
+    Get a cached conversion, if the graph of the schema did not change since.
+    """
+    state = _graph_state(schema)
+    cached = _CONVERSION_CACHE.get(key, valid=lambda entry: entry[0] is state)
+    return None if cached is None else cached[1]
+
+def _to_belso(
+        schema: Any,
+        from_format: Optional[str]
+    ) -> Type[Schema]:
+    """
+    Detect the format of a schema, if not given, and standardize it to a belso schema.\n
+    ---
+    ### Args
+    - `schema` (`Any`): the schema.
+    - `from_format` (`Optional[str]`): the format of the schema, or `None` to detect it.\n
+    ---
+    ### Returns
+    - `Type[belso.Schema]`: the belso schema.
+    """
+    # Detect input format if not specified
+    if from_format is None:
+        _logger.debug("No source format specified, auto-detecting...")
+        from_format = detect_schema_format(schema)
+        _logger.info("Auto-detected source format: '%s'.", from_format)
+    else:
+        _logger.debug("Using provided source format: '%s'.", from_format)
+
+    # Convert to our internal format if needed
+    if from_format != FORMATS.BELSO:
+        _logger.debug("Converting from '%s' to internal 'belso' format...", from_format)
+        belso_schema = SchemaProcessor.standardize(schema, from_format)
+        _logger.debug("Successfully converted from '%s' to 'belso' format.", from_format)
+    else:
+        _logger.debug("Schema is already in 'belso' format, no conversion needed.")
+        belso_schema = schema
+    return belso_schema
+
+def _disk_key(
+        belso_schema: Type[Schema],
+        to: str,
+        options: Dict[str, Any]
+    ) -> Optional[str]:
+    """
+    Build the disk cache key of a conversion, a valid file name: the schema
+    fingerprint, the target format and a hash of the options, if any. A
+    schema or options with values that hash differently in every process
+    have no key (`None`), so they are not cached on disk.
+    """
+    try:
+        fingerprint = schema_fingerprint(belso_schema)
+        if not options:
+            return f"{fingerprint}.{to}"
+        encoded = json.dumps(options, sort_keys=True, default=_canonical).encode("utf-8")
+    except TypeError as e:
+        _logger.debug("Not caching conversion to '%s' format on disk: %s", to, e)
+        return None
+    return f"{fingerprint}.{to}.{hashlib.sha256(encoded).hexdigest()[:16]}"
+
+def _translate(
+        belso_schema: Type[Schema],
+        to: str,
+        key: Optional[Tuple[Any, ...]],
+        state: Optional[SchemaIR],
+        options: Dict[str, Any],
+        cache: bool = True
+    ) -> Any:
+    """
+    Translate a belso schema to a target format, through the disk cache if
+    enabled, and store the result in the conversion cache. Empty results,
+    returned by the JSON Schema providers on failure, are not stored.\n
+    ---
+    ### Args
+    - `belso_schema` (`Type[belso.Schema]`): the standardized schema.
+    - `to` (`str`): the target format.
+    - `key` (`Optional[Tuple[Any, ...]]`): the conversion cache key, or `None` not to cache.
+    - `state` (`Optional[belso.core.SchemaIR]`): the graph state of the input schema, from `_graph_state`.
+    - `options` (`Dict[str, Any]`): the options of the target format.
+    - `cache` (`bool`): whether Pydantic models may be shared with other conversions. Defaults to `True`.\n
+    ---
+    ### Returns
+    - `Any`: the converted schema.
+    """
+    # Convert to target format
+    _logger.debug("Translating from belso format to '%s' format...", to)
+    try:
+        translator = _CONVERT_TO_MAP[to]
+    except KeyError:
+        _logger.error("Unsupported target format: '%s'.", to)
+        raise ValueError(f"Provider {to} not supported.")
+
+    disk_key = None
+    if key is not None and _DISK_CACHE is not None and to in _DISK_CODEC_MAP:
+        encode, decode = _DISK_CODEC_MAP[to]
+        disk_key = _disk_key(belso_schema, to, options)
+        data = _DISK_CACHE.get(disk_key) if disk_key is not None else None
+        if data is not None:
+            try:
+                result = decode(data)
+                _logger.debug("Using disk cached conversion to '%s' format.", to)
+                _CONVERSION_CACHE.put(key, (state, result))
+                return result
+            except Exception as e:
+                _logger.warning("Ignoring unreadable disk cache entry '%s': %s", disk_key, e)
+
+    if not cache and to in _MODEL_FORMATS:
+        result = translator(belso_schema, cache=False, **options)
+    else:
+        result = translator(belso_schema, **options)
+
+    # An empty result is a failed conversion, which is not kept
+    if not result:
+        return result
+    if disk_key is not None:
+        _DISK_CACHE.put(disk_key, encode(result))
+    if key is not None:
+        _CONVERSION_CACHE.put(key, (state, result))
+    _logger.info("Successfully converted schema to '%s' format.", to)
+    return result
+
+def _forget_schema(schema: Type[Schema]) -> None:
+    """
+    Drop what is cached on a schema class, whose fields may have changed in place.\n
+    ---
+    ### Args
+    - `schema` (`Type[belso.Schema]`): the schema.
+    """
+    # The version of the list stales what was built from it, here and in
+    # the schemas nesting this one
+    if isinstance(schema.fields, FieldList):
+        schema.fields.touch()
+    schema._forget_index()
+    forget_fingerprint(schema)
+
+class ConversionError:
+    """
+    A schema that bulk conversion failed to convert, with its position in the batch.
+    """
+    __slots__ = ("index", "message")
+
+    def __init__(
+            self,
+            index: int,
+            message: str
+        ) -> None:
+        self.index = index
+        self.message = message
+
+    def __repr__(self) -> str:
+        return f"ConversionError(index={self.index}, message={self.message!r})"
+
+# Target formats and their options of the current pool worker, set once by `_init_worker`
+_worker_targets: Dict[str, Dict[str, Any]] = {}
+
+def _init_worker(targets: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Pool initializer: set the target formats of the worker's conversions.\n
+    ---
+    ### Args
+    - `targets` (`Dict[str, Dict[str, Any]]`): the options of each target format, by format.
+    """
+    global _worker_targets
+    _worker_targets = targets
+
+def _to_payload(
+        schema: Any,
+        from_format: Optional[str]
+    ) -> Tuple[str, Any]:
+    """
+    Describe a schema as picklable data for a pool worker. Belso schemas
+    travel as specs; pydantic models, being classes, are standardized first.\n
+    ---
+    ### Args
+    - `schema` (`Any`): the schema.
+    - `from_format` (`Optional[str]`): the format of the schema, or `None` to detect it.\n
+    ---
+    ### Returns
+    - `Tuple[str, Any]`: the format of the payload and the payload; a spec if the format is `belso`.
+    """
+    if from_format is None:
+        from_format = detect_schema_format(schema)
+    if from_format == FORMATS.BELSO:
+        return from_format, schema_to_spec(schema)
+    if isinstance(schema, type):
+        return FORMATS.BELSO, schema_to_spec(_to_belso(schema, from_format))
+    return from_format, schema
+
+def _convert_chunk(payloads: List[Tuple[Optional[str], Any]]) -> List[Tuple[bool, Any]]:
+    """
+    Pool task: convert a chunk of schemas to the worker's target formats.
+    Pydantic models cannot be sent back, so for OpenAI and LangChain the
+    spec of the standardized schema is returned instead.\n
+    ---
+    ### Args
+    - `payloads` (`List[Tuple[Optional[str], Any]]`): the schemas, from `_to_payload`; a `None` format carries the message of a schema that could not be described.\n
+    ---
+    ### Returns
+    - `List[Tuple[bool, Any]]`: for each schema, whether it was converted and its conversions by format, or the error message.
+    """
+    results = []
+    for from_format, data in payloads:
+        if from_format is None:
+            results.append((False, data))
+            continue
+        try:
+            if from_format == FORMATS.BELSO:
+                belso_schema = schema_from_spec(data)
+            else:
+                belso_schema = _to_belso(data, from_format)
+            converted = {}
+            spec = None
+            for to, options in _worker_targets.items():
+                if to in _DISK_CODEC_MAP:
+                    converted[to] = _CONVERT_TO_MAP[to](belso_schema, **options)
+                else:
+                    if spec is None:
+                        spec = schema_to_spec(belso_schema)
+                    converted[to] = spec
+            results.append((True, converted))
+        except Exception as e:
+            results.append((False, f"{type(e).__name__}: {e}"))
+    return results
+
+def _convert_parallel(
+        schemas: Iterable[Any],
+        targets: Dict[str, Dict[str, Any]],
+        from_format: Optional[str],
+        workers: Optional[int],
+        chunk_size: int
+    ) -> Iterator[Union[Dict[str, Any], ConversionError]]:
+    """
+    Convert schemas in chunks on a process pool, yielding the conversions of
+    each schema, by format, in input order. At most two chunks per worker are
+    in flight at a time.\n
+    ---
+    ### Args
+    - `schemas` (`Iterable[Any]`): the schemas to convert.
+    - `targets` (`Dict[str, Dict[str, Any]]`): the options of each target format, by format.
+    - `from_format` (`Optional[str]`): the format of the schemas, or `None` to detect it per schema.
+    - `workers` (`Optional[int]`): the number of processes, or `None` for one per CPU.
+    - `chunk_size` (`int`): the number of schemas sent to a worker at once.\n
+    ---
+    ### Returns
+    - `Iterator[Union[Dict[str, Any], ConversionError]]`: the conversions, or the failure, of each schema.
+    """
+    workers = workers or os.cpu_count() or 1
+    iterator = iter(schemas)
+    pending = deque()
+    offset = 0
+
+    def collect(future, start: int) -> Iterator[Union[Dict[str, Any], ConversionError]]:
+        for index, (ok, result) in enumerate(future.result(), start):
+            if not ok:
+                _logger.warning("Failed to convert schema %d: %s", index, result)
+                yield ConversionError(index, result)
+                continue
+            belso_schema = None
+            for to, options in targets.items():
+                if to not in _DISK_CODEC_MAP:
+                    if belso_schema is None:
+                        belso_schema = schema_from_spec(result[to])
+                    result[to] = _CONVERT_TO_MAP[to](belso_schema, **options)
+            yield result
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(targets,)
+    ) as executor:
+        while True:
+            chunk = []
+            for schema in islice(iterator, chunk_size):
+                try:
+                    chunk.append(_to_payload(schema, from_format))
+                except Exception as e:
+                    chunk.append((None, f"{type(e).__name__}: {e}"))
+            if not chunk:
+                break
+            pending.append((executor.submit(_convert_chunk, chunk), offset))
+            offset += len(chunk)
+            if len(pending) >= 2 * workers:
+                yield from collect(*pending.popleft())
+        while pending:
+            yield from collect(*pending.popleft())
+
+def _convert_serial(
+        schemas: Iterable[Any],
+        targets: Dict[str, Dict[str, Any]],
+        from_format: Optional[str]
+    ) -> Iterator[Union[Dict[str, Any], ConversionError]]:
+    """
+    Convert schemas one after the other, in-process, yielding the conversions
+    of each schema, by format, in input order.\n
+    ---
+    ### Args
+    - `schemas` (`Iterable[Any]`): the schemas to convert.
+    - `targets` (`Dict[str, Dict[str, Any]]`): the options of each target format, by format.
+    - `from_format` (`Optional[str]`): the format of the schemas, or `None` to detect it per schema.\n
+    ---
+    ### Returns
+    - `Iterator[Union[Dict[str, Any], ConversionError]]`: the conversions, or the failure, of each schema.
+    """
+    for index, schema in enumerate(schemas):
+        try:
+            belso_schema = _to_belso(schema, from_format)
+            yield {to: _CONVERT_TO_MAP[to](belso_schema, **options) for to, options in targets.items()}
+        except Exception as e:
+            _logger.warning("Failed to convert schema %d: %s", index, e)
+            yield ConversionError(index, f"{type(e).__name__}: {e}")
+
 class SchemaProcessor:
     """
     A unified class for schema processing, including translation and validation.
@@ -40,65 +424,228 @@ class SchemaProcessor:
         """
         _logger.debug("Delegating schema format detection...")
         format_type = detect_schema_format(schema)
-        _logger.info(f"Detected schema format: {format_type}.")
+        _logger.info("Detected schema format: %s.", format_type)
         return format_type
 
     @staticmethod
     def convert(
             schema: Any,
             to: str,
-            from_format: Optional[str] = None
-        ) -> Union[Dict[str, Any], Type[BaseModel], str]:
+            from_format: Optional[str] = None,
+            cache: bool = True,
+            **options: Any
+        ) -> Union[Dict[str, Any], Type["BaseModel"], str]:
         """
         Convert a schema to a specific format.
         This method can automatically detect the input schema format and convert it
         to our internal format before translating to the target format.\n
+        Conversions of schema classes (belso schemas, pydantic models) are cached
+        per target format, so converting an unchanged schema again returns the
+        same result object: treat it as read-only, or pass `cache=False`.
+        Conversions writing a file (`file_path`) are not cached.
+        If the disk cache is enabled, conversions to serializable formats (all
+        but OpenAI and LangChain) are also looked up there and stored there.\n
         ---
         ### Args
         - `schema` (`Any`): the schema to conver.
         - `to` (`str`): the target format. Can be a string or a `belso.utils.FORMATS` attribute.
-        - `from_format` (`Optional[str]`): optional format hint for the input schema. If `None`, the format will be auto-detected. Defaults to `None`.\n
+        - `from_format` (`Optional[str]`): optional format hint for the input schema. If `None`, the format will be auto-detected. Defaults to `None`.
+        - `cache` (`bool`): whether to use the conversion caches, and to reuse Pydantic models built by other conversions. Defaults to `True`.
+        - `**options` (`Any`): options of the target format, e.g. `use_refs=True` for JSON Schema providers (Anthropic, Ollama, Mistral, HuggingFace).\n
         ---
         ### Returns
         - `Dict[str, Any]` | `Type[pydantic.BaseModel]` | `str`: the converted schema.
         """
+        key = _cache_key(schema, to, from_format, options) if cache else None
+        if key is not None:
+            cached = _cached_conversion(schema, key)
+            if cached is not None:
+                _logger.debug("Using cached conversion to '%s' format.", to)
+                return cached
+
         try:
-            _logger.debug(f"Starting schema translation to '{to}' format...")
+            _logger.debug("Starting schema translation to '%s' format...", to)
+            belso_schema = _to_belso(schema, from_format)
+            return _translate(belso_schema, to, key, _graph_state(schema), options, cache)
 
-            # Detect input format if not specified
-            if from_format is None:
-                _logger.debug("No source format specified, auto-detecting...")
-                from_format = detect_schema_format(schema)
-                _logger.info(f"Auto-detected source format: '{from_format}'.")
-            else:
-                _logger.debug(f"Using provided source format: '{from_format}'.")
+        except Exception as e:
+            _logger.error("Error during schema translation: %s", e)
+            _logger.debug("Translation error details", exc_info=True)
+            raise
 
-            # Convert to our internal format if needed
-            if from_format != FORMATS.BELSO:
-                _logger.debug(f"Converting from '{from_format}' to internal 'belso' format...")
-                belso_schema = SchemaProcessor.standardize(schema, from_format)
-                _logger.debug(f"Successfully converted from '{from_format}' to 'belso' format.")
-            else:
-                _logger.debug("Schema is already in 'belso' format, no conversion needed.")
-                belso_schema = schema
+    @staticmethod
+    def convert_all(
+            schema: Any,
+            targets: Iterable[str],
+            from_format: Optional[str] = None,
+            cache: bool = True,
+            options: Optional[Dict[str, Dict[str, Any]]] = None
+        ) -> Dict[str, Union[Dict[str, Any], Type["BaseModel"], str]]:
+        """
+        Convert a schema to several formats at once. The input schema is
+        detected and standardized once, then every target is emitted from
+        the same belso schema, instead of once per `convert` call.
+        Conversions are cached as by `convert`.\n
+        ---
+        ### Args
+        - `schema` (`Any`): the schema to convert.
+        - `targets` (`Iterable[str]`): the target formats. Can be strings or `belso.utils.FORMATS` attributes.
+        - `from_format` (`Optional[str]`): optional format hint for the input schema. If `None`, the format will be auto-detected. Defaults to `None`.
+        - `cache` (`bool`): whether to use the conversion caches, and to reuse Pydantic models built by other conversions. Defaults to `True`.
+        - `options` (`Optional[Dict[str, Dict[str, Any]]]`): options of each target format, by format, e.g. `{"anthropic": {"use_refs": True}}`. Defaults to `None`.\n
+        ---
+        ### Returns
+        - `Dict[str, Union[Dict[str, Any], Type[pydantic.BaseModel], str]]`: the converted schemas, by target format.
+        """
+        targets = list(targets)
+        options = options or {}
+        results = {}
+        keys = {}
+        for to in targets:
+            if to in results or to in keys:
+                continue
+            key = _cache_key(schema, to, from_format, options.get(to, {})) if cache else None
+            if key is not None:
+                cached = _cached_conversion(schema, key)
+                if cached is not None:
+                    _logger.debug("Using cached conversion to '%s' format.", to)
+                    results[to] = cached
+                    continue
+            keys[to] = key
 
-            # Convert to target format
-            _logger.debug(f"Translating from belso format to '{to}' format...")
+        if keys:
             try:
-                translator = _CONVERT_TO_MAP[to]
-            except KeyError:
-                _logger.error(f"Unsupported target format: '{to}'.")
-                raise ValueError(f"Provider {to} not supported.")
+                _logger.debug("Starting schema translation to %d formats...", len(keys))
+                belso_schema = _to_belso(schema, from_format)
+                state = _graph_state(schema)
+                for to, key in keys.items():
+                    results[to] = _translate(belso_schema, to, key, state, options.get(to, {}), cache)
 
-            result = translator(belso_schema)
+            except Exception as e:
+                _logger.error("Error during schema translation: %s", e)
+                _logger.debug("Translation error details", exc_info=True)
+                raise
 
-            _logger.info(f"Successfully converted schema to '{to}' format.")
-            return result
+        # In the order the targets were requested
+        return {to: results[to] for to in dict.fromkeys(targets)}
 
-        except Exception as e:
-            _logger.error(f"Error during schema translation: {e}")
-            _logger.debug("Translation error details", exc_info=True)
-            raise
+    @staticmethod
+    def convert_many(
+            schemas: Iterable[Any],
+            to: Union[str, Iterable[str]],
+            from_format: Optional[str] = None,
+            workers: Optional[int] = None,
+            chunk_size: int = 64,
+            options: Optional[Dict[str, Dict[str, Any]]] = None
+        ) -> Iterator[Union[Dict[str, Any], Type["BaseModel"], str, ConversionError]]:
+        """
+        Convert a batch of schemas, such as a catalog loaded from JSON or YAML
+        files, on a process pool. Schemas are sent to the workers as plain
+        data (belso schemas as specs, JSON schemas as is), in chunks, and the
+        results are streamed back in input order. A schema that fails to
+        convert yields a `ConversionError` instead of aborting the batch.\n
+        OpenAI and LangChain models are classes, which cannot leave a worker:
+        their input is standardized by the workers but the models are built
+        by the calling process. Conversions are not cached.\n
+        ---
+        ### Args
+        - `schemas` (`Iterable[Any]`): the schemas to convert. Consumed lazily.
+        - `to` (`Union[str, Iterable[str]]`): the target format, or several target formats. Can be strings or `belso.utils.FORMATS` attributes.
+        - `from_format` (`Optional[str]`): optional format hint for the input schemas. If `None`, the format of each schema is auto-detected. Defaults to `None`.
+        - `workers` (`Optional[int]`): the number of worker processes, `None` for one per CPU, or `1` to convert in-process. Defaults to `None`.
+        - `chunk_size` (`int`): the number of schemas sent to a worker at once. Defaults to `64`.
+        - `options` (`Optional[Dict[str, Dict[str, Any]]]`): options of each target format, by format, e.g. `{"anthropic": {"use_refs": True}}`. Defaults to `None`.\n
+        ---
+        ### Returns
+        - `Iterator[Union[Dict[str, Any], Type[pydantic.BaseModel], str, ConversionError]]`: for each schema, in input order, the converted schema (a dict of converted schemas by format if `to` lists several formats), or a `ConversionError`.
+        """
+        single = isinstance(to, str)
+        options = options or {}
+        targets = {}
+        for target in ([to] if single else to):
+            if target not in _CONVERT_TO_MAP:
+                _logger.error("Unsupported target format: '%s'.", target)
+                raise ValueError(f"Provider {target} not supported.")
+            targets[target] = options.get(target, {})
+
+        _logger.debug("Starting bulk schema translation to %d formats...", len(targets))
+        if workers == 1:
+            results = _convert_serial(schemas, targets, from_format)
+        else:
+            results = _convert_parallel(schemas, targets, from_format, workers, chunk_size)
+        if not single:
+            return results
+        return (result if isinstance(result, ConversionError) else result[to] for result in results)
+
+    @staticmethod
+    def cache_info() -> CacheInfo:
+        """
+        Get the statistics of the conversion cache used by `convert`.\n
+        ---
+        ### Returns
+        - `belso.utils.CacheInfo`: the hits, misses, maximum and current size.
+        """
+        return _CONVERSION_CACHE.info()
+
+    @staticmethod
+    def clear_cache(schema: Optional[Any] = None) -> int:
+        """
+        Drop cached conversions, e.g. after modifying a schema in place.
+        Changes to a `fields` list are noticed without it, but changes to the
+        attributes of a field are not: clearing the schema also drops its
+        field index, fingerprint, compiled graph and validator, and those of
+        the schemas nesting it. Clearing every conversion also drops the
+        Pydantic models shared between conversions.\n
+        ---
+        ### Args
+        - `schema` (`Optional[Any]`): the schema whose conversions (and fingerprint) are dropped. Defaults to `None` (all conversions, resetting the statistics).\n
+        ---
+        ### Returns
+        - `int`: the number of dropped conversions.
+        """
+        if schema is None:
+            removed = len(_CONVERSION_CACHE)
+            _CONVERSION_CACHE.clear()
+            for current in {current for ir in _compiled_graphs() for current in ir.schemas}:
+                _forget_schema(current)
+            invalidate_ir()
+            clear_validators()
+            # Only loaded once a pydantic-based provider was used
+            pydantic_model = sys.modules.get("belso.providers.base.pydantic_model")
+            if pydantic_model is not None:
+                pydantic_model.clear_model_cache()
+            return removed
+        if isinstance(schema, SchemaMeta):
+            _forget_schema(schema)
+        invalidate_ir(schema)
+        clear_validators(schema)
+        return _CONVERSION_CACHE.invalidate(lambda key: key[0] is schema)
+
+    @staticmethod
+    def enable_disk_cache(directory: Optional[Union[str, Path]] = None) -> DiskCache:
+        """
+        Persist conversions on disk, so that other processes (and later runs)
+        converting the same schemas skip the conversion. Entries are keyed by
+        schema fingerprint, target format and belso version.\n
+        ---
+        ### Args
+        - `directory` (`Optional[Union[str, Path]]`): the cache directory. Defaults to `None` (`$XDG_CACHE_HOME/belso`).\n
+        ---
+        ### Returns
+        - `belso.utils.DiskCache`: the disk cache.
+        """
+        global _DISK_CACHE
+        _DISK_CACHE = DiskCache(directory)
+        _logger.info("Disk cache enabled in '%s'.", _DISK_CACHE.directory)
+        return _DISK_CACHE
+
+    @staticmethod
+    def disable_disk_cache() -> None:
+        """
+        Stop reading and writing the disk cache. Stored entries are kept.
+        """
+        global _DISK_CACHE
+        _DISK_CACHE = None
 
     @staticmethod
     def standardize(
@@ -121,27 +668,27 @@ class SchemaProcessor:
             if from_format is None:
                 _logger.debug("No source format specified, auto-detecting...")
                 from_format = detect_schema_format(schema)
-                _logger.info(f"Auto-detected source format: '{from_format}'.")
+                _logger.info("Auto-detected source format: '%s'.", from_format)
             else:
-                _logger.debug(f"Using provided source format: '{from_format}'.")
+                _logger.debug("Using provided source format: '%s'.", from_format)
 
             if from_format == FORMATS.BELSO:
                 _logger.debug("Schema is already in 'belso' format, no conversion needed.")
                 return schema
 
-            _logger.debug(f"Standardizing schema from '{from_format}' format to 'belso' format...")
+            _logger.debug("Standardizing schema from '%s' format to 'belso' format...", from_format)
             translator = _CONVERT_FROM_MAP.get(from_format)
             if not translator:
-                _logger.error(f"Unsupported source format: '{from_format}'")
+                _logger.error("Unsupported source format: '%s'", from_format)
                 raise ValueError(f"Conversion from {from_format} format is not supported.")
 
             result = translator(schema)
 
-            _logger.info(f"Successfully standardized schema to 'belso' format.")
+            _logger.info("Successfully standardized schema to 'belso' format.")
             return result
 
         except Exception as e:
-            _logger.error(f"Error during schema standardization: {e}")
+            _logger.error("Error during schema standardization: %s", e)
             _logger.debug("Standardization error details", exc_info=True)
             raise
 
@@ -165,7 +712,7 @@ class SchemaProcessor:
         if ext in _SAVE_TO_MAP:
             _SAVE_TO_MAP[ext](schema, path)
         else:
-            _logger.error(f"Unsupported format for saving: '{ext}'")
+            _logger.error("Unsupported format for saving: '%s'", ext)
 
 
     @staticmethod
@@ -185,9 +732,9 @@ class SchemaProcessor:
         """
         ext = Path(path).suffix.lower()
         if ext in _LOAD_FROM_MAP:
-            _logger.debug(f"Loading schema from '{ext}' format...")
+            _logger.debug("Loading schema from '%s' format...", ext)
         else:
-            _logger.error(f"Unsupported format for loading: '{ext}'")
+            _logger.error("Unsupported format for loading: '%s'", ext)
             raise ValueError(f"Loading from {ext} format is not supported.")
         if standardize:
             _logger.debug("Standardizing loaded schema to 'belso' format...")
@@ -209,7 +756,133 @@ class SchemaProcessor:
         ### Returns:
         - `Dict[str, Any]`: the validated data.
         """
-        return validate_schema(data, schema)
+        return compile_validator(schema)(data)
+
+    @staticmethod
+    def collect_errors(
+            data: Union[Dict[str, Any], str],
+            schema: Type[Schema]
+        ) -> List[ValidationIssue]:
+        """
+        Find every violation of the schema in the provided data in one pass,
+        instead of raising on the first one.\n
+        ---
+        ### Args
+        - `data` (`Union[Dict[str, Any], str]`): the data to validate (either a dict or JSON string).
+        - `schema` (`Type[belso.Schema]`): the schema to validate against.\n
+        ---
+        ### Returns:
+        - `List[belso.tools.ValidationIssue]`: the issues, each with its JSON pointer path. Empty if the data is valid.
+        """
+        return collect_errors(data, schema)
+
+    @staticmethod
+    def validate_many(
+            records: Iterable[Union[Dict[str, Any], str]],
+            schema: Type[Schema],
+            workers: Optional[int] = 1,
+            chunk_size: int = 10_000
+        ) -> BatchValidationResult:
+        """
+        Validate a batch of records, collecting per-record errors instead of
+        raising on the first invalid one. The schema is compiled once per batch.\n
+        ---
+        ### Args
+        - `records` (`Iterable[Union[Dict[str, Any], str]]`): the records to validate (dicts or JSON strings).
+        - `schema` (`Type[belso.Schema]`): the schema to validate against.
+        - `workers` (`Optional[int]`): the number of worker processes, `None` for one per CPU. Defaults to `1` (in-process).
+        - `chunk_size` (`int`): the number of records sent to a worker at once. Defaults to `10_000`.\n
+        ---
+        ### Returns:
+        - `belso.tools.BatchValidationResult`: the valid records, in input order, and the errors with their record index.
+        """
+        return validate_many(records, schema, workers=workers, chunk_size=chunk_size)
+
+    @staticmethod
+    def validate_stream(
+            source: Union[str, Path, IO],
+            schema: Type[Schema],
+            valid_sink: Optional[IO] = None,
+            invalid_sink: Optional[IO] = None
+        ) -> Iterator[Union[Dict[str, Any], RecordError]]:
+        """
+        Validate a JSON Lines (NDJSON) file or binary stream record by record,
+        with a memory footprint independent of the source size.\n
+        ---
+        ### Args
+        - `source` (`Union[str, Path, IO]`): a path, or a binary file-like object.
+        - `schema` (`Type[belso.Schema]`): the schema to validate against.
+        - `valid_sink` (`Optional[IO]`): a binary file-like object receiving the raw valid lines. Defaults to `None`.
+        - `invalid_sink` (`Optional[IO]`): a binary file-like object receiving the raw invalid lines. Defaults to `None`.\n
+        ---
+        ### Returns:
+        - `Iterator[Union[Dict[str, Any], belso.tools.RecordError]]`: each validated record, or an error carrying the 0-based line number.
+        """
+        return compile_validator(schema).validate_stream(source, valid_sink=valid_sink, invalid_sink=invalid_sink)
+
+    @staticmethod
+    def incremental_validator(schema: Type[Schema]) -> IncrementalValidator:
+        """
+        Create a validator for a JSON document received in chunks (e.g. a
+        streamed LLM response), reporting violations as soon as each key
+        and value is complete.\n
+        ---
+        ### Args
+        - `schema` (`Type[belso.Schema]`): the schema to validate against.\n
+        ---
+        ### Returns:
+        - `belso.tools.IncrementalValidator`: the validator; `feed()` it text chunks, then `close()` it to get the data.
+        """
+        return IncrementalValidator(schema)
+
+    @staticmethod
+    def stream_fields(
+            chunks: Iterable[str],
+            schema: Type[Schema]
+        ) -> Iterator[Tuple[str, Any]]:
+        """
+        Consume a stream of JSON text chunks (e.g. an LLM response) and yield
+        each field value and array item as soon as it is complete and valid.\n
+        ---
+        ### Args
+        - `chunks` (`Iterable[str]`): the text chunks.
+        - `schema` (`Type[belso.Schema]`): the schema to validate against.\n
+        ---
+        ### Returns:
+        - `Iterator[Tuple[str, Any]]`: `(path, value)` pairs, with JSON pointer paths. Raises on the first violation.
+        """
+        return iter_fields(chunks, schema)
+
+    @staticmethod
+    def astream_fields(
+            chunks: AsyncIterable[str],
+            schema: Type[Schema]
+        ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Asynchronous version of `SchemaProcessor.stream_fields`.\n
+        ---
+        ### Args
+        - `chunks` (`AsyncIterable[str]`): the text chunks.
+        - `schema` (`Type[belso.Schema]`): the schema to validate against.\n
+        ---
+        ### Returns:
+        - `AsyncIterator[Tuple[str, Any]]`: `(path, value)` pairs, with JSON pointer paths. Raises on the first violation.
+        """
+        return aiter_fields(chunks, schema)
+
+    @staticmethod
+    def compile_validator(schema: Type[Schema]) -> CompiledValidator:
+        """
+        Compile a schema into a reusable validator, specialized once for its
+        fields and cached on the schema.\n
+        ---
+        ### Args
+        - `schema` (`Type[belso.Schema]`): the schema to compile.\n
+        ---
+        ### Returns:
+        - `belso.tools.CompiledValidator`: a callable validating a dict or JSON string like `SchemaProcessor.validate`.
+        """
+        return compile_validator(schema)
 
     @staticmethod
     def display(
@@ -225,10 +898,10 @@ class SchemaProcessor:
         """
         if format_type is None:
             format_type = SchemaProcessor.detect_format(schema)
-            _logger.debug(f"Auto-detected schema format: '{format_type}'.")
+            _logger.debug("Auto-detected schema format: '%s'.", format_type)
 
         if format_type != FORMATS.BELSO:
-            _logger.debug(f"Converting from '{format_type}' to 'belso' format for printing...")
+            _logger.debug("Converting from '%s' to 'belso' format for printing...", format_type)
             belso_schema = SchemaProcessor.standardize(schema, format_type)
         else:
             belso_schema = schema
@@ -1,9 +1,8 @@
 # belso.core.schema
 
-from belso.utils import get_logger
-from typing import Any, List, Optional, Type, ClassVar, Tuple, final
-
-_logger = get_logger(__name__)
+from copy import copy
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Type, ClassVar, Tuple, Union, final
 
 @final
 class BaseField:
@@ -59,22 +58,308 @@ class BaseField:
         self.multiple_of = multiple_of
         self.format_ = format_
 
-class Schema:
+class FieldList(list):
+    """
+    The `fields` list of a schema. It counts its mutations, so that the
+    indexes built from it are rebuilt when it changes.
+    """
+    __slots__ = ("version",)
+
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+        self.version = 0
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        self.version += 1
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index: Any) -> None:
+        self.version += 1
+        super().__delitem__(index)
+
+    def __iadd__(self, values: Any) -> "FieldList":
+        self.version += 1
+        return super().__iadd__(values)
+
+    def __imul__(self, count: int) -> "FieldList":
+        self.version += 1
+        return super().__imul__(count)
+
+    def append(self, value: Any) -> None:
+        self.version += 1
+        super().append(value)
+
+    def extend(self, values: Any) -> None:
+        self.version += 1
+        super().extend(values)
+
+    def insert(self, index: int, value: Any) -> None:
+        self.version += 1
+        super().insert(index, value)
+
+    def remove(self, value: Any) -> None:
+        self.version += 1
+        super().remove(value)
+
+    def pop(self, index: int = -1) -> Any:
+        self.version += 1
+        return super().pop(index)
+
+    def clear(self) -> None:
+        self.version += 1
+        super().clear()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        self.version += 1
+        super().sort(*args, **kwargs)
+
+    def reverse(self) -> None:
+        self.version += 1
+        super().reverse()
+
+    def touch(self) -> None:
+        """
+        Count a change made to the fields themselves, e.g. an attribute set
+        on a field, so that everything built from the list is rebuilt.
+        """
+        self.version += 1
+
+def _fields_version(fields: List[BaseField]) -> int:
+    """
+    Get the mutation count of a `FieldList`, or the size of other sequences.
+    """
+    return fields.version if isinstance(fields, FieldList) else len(fields)
+
+class _FieldIndex:
+    """
+    Lookup structures of the fields of a schema, valid for one version of its `fields` list.
+    """
+    __slots__ = ("fields", "version", "by_name", "required", "required_set", "nested")
+
+    def __init__(self, fields: List[BaseField]) -> None:
+        self.fields = fields
+        self.version = _fields_version(fields)
+        by_name = {}
+        nested = {}
+        for field in fields:
+            # The first field of a name wins, as with a linear scan
+            by_name.setdefault(field.name, field)
+            for schema in (getattr(field, "schema", None), getattr(field, "items_schema", None)):
+                if schema is not None:
+                    nested[schema] = None
+        # The fields by name
+        self.by_name: Mapping[str, BaseField] = MappingProxyType(by_name)
+        # The names of the required fields, in declaration order
+        self.required: Tuple[str, ...] = tuple(field.name for field in fields if field.required)
+        self.required_set: FrozenSet[str] = frozenset(self.required)
+        # The distinct schemas nested by the fields, in declaration order
+        self.nested: Tuple[type, ...] = tuple(nested)
+
+class SchemaMeta(type):
+    """
+    Metaclass of schemas. It keeps their `fields` in a `FieldList` and
+    indexes them lazily, rebuilding the index when `fields` is reassigned
+    or mutated. Changes to the attributes of a field are not tracked: call
+    `fields.touch()` (or `SchemaProcessor.clear_cache`) after making some.
+    """
+    def __init__(cls, name: str, bases: Tuple[type, ...], namespace: dict) -> None:
+        super().__init__(name, bases, namespace)
+        if "fields" in namespace:
+            cls.fields = namespace["fields"]
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        if name == "fields" and type(value) is list:
+            value = FieldList(value)
+        super().__setattr__(name, value)
+
+    def _field_index(cls) -> _FieldIndex:
+        """
+        Get the index of the fields of the schema, building it if `fields` changed.
+        """
+        fields = cls.fields
+        index = cls.__dict__.get("_belso_index")
+        if index is None or index.fields is not fields or index.version != _fields_version(fields):
+            index = _FieldIndex(fields)
+            type.__setattr__(cls, "_belso_index", index)
+        return index
+
+    def _forget_index(cls) -> None:
+        """
+        Drop the index of the fields of the schema, rebuilt on next use.
+        """
+        if "_belso_index" in cls.__dict__:
+            type.__delattr__(cls, "_belso_index")
+
+class Schema(metaclass=SchemaMeta):
     """
     A base class for defining schemas.
     """
     fields: ClassVar[List[BaseField]] = []
 
     @classmethod
-    def get_required_fields(cls) -> List[str]:
+    def get_required_fields(cls) -> Tuple[str, ...]:
+        """
+        Get the names of all required fields in the schema, in declaration order.
+        The result is cached until `fields` is reassigned or mutated.
+        ---
+        ### Returns
+        - `Tuple[str, ...]`: the required field names.
+        """
+        return cls._field_index().required
+
+    @classmethod
+    def get_required_set(cls) -> FrozenSet[str]:
+        """
+        Get the names of all required fields in the schema, for membership tests.
+        ---
+        ### Returns
+        - `FrozenSet[str]`: the required field names.
+        """
+        return cls._field_index().required_set
+
+    @classmethod
+    def get_field_map(cls) -> Mapping[str, BaseField]:
+        """
+        Get the fields of the schema by name.
+        ---
+        ### Returns
+        - `Mapping[str, belso.core.BaseField]`: a read-only view of the fields by name.
+        """
+        return cls._field_index().by_name
+
+    @classmethod
+    def get_nested_schemas(cls) -> Tuple[Type["Schema"], ...]:
+        """
+        Get the schemas nested by the fields of the schema, directly or as array items.
+        ---
+        ### Returns
+        - `Tuple[Type[belso.Schema], ...]`: the distinct nested schemas, in declaration order.
+        """
+        return cls._field_index().nested
+
+    @classmethod
+    def from_spec(
+        cls,
+        spec: Union[Dict[str, Any], Iterable[Union[Dict[str, Any], Sequence[Any]]]],
+        name: str = "Schema"
+    ) -> Type["Schema"]:
+        """
+        Create a schema from a description of its fields, much faster than
+        declaring them one by one with `Field` when there are many. The rows
+        are validated column by column and the field class is chosen once
+        per distinct type; the fields are the same as `Field` would build.
+        ---
+        ### Args
+        - `spec` (`Union[Dict[str, Any], Iterable[Union[Dict[str, Any], Sequence[Any]]]]`): the fields, either as `{"name": ..., "fields": rows}` or as rows alone. Each row holds the arguments of `Field`, as a dict or as a sequence in `Field` order (`name`, `type`, `description`, `required`, ...).
+        - `name` (`str`): the name of the schema, unless given by `spec`. Defaults to `"Schema"`.
+        ---
+        ### Returns
+        - `Type[belso.Schema]`: a new subclass of this schema class.
+        ---
+        ### Raises
+        - `ValueError`: if a row has unknown or missing parameters, or if two fields share a name.
+        - `TypeError`: if a parameter has the wrong type.
+        """
+        from belso.core.field import _fields_from_rows
+        if isinstance(spec, dict):
+            name = spec.get("name", name)
+            spec = spec["fields"]
+        return type(name, (cls,), {"fields": _fields_from_rows(spec)})
+
+    @classmethod
+    def derive(
+        cls,
+        add: Optional[Iterable[Union[BaseField, Dict[str, Any], Sequence[Any]]]] = None,
+        override: Optional[Dict[str, Union[BaseField, Dict[str, Any]]]] = None,
+        omit: Optional[Iterable[str]] = None,
+        pick: Optional[Iterable[str]] = None,
+        name: Optional[str] = None
+    ) -> Type["Schema"]:
         """
-        Get the names of all required fields in the schema.
+        Create a variant of the schema. Unchanged fields, and the schemas they
+        nest, are shared with this schema rather than copied, so the caches
+        built for them (compiled graphs, validators, fingerprints, models)
+        are reused, and a variant costs in proportion to what it changes.
+        ---
+        ### Args
+        - `add` (`Optional[Iterable[Union[belso.core.BaseField, Dict[str, Any], Sequence[Any]]]]`): fields to append, as fields or as rows of `Field` arguments (see `from_spec`). Defaults to `None`.
+        - `override` (`Optional[Dict[str, Union[belso.core.BaseField, Dict[str, Any]]]]`): fields to replace, by name, with a field or with the attributes to change on a copy of the field, e.g. `{"age": {"required": False}}`. Defaults to `None`.
+        - `omit` (`Optional[Iterable[str]]`): names of the fields to leave out. Defaults to `None`.
+        - `pick` (`Optional[Iterable[str]]`): names of the only fields to keep, in the order of this schema. Defaults to `None` (all).
+        - `name` (`Optional[str]`): the name of the variant. Defaults to `None` (the name of this schema).
         ---
         ### Returns
-        - `List[str]`: a list of required field names.
+        - `Type[belso.Schema]`: the variant, a subclass of this schema.
+        ---
+        ### Raises
+        - `ValueError`: if a name is not a field of the schema, or if an added field has the name of another field.
         """
-        _logger.debug(f'Getting required fields for {cls.__name__}')
-        return [field.name for field in cls.fields if field.required]
+        by_name = cls._field_index().by_name
+        # Names may be given as one-shot iterables, checked then used
+        if pick is not None:
+            pick = [pick] if isinstance(pick, str) else list(pick)
+        if omit is not None:
+            omit = [omit] if isinstance(omit, str) else list(omit)
+        if override is not None:
+            override = dict(override)
+        for names in (pick, omit, override):
+            unknown = [field_name for field_name in names or () if field_name not in by_name]
+            if unknown:
+                raise ValueError(f"Schema '{cls.__name__}' has no field {', '.join(map(repr, unknown))}.")
+
+        fields = list(cls.fields)
+        if pick is not None:
+            kept = set(pick)
+            fields = [field for field in fields if field.name in kept]
+        if omit:
+            dropped = set(omit)
+            fields = [field for field in fields if field.name not in dropped]
+        if override:
+            for position, field in enumerate(fields):
+                change = override.get(field.name)
+                if change is None:
+                    continue
+                if isinstance(change, BaseField):
+                    fields[position] = change
+                    continue
+                unknown = [attr for attr in change if attr == "_key" or attr not in _slot_names(type(field))]
+                if unknown:
+                    raise ValueError(f"Field '{field.name}' has no attribute {', '.join(map(repr, unknown))}.")
+                if "_key" in _slot_names(type(field)):
+                    fields[position] = freeze_field(field, **change)
+                else:
+                    field = copy(field)
+                    for attr, value in change.items():
+                        setattr(field, attr, value)
+                    fields[position] = field
+        if add is not None:
+            from belso.core.field import _fields_from_rows
+            add = list(add)
+            rows = [row for row in add if not isinstance(row, BaseField)]
+            built = iter(_fields_from_rows(rows) if rows else ())
+            added = [row if isinstance(row, BaseField) else next(built) for row in add]
+            names = {field.name for field in fields}
+            for field in added:
+                if field.name in names:
+                    raise ValueError(f"Field '{field.name}' is already defined.")
+                names.add(field.name)
+            fields += added
+
+        return type(name or cls.__name__, (cls,), {"fields": fields})
+
+    @classmethod
+    def fingerprint(cls) -> str:
+        """
+        Get a content hash of the schema, equal for structurally identical schemas.
+        ---
+        ### Returns
+        - `str`: the SHA-256 hex digest, see `belso.core.spec.schema_fingerprint`.
+        ---
+        ### Raises
+        - `TypeError`: if a field value has no stable repr.
+        """
+        from belso.core.spec import schema_fingerprint
+        return schema_fingerprint(cls)
 
     @classmethod
     def get_field_by_name(
@@ -90,10 +375,194 @@ class Schema:
         ### Returns
         - `Optional[belso.core.BaseField]`: the field with the given name, or `None` if not found.
         """
-        _logger.debug(f'Getting field {name} for {cls.__name__}')
-        for field in cls.fields:
-            if field.name == name:
-                _logger.debug(f'Found field {name} for {cls.__name__}')
-                return field
-        _logger.debug(f'Field {name} not found for {cls.__name__}')
-        return None
+        return cls._field_index().by_name.get(name)
+
+# Frozen counterparts of the field classes, by field class
+_FROZEN_FIELD_CLASSES = {}
+
+def _slot_names(cls: type) -> Tuple[str, ...]:
+    """
+    Get the slots of a field class and of its bases.
+    """
+    names = []
+    for klass in reversed(cls.__mro__):
+        for name in klass.__dict__.get("__slots__", ()):
+            if name not in names:
+                names.append(name)
+    return tuple(names)
+
+def _hashable(value: Any) -> Any:
+    """
+    Get a hashable equivalent of a field attribute, turning lists into tuples,
+    sets into frozensets and dicts into frozensets of items.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_hashable(item) for item in value)
+    if isinstance(value, dict):
+        return frozenset((key, _hashable(item)) for key, item in value.items())
+    return value
+
+def _frozen_setattr(self, name: str, value: Any) -> None:
+    """
+    Reject attribute changes on frozen fields.
+    """
+    raise AttributeError(f"Field '{self.name}' is frozen, cannot set '{name}'.")
+
+def _frozen_delattr(self, name: str) -> None:
+    """
+    Reject attribute deletions on frozen fields.
+    """
+    raise AttributeError(f"Field '{self.name}' is frozen, cannot delete '{name}'.")
+
+def _frozen_eq(self, other: Any) -> bool:
+    """
+    Compare frozen fields by value.
+    """
+    if self is other:
+        return True
+    if type(other) is not type(self):
+        return NotImplemented
+    return self._key == other._key
+
+def _frozen_hash(self) -> int:
+    """
+    Hash frozen fields by value.
+    """
+    return hash(self._key)
+
+def _frozen_field_class(cls: type) -> type:
+    """
+    Get the frozen counterpart of a field class: a subclass whose instances
+    reject attribute changes and compare by value.
+    """
+    if "_key" in cls.__dict__.get("__slots__", ()):
+        return cls
+    frozen_class = _FROZEN_FIELD_CLASSES.get(cls)
+    if frozen_class is None:
+        frozen_class = _FROZEN_FIELD_CLASSES[cls] = type(f"Frozen{cls.__name__}", (cls,), {
+            "__slots__": ("_key",),
+            "__module__": cls.__module__,
+            "__setattr__": _frozen_setattr,
+            "__delattr__": _frozen_delattr,
+            "__eq__": _frozen_eq,
+            "__hash__": _frozen_hash,
+        })
+    return frozen_class
+
+def freeze_field(field: BaseField, **changes: Any) -> BaseField:
+    """
+    Get an immutable copy of a field, which compares and hashes by value.
+    Nested schemas compare as schemas do: by structure if frozen, otherwise
+    by identity.\n
+    ---
+    ### Args
+    - `field` (`belso.core.BaseField`): the field to freeze. Frozen fields are returned as is, unless changed.
+    - `**changes` (`Any`): attributes to replace in the copy.\n
+    ---
+    ### Returns
+    - `belso.core.BaseField`: the frozen field, an instance of a subclass of the class of `field`.
+    """
+    frozen_class = _frozen_field_class(type(field))
+    if frozen_class is type(field) and not changes:
+        return field
+
+    frozen = object.__new__(frozen_class)
+    values = []
+    for name in _slot_names(type(field)):
+        if name == "_key":
+            continue
+        value = changes[name] if name in changes else getattr(field, name)
+        object.__setattr__(frozen, name, value)
+        values.append(_hashable(value))
+    object.__setattr__(frozen, "_key", tuple(values))
+    return frozen
+
+class FrozenSchemaMeta(SchemaMeta):
+    """
+    Metaclass of frozen schemas. It stores their `fields` as a tuple of
+    frozen fields, rejects any later change to it, and makes schemas equal
+    when they have the same name and equal fields.
+    """
+    def __init__(cls, name: str, bases: Tuple[type, ...], namespace: dict) -> None:
+        super().__init__(name, bases, namespace)
+        type.__setattr__(cls, "_belso_sealed", True)
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        if name == "fields":
+            if cls.__dict__.get("_belso_sealed"):
+                raise AttributeError(f"Schema '{cls.__name__}' is frozen, cannot set 'fields'.")
+            value = tuple(freeze_field(field) for field in value)
+        type.__setattr__(cls, name, value)
+
+    def __delattr__(cls, name: str) -> None:
+        if name == "fields":
+            raise AttributeError(f"Schema '{cls.__name__}' is frozen, cannot delete 'fields'.")
+        type.__delattr__(cls, name)
+
+    def __eq__(cls, other: Any) -> bool:
+        if cls is other:
+            return True
+        if not isinstance(other, FrozenSchemaMeta):
+            return NotImplemented
+        return cls.__name__ == other.__name__ and cls.fields == other.fields
+
+    def __hash__(cls) -> int:
+        digest = cls.__dict__.get("_belso_hash")
+        if digest is None:
+            digest = hash((cls.__name__, cls.fields))
+            type.__setattr__(cls, "_belso_hash", digest)
+        return digest
+
+class FrozenSchema(Schema, metaclass=FrozenSchemaMeta):
+    """
+    A base class for immutable schemas. Fields are declared as for `Schema`,
+    but are stored as a tuple of frozen fields and cannot be changed after
+    the class is created. Frozen schemas with the same name and equal fields
+    are equal and hash alike, so they share cached conversions, and can be
+    shared between threads without copying.
+    """
+    fields: ClassVar[Tuple[BaseField, ...]] = ()
+
+    @classmethod
+    def from_schema(cls, schema: Type[Schema]) -> Type["FrozenSchema"]:
+        """
+        Get a frozen copy of a schema and of the schemas it nests.
+        ---
+        ### Args
+        - `schema` (`Type[belso.Schema]`): the schema to freeze. Frozen schemas nesting only frozen schemas are returned as is.
+        ---
+        ### Returns
+        - `Type[belso.core.FrozenSchema]`: the frozen schema.
+        ---
+        ### Raises
+        - `ValueError`: if the schema is recursive, since a frozen schema cannot nest itself.
+        """
+        from belso.core.ir import OBJECT, compile_ir
+        from belso.core.traversal import fold
+
+        ir = compile_ir(schema)
+        # The frozen schemas, by number, built once for schemas nested several times
+        frozen = {}
+
+        def build(index: int, nested: dict, path: list) -> Type[FrozenSchema]:
+            current = ir.schemas[index]
+            fields = []
+            changed = not isinstance(current, FrozenSchemaMeta)
+            for row in ir.rows(index):
+                field = ir.fields[row]
+                if ir.children[row] >= 0:
+                    if row not in nested:
+                        raise ValueError(f"Schema '{current.__name__}' is recursive and cannot be frozen.")
+                    child = nested[row]
+                    if child is not ir.types[row]:
+                        changed = True
+                        field = freeze_field(field, **{"schema" if ir.kinds[row] == OBJECT else "items_type": child})
+                fields.append(field)
+            if changed:
+                current = type(current.__name__, (FrozenSchema,), {"fields": fields, "__module__": current.__module__})
+            frozen[index] = current
+            return current
+
+        return fold(ir, build, memo=frozen)
@@ -0,0 +1,257 @@
+# belso.core.spec
+
+import re
+import json
+import hashlib
+from typing import Any, Dict, List, Tuple, Type
+
+from belso.core.schema import Schema, BaseField, _fields_version
+from belso.core.field import NestedField, ArrayField
+from belso.core.ir import ARRAY, OBJECT, OBJECT_ARRAY, SchemaIR, compile_ir
+from belso.core.traversal import fold
+
+# Field attributes carried by a spec, besides the name and the type
+_FIELD_ATTRS = (
+    "description",
+    "required",
+    "default",
+    "enum",
+    "range_",
+    "exclusive_range",
+    "length_range",
+    "items_range",
+    "properties_range",
+    "regex",
+    "multiple_of",
+    "format_",
+)
+
+def _field_spec(
+        field: BaseField,
+        index_of: Dict[type, int],
+        pending: List[Type[Schema]]
+    ) -> Dict[str, Any]:
+    """
+    Describe a single field, registering the schemas it refers to.\n
+    ---
+    ### Args
+    - `field` (`belso.core.BaseField`): the field to describe.
+    - `index_of` (`Dict[type, int]`): the index of every schema already registered.
+    - `pending` (`List[Type[belso.Schema]]`): the registered schemas, in index order.\n
+    ---
+    ### Returns
+    - `Dict[str, Any]`: the field description.
+    """
+    def ref(schema: Type[Schema]) -> int:
+        if schema not in index_of:
+            index_of[schema] = len(pending)
+            pending.append(schema)
+        return index_of[schema]
+
+    spec: Dict[str, Any] = {"name": field.name}
+    if isinstance(field, NestedField):
+        spec["schema"] = ref(field.schema)
+    elif isinstance(field, ArrayField):
+        if field.items_schema is not None:
+            spec["items_schema"] = ref(field.items_schema)
+        else:
+            spec["items_type"] = field.items_type
+    else:
+        spec["type"] = field.type_
+    for attr in _FIELD_ATTRS:
+        value = getattr(field, attr)
+        if value is not None:
+            spec[attr] = value
+    return spec
+
+def _describe(schema: Type[Schema]) -> Tuple[Dict[str, Any], Tuple[Type[Schema], ...]]:
+    """
+    Build the spec of a schema, along with every schema of its graph.\n
+    ---
+    ### Args
+    - `schema` (`Type[belso.Schema]`): the schema to describe.\n
+    ---
+    ### Returns
+    - `Tuple[Dict[str, Any], Tuple[Type[belso.Schema], ...]]`: the spec and the schemas, in index order.
+    """
+    ir = compile_ir(schema)
+    schemas = []
+    for index in range(len(ir.schemas)):
+        fields = []
+        for row in ir.rows(index):
+            spec: Dict[str, Any] = {"name": ir.names[row]}
+            kind = ir.kinds[row]
+            if kind == OBJECT:
+                spec["schema"] = ir.children[row]
+            elif kind == OBJECT_ARRAY:
+                spec["items_schema"] = ir.children[row]
+            elif kind == ARRAY:
+                spec["items_type"] = ir.types[row]
+            else:
+                spec["type"] = ir.types[row]
+            field = ir.fields[row]
+            if field.description is not None:
+                spec["description"] = field.description
+            spec["required"] = field.required
+            spec.update(ir.attrs[row])
+            fields.append(spec)
+        schemas.append({"name": ir.schemas[index].__name__, "fields": fields})
+    return {"root": 0, "schemas": schemas}, ir.schemas
+
+def schema_to_spec(schema: Type[Schema]) -> Dict[str, Any]:
+    """
+    Describe a schema as plain, picklable data. Every distinct schema of the
+    graph is listed once and referenced by index, so shared (and recursive)
+    nested schemas are preserved.\n
+    ---
+    ### Args
+    - `schema` (`Type[belso.Schema]`): the schema to describe.\n
+    ---
+    ### Returns
+    - `Dict[str, Any]`: the spec, as `{"root": 0, "schemas": [{"name": ..., "fields": [...]}, ...]}`.
+    """
+    return _describe(schema)[0]
+
+def schema_from_spec(spec: Dict[str, Any]) -> Type[Schema]:
+    """
+    Rebuild a schema from a spec produced by `schema_to_spec`.\n
+    ---
+    ### Args
+    - `spec` (`Dict[str, Any]`): the spec.\n
+    ---
+    ### Returns
+    - `Type[belso.Schema]`: the rebuilt schema.
+    """
+    # Create every class first, so references can point forward or back
+    classes = [type(entry["name"], (Schema,), {"fields": []}) for entry in spec["schemas"]]
+
+    for cls, entry in zip(classes, spec["schemas"]):
+        for field_spec in entry["fields"]:
+            attrs = {attr: field_spec[attr] for attr in _FIELD_ATTRS if attr in field_spec}
+            if "schema" in field_spec:
+                field = NestedField(name=field_spec["name"], schema=classes[field_spec["schema"]], **attrs)
+            elif "items_schema" in field_spec:
+                field = ArrayField(name=field_spec["name"], items_schema=classes[field_spec["items_schema"]], **attrs)
+            elif "items_type" in field_spec:
+                field = ArrayField(name=field_spec["name"], items_type=field_spec["items_type"], **attrs)
+            else:
+                field = BaseField(name=field_spec["name"], type_=field_spec["type"], **attrs)
+            cls.fields.append(field)
+
+    return classes[spec["root"]]
+
+# The default repr of objects and functions, which holds their address
+_ADDRESS_REPR = re.compile(r" at 0x[0-9A-Fa-f]+")
+
+def _canonical(value: Any) -> Any:
+    """
+    Encode a spec value that JSON cannot represent (types, mostly) as a stable
+    string. Values whose repr holds their address (e.g. functions and objects
+    without a `__repr__`) would hash differently in every process, and are
+    rejected.
+    """
+    if isinstance(value, type):
+        if value.__module__ == "builtins":
+            return value.__qualname__
+        return f"{value.__module__}.{value.__qualname__}"
+    text = repr(value)
+    if _ADDRESS_REPR.search(text):
+        raise TypeError(f"Cannot fingerprint {type(value).__name__} value {text}: its repr is not stable.")
+    return text
+
+def _graph_digests(ir: SchemaIR) -> Dict[int, str]:
+    """
+    Hash the schemas of a graph, each from its own description and the
+    digests of its nested schemas, so that shared and duplicated nested
+    schemas hash alike. A schema nested in itself is encoded by its distance
+    up the path from the root.\n
+    The digest of a non-recursive schema is remembered on its class, along
+    with the digests of its nested schemas: it is reused, without encoding
+    the schema again, while its `fields` list and nested digests are the
+    same. Schemas sharing nested schemas (e.g. made by `Schema.derive`)
+    thus only hash what differs.\n
+    ---
+    ### Args
+    - `ir` (`SchemaIR`): the compiled schema graph.\n
+    ---
+    ### Returns
+    - `Dict[int, str]`: the digest of the root schema and of every non-recursive schema, by number. These are their fingerprints.
+    """
+    memo: Dict[int, Tuple[str, bool]] = {}
+
+    def build(index: int, nested: Dict[int, Tuple[str, bool]], path: List[int]) -> Tuple[str, bool]:
+        schema = ir.schemas[index]
+        links = ir.links[index]
+        state = None
+        if len(nested) == len(links) and not any(nested[row][1] for row in links):
+            state = (schema.fields, _fields_version(schema.fields), tuple(nested[row][0] for row in links))
+            cached = schema.__dict__.get("_digest")
+            if cached is not None and cached[0] is state[0] and cached[1:3] == state[1:]:
+                memo[index] = (cached[3], False)
+                return memo[index]
+
+        recursive = False
+        fields = []
+        for row in ir.rows(index):
+            spec = _field_spec(ir.fields[row], {}, [])
+            for key in ("schema", "items_schema"):
+                if key in spec:
+                    if row in nested:
+                        spec[key], back = nested[row]
+                        recursive = recursive or back
+                    else:
+                        spec[key] = f"^{len(path) - path.index(ir.children[row])}"
+                        recursive = True
+            fields.append(spec)
+
+        encoded = json.dumps({"name": schema.__name__, "fields": fields}, sort_keys=True, separators=(",", ":"), default=_canonical)
+        digest = hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+        if not recursive:
+            memo[index] = (digest, False)
+            schema._digest = (*state, digest)
+        return digest, recursive
+
+    root, _ = fold(ir, build, memo=memo)
+    digests = {index: digest for index, (digest, _) in memo.items()}
+    digests[0] = root
+    return digests
+
+def schema_fingerprint(schema: Type[Schema]) -> str:
+    """
+    Get a content hash of a schema: its name, fields, types, constraints and
+    nested schemas. Structurally identical schemas have the same fingerprint,
+    even if they are distinct classes (e.g. rebuilt by `from_json`).\n
+    The fingerprint is cached on the class, and recomputed if the `fields`
+    list of a schema of its graph is replaced or mutated. Changes to the
+    attributes of a field are not tracked: call `forget_fingerprint` (or
+    `SchemaProcessor.clear_cache`) after making some.\n
+    ---
+    ### Args
+    - `schema` (`Type[belso.Schema]`): the schema.\n
+    ---
+    ### Returns
+    - `str`: the SHA-256 hex digest.\n
+    ---
+    ### Raises
+    - `TypeError`: if a default, enum or other field value has no stable repr (e.g. a function, or an object without a `__repr__`).
+    """
+    cached = schema.__dict__.get("_fingerprint")
+    if cached is not None and all(s.fields is fields and _fields_version(fields) == version for s, fields, version in cached[0]):
+        return cached[1]
+
+    ir = compile_ir(schema)
+    digest = _graph_digests(ir)[0]
+    schema._fingerprint = (tuple((s, s.fields, _fields_version(s.fields)) for s in ir.schemas), digest)
+    return digest
+
+def forget_fingerprint(schema: Type[Schema]) -> None:
+    """
+    Drop the fingerprint and the digest cached on a schema class, e.g. after
+    changing the attributes of its fields in place.\n
+    ---
+    ### Args
+    - `schema` (`Type[belso.Schema]`): the schema.
+    """
+    for name in ("_fingerprint", "_digest"):
+        if name in schema.__dict__:
+            type.__delattr__(schema, name)
@@ -0,0 +1,369 @@
+# belso.core.template
+
+from copy import copy
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Type
+
+from belso.utils import get_logger, LRUCache, CacheInfo
+from belso.core.schema import Schema, BaseField, _hashable
+from belso.core.spec import schema_to_spec, schema_from_spec
+from belso.core.ir import _OPTIONAL_ATTRS
+from belso.utils.mappings.extra_mappings import _CONVERT_TO_MAP
+
+_logger = get_logger(__name__)
+
+# Field attributes a template slot can set
+_SLOT_ATTRS = ("description",) + _OPTIONAL_ATTRS
+
+# Cache key of a parameter left to its default value
+_DEFAULT = object()
+
+# Path of a value in a converted schema: the keys and indexes leading to it
+_Path = Tuple[Any, ...]
+
+class _Plan:
+    """
+    A template compiled for one target format: the converted schema with the
+    default parameters, and where the fields of the slots appear in it.
+    """
+    __slots__ = ("payload", "locations", "paths", "renders")
+
+    def __init__(
+            self,
+            payload: Any,
+            locations: Optional[List[List[_Path]]],
+            paths: Optional[List[_Path]],
+            renders: Optional[List[Dict[str, Any]]]
+        ) -> None:
+        # The converted schema with the default parameters
+        self.payload = payload
+        # For each slotted field, the paths of its dicts in `payload`; `None`
+        # if the format cannot be patched
+        self.locations = locations
+        # For each slotted field, the path of its dict in a schema holding only it
+        self.paths = paths
+        # For each slotted field, its dict with the default parameters
+        self.renders = renders
+
+def _find(payload: Any, markers: Dict[str, int]) -> Dict[int, List[_Path]]:
+    """
+    Find the dicts of a converted schema holding one of the given marker strings.\n
+    ---
+    ### Args
+    - `payload` (`Any`): the converted schema.
+    - `markers` (`Dict[str, int]`): the markers, each with the number it stands for.\n
+    ---
+    ### Returns
+    - `Dict[int, List[_Path]]`: the paths of the dicts holding each marker, by number.
+    """
+    found: Dict[int, List[_Path]] = {}
+    stack = [(payload, ())]
+    while stack:
+        node, path = stack.pop()
+        if isinstance(node, dict):
+            items = node.items()
+        elif isinstance(node, list):
+            items = enumerate(node)
+        else:
+            continue
+        for key, value in items:
+            if isinstance(value, str):
+                number = markers.get(value)
+                if number is not None and isinstance(node, dict):
+                    found.setdefault(number, []).append(path)
+            else:
+                stack.append((value, path + (key,)))
+    return found
+
+def _follow(payload: Any, path: _Path) -> Any:
+    """
+    Get the value at a path of a converted schema.
+    """
+    for key in path:
+        payload = payload[key]
+    return payload
+
+def _patch(payload: Any, edits: List[Tuple[_Path, Dict[str, Any], List[str]]]) -> Any:
+    """
+    Apply edits to the dicts of a converted schema, copying only the dicts
+    and lists leading to them: the rest is shared with `payload`.\n
+    ---
+    ### Args
+    - `payload` (`Any`): the converted schema, left unchanged.
+    - `edits` (`List[Tuple[_Path, Dict[str, Any], List[str]]]`): the path of each dict to edit, the keys to set and the keys to remove.\n
+    ---
+    ### Returns
+    - `Any`: the edited copy.
+    """
+    # The copies made, by id of their original, and the ids of the copies
+    copies: Dict[int, Any] = {}
+    made = set()
+
+    def copied(node: Any) -> Any:
+        if id(node) in made:
+            return node
+        duplicate = copies.get(id(node))
+        if duplicate is None:
+            duplicate = copies[id(node)] = dict(node) if isinstance(node, dict) else list(node)
+            made.add(id(duplicate))
+        return duplicate
+
+    root = copied(payload)
+    for path, changes, removed in edits:
+        node = root
+        for key in path:
+            child = copied(node[key])
+            node[key] = child
+            node = child
+        node.update(changes)
+        for key in removed:
+            node.pop(key, None)
+    return root
+
+class SchemaTemplate:
+    """
+    A schema whose shape is fixed, but some field attributes of which (such
+    as an `enum` or an `items_range`) are parameters, set per instance.\n
+    Each target format is compiled once: the schema is converted with the
+    default parameters, and the places where the parametrized fields appear
+    are recorded. Converting with other parameters then only re-renders
+    those fields and patches their dicts into a copy of the compiled result,
+    sharing everything else. Formats whose output cannot be patched (OpenAI
+    and LangChain models, Google schemas, YAML and XML text) are converted
+    from an instantiated schema instead. Results are cached by parameter
+    values, and should be treated as read-only.
+    """
+    __slots__ = ("name", "slots", "_spec", "_base", "_targets", "_fields", "_plans", "_cache")
+
+    def __init__(
+            self,
+            schema: Type[Schema],
+            slots: Dict[str, str],
+            maxsize: int = 256
+        ) -> None:
+        """
+        Create a template from a schema and its parameter slots.\n
+        ---
+        ### Args
+        - `schema` (`Type[belso.Schema]`): the schema. Later changes to it do not affect the template.
+        - `slots` (`Dict[str, str]`): the attribute set by each parameter, by parameter name, as a dotted path of field names ending with the attribute, e.g. `{"categories": "category.enum"}` or `{"max_tags": "tags.items_range"}`.
+        - `maxsize` (`int`): the number of cached instances. Defaults to `256`.\n
+        ---
+        ### Raises
+        - `ValueError`: if a slot names an unknown field or an attribute that cannot be set.
+        """
+        self.name = schema.__name__
+        self.slots = dict(slots)
+        # Snapshot of the schema graph, and the schema rebuilt from it
+        self._spec = schema_to_spec(schema)
+        self._base = schema_from_spec(self._spec)
+        # For each slot: the number of its field, in `_fields`, and the attribute
+        self._targets: Dict[str, Tuple[int, str]] = {}
+        # The slotted fields: the position of their schema and of the field in
+        # the spec, the field, and the schema holding it
+        self._fields: List[Tuple[int, int, BaseField, Type[Schema]]] = []
+        self._plans: Dict[Hashable, _Plan] = {}
+        self._cache = LRUCache(maxsize=maxsize)
+
+        positions: Dict[Tuple[int, int], int] = {}
+        for slot, target in self.slots.items():
+            *names, attr = target.split(".")
+            if not names or attr not in _SLOT_ATTRS:
+                raise ValueError(f"Slot '{slot}' must be a field path ending with one of: {', '.join(_SLOT_ATTRS)}.")
+            index, owner = self._spec["root"], self._base
+            for depth, name in enumerate(names):
+                entries = self._spec["schemas"][index]["fields"]
+                position = next((i for i, entry in enumerate(entries) if entry["name"] == name), None)
+                if position is None:
+                    raise ValueError(f"Slot '{slot}': schema '{owner.__name__}' has no field '{name}'.")
+                field = owner.get_field_by_name(name)
+                if depth == len(names) - 1:
+                    break
+                nested = entries[position].get("schema", entries[position].get("items_schema"))
+                if nested is None:
+                    raise ValueError(f"Slot '{slot}': field '{name}' does not nest a schema.")
+                index, owner = nested, getattr(field, "schema", None) or field.items_schema
+            number = positions.get((index, position))
+            if number is None:
+                number = positions[(index, position)] = len(self._fields)
+                self._fields.append((index, position, field, owner))
+            self._targets[slot] = (number, attr)
+
+    def _key(self, params: Dict[str, Any]) -> Tuple[Any, ...]:
+        """
+        Check parameters and build their cache key, in slot order.
+        """
+        unknown = set(params).difference(self._targets)
+        if unknown:
+            raise TypeError(f"Unknown template parameters: {', '.join(sorted(unknown))}.")
+        return tuple(_hashable(params[slot]) if slot in params else _DEFAULT for slot in self._targets)
+
+    def _changes(self, params: Dict[str, Any]) -> Dict[int, Dict[str, Any]]:
+        """
+        Group parameters by slotted field: the attributes to set on each.
+        """
+        changes: Dict[int, Dict[str, Any]] = {}
+        for slot, value in params.items():
+            number, attr = self._targets[slot]
+            changes.setdefault(number, {})[attr] = value
+        return changes
+
+    def schema(self, **params: Any) -> Type[Schema]:
+        """
+        Instantiate the template as a schema.\n
+        ---
+        ### Args
+        - `**params` (`Any`): the parameter values, by slot name. Missing ones keep the value of the template schema.\n
+        ---
+        ### Returns
+        - `Type[belso.Schema]`: the schema.
+        """
+        key = ("schema", self._key(params))
+        schema = self._cache.get(key)
+        if schema is not None:
+            return schema
+        if not params:
+            schema = self._base
+        else:
+            schemas = list(self._spec["schemas"])
+            for number, attrs in self._changes(params).items():
+                index, position = self._fields[number][:2]
+                entry = schemas[index] = dict(schemas[index])
+                entry["fields"] = fields = list(entry["fields"])
+                fields[position] = field = dict(fields[position])
+                for attr, value in attrs.items():
+                    if value is None:
+                        field.pop(attr, None)
+                    else:
+                        field[attr] = value
+            schema = schema_from_spec({"root": self._spec["root"], "schemas": schemas})
+        self._cache.put(key, schema)
+        return schema
+
+    def _render(
+            self,
+            number: int,
+            attrs: Dict[str, Any],
+            translator: Any,
+            options: Dict[str, Any]
+        ) -> Any:
+        """
+        Convert a schema holding only a slotted field, with some of its attributes replaced.\n
+        ---
+        ### Args
+        - `number` (`int`): the number of the slotted field.
+        - `attrs` (`Dict[str, Any]`): the attributes to replace.
+        - `translator` (`Any`): the converter of the target format.
+        - `options` (`Dict[str, Any]`): the options of the target format.\n
+        ---
+        ### Returns
+        - `Any`: the converted schema.
+        """
+        _, _, field, owner = self._fields[number]
+        field = copy(field)
+        for attr, value in attrs.items():
+            setattr(field, attr, value)
+        return translator(type(owner.__name__, (Schema,), {"fields": [field]}), **options)
+
+    def _compile(
+            self,
+            to: str,
+            translator: Any,
+            options: Dict[str, Any]
+        ) -> _Plan:
+        """
+        Compile the template for a target format.\n
+        ---
+        ### Args
+        - `to` (`str`): the target format.
+        - `translator` (`Any`): the converter of the target format.
+        - `options` (`Dict[str, Any]`): the options of the target format.\n
+        ---
+        ### Returns
+        - `_Plan`: the compiled template.
+        """
+        _logger.debug("Compiling template '%s' for '%s' format...", self.name, to)
+        payload = translator(self._base, **options)
+        if not isinstance(payload, dict):
+            return _Plan(payload, None, None, None)
+
+        # Find the slotted fields by giving them unique descriptions
+        markers = {f"\0belso-slot-{number}\0": number for number in range(len(self._fields))}
+        schemas = list(self._spec["schemas"])
+        for marker, number in markers.items():
+            index, position = self._fields[number][:2]
+            entry = schemas[index] = dict(schemas[index])
+            entry["fields"] = fields = list(entry["fields"])
+            fields[position] = dict(fields[position], description=marker)
+        marked = translator(schema_from_spec({"root": self._spec["root"], "schemas": schemas}), **options)
+        locations = _find(marked, markers)
+
+        paths = []
+        renders = []
+        for marker, number in markers.items():
+            found = _find(self._render(number, {"description": marker}, translator, options), markers).get(number)
+            if not found or number not in locations:
+                _logger.debug("Field of slot %d not found in '%s' format, converting instances in full.", number, to)
+                return _Plan(payload, None, None, None)
+            paths.append(found[0])
+            renders.append(_follow(self._render(number, {}, translator, options), found[0]))
+        return _Plan(payload, [locations[number] for number in range(len(self._fields))], paths, renders)
+
+    def convert(
+            self,
+            to: str,
+            options: Optional[Dict[str, Any]] = None,
+            **params: Any
+        ) -> Any:
+        """
+        Instantiate the template and convert it to a target format.\n
+        ---
+        ### Args
+        - `to` (`str`): the target format. Can be a string or a `belso.utils.FORMATS` attribute.
+        - `options` (`Optional[Dict[str, Any]]`): options of the target format, e.g. `{"use_refs": True}`. Defaults to `None`.
+        - `**params` (`Any`): the parameter values, by slot name. Missing ones keep the value of the template schema.\n
+        ---
+        ### Returns
+        - `Any`: the converted schema, shared by later calls with the same parameters.
+        """
+        options = options or {}
+        key = (to, *sorted(options.items()), self._key(params))
+        result = self._cache.get(key)
+        if result is not None:
+            return result
+
+        try:
+            translator = _CONVERT_TO_MAP[to]
+        except KeyError:
+            _logger.error("Unsupported target format: '%s'.", to)
+            raise ValueError(f"Provider {to} not supported.")
+
+        plan_key = (to, *sorted(options.items()))
+        plan = self._plans.get(plan_key)
+        if plan is None:
+            plan = self._plans[plan_key] = self._compile(to, translator, options)
+
+        if not params:
+            result = plan.payload
+        elif plan.locations is None:
+            result = translator(self.schema(**params), **options)
+        else:
+            edits = []
+            for number, attrs in self._changes(params).items():
+                base = plan.renders[number]
+                render = _follow(self._render(number, attrs, translator, options), plan.paths[number])
+                changes = {name: value for name, value in render.items() if name not in base or base[name] != value}
+                removed = [name for name in base if name not in render]
+                if changes or removed:
+                    edits.extend((path, changes, removed) for path in plan.locations[number])
+            result = _patch(plan.payload, edits) if edits else plan.payload
+        self._cache.put(key, result)
+        return result
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Get the statistics of the cache of instances.\n
+        ---
+        ### Returns
+        - `belso.utils.CacheInfo`: the hits, misses, maximum and current size.
+        """
+        return self._cache.info()
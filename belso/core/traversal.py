@@ -0,0 +1,88 @@
+# belso.core.traversal
+
+from typing import Any, Callable, Dict, List, Optional
+
+from belso.core.ir import SchemaIR
+
+def fold(
+        ir: SchemaIR,
+        build: Callable[[int, Dict[int, Any], List[int]], Any],
+        index: int = 0,
+        enter: Optional[Callable[[int], Any]] = None,
+        memo: Optional[Dict[int, Any]] = None
+    ) -> Any:
+    """
+    Fold a schema graph bottom-up with an explicit stack, so that its depth
+    is limited by memory rather than by the interpreter's recursion limit.\n
+    Each schema is built once its nested schemas are, by
+    `build(index, nested, path)`: `nested` maps the rows of the schema that
+    nest another one to the result built for it, and `path` holds the
+    numbers of the schemas being built, outermost first, ending with
+    `index`. A nested schema already on the path (a recursive schema) is not
+    entered again: its row is left out of `nested`, for `build` to handle.\n
+    Nested schemas are built once per occurrence, unless their result is
+    found in `memo`, which `enter` and `build` may fill to share results.\n
+    ---
+    ### Args
+    - `ir` (`SchemaIR`): the compiled schema graph.
+    - `build` (`Callable[[int, Dict[int, Any], List[int]], Any]`): builds the result of a schema.
+    - `index` (`int`): the number of the schema to start from. Defaults to `0`, the root.
+    - `enter` (`Optional[Callable[[int], Any]]`): called with the number of each schema before its nested schemas are built. Defaults to `None`.
+    - `memo` (`Optional[Dict[int, Any]]`): the results already built, by schema number. Defaults to `None`.\n
+    ---
+    ### Returns
+    - `Any`: the result built for the schema `index`.
+    """
+    if memo is None:
+        memo = {}
+    elif index in memo:
+        return memo[index]
+    if enter is not None:
+        enter(index)
+        if index in memo:
+            return memo[index]
+
+    links, children = ir.links, ir.children
+    path = [index]
+    on_path = {index}
+    # One frame per schema being built: its number, the row of the parent
+    # field, the position in its links and the results of its nested schemas
+    stack = [[index, -1, 0, {}]]
+    while True:
+        frame = stack[-1]
+        current = frame[0]
+        rows = links[current]
+        position = frame[2]
+        child = -1
+        while position < len(rows):
+            row = rows[position]
+            position += 1
+            child = children[row]
+            if child in on_path:
+                child = -1
+            elif child in memo:
+                frame[3][row] = memo[child]
+                child = -1
+            else:
+                if enter is not None:
+                    enter(child)
+                    if child in memo:
+                        frame[3][row] = memo[child]
+                        child = -1
+                        continue
+                break
+        frame[2] = position
+
+        if child >= 0:
+            path.append(child)
+            on_path.add(child)
+            stack.append([child, row, 0, {}])
+            continue
+
+        result = build(current, frame[3], path)
+        stack.pop()
+        path.pop()
+        on_path.discard(current)
+        if not stack:
+            return result
+        stack[-1][3][frame[1]] = result
@@ -1,12 +1,37 @@
 # belso.providers.__init__
 
-from belso.providers.google import to_google, from_google
-from belso.providers.openai import to_openai, from_openai
-from belso.providers.ollama import to_ollama, from_ollama
-from belso.providers.mistral import to_mistral, from_mistral
-from belso.providers.anthropic import to_anthropic, from_anthropic
-from belso.providers.langchain import to_langchain, from_langchain
-from belso.providers.huggingface import to_huggingface, from_huggingface
+from importlib import import_module
+
+# Providers are imported on first access, so `import belso.providers` does not
+# pull in pydantic or the Google protobuf stack until they are actually used.
+_LAZY_EXPORTS = {
+    "to_google": "belso.providers.google",
+    "from_google": "belso.providers.google",
+    "to_openai": "belso.providers.openai",
+    "from_openai": "belso.providers.openai",
+    "to_ollama": "belso.providers.ollama",
+    "from_ollama": "belso.providers.ollama",
+    "to_mistral": "belso.providers.mistral",
+    "from_mistral": "belso.providers.mistral",
+    "to_anthropic": "belso.providers.anthropic",
+    "from_anthropic": "belso.providers.anthropic",
+    "to_langchain": "belso.providers.langchain",
+    "from_langchain": "belso.providers.langchain",
+    "to_huggingface": "belso.providers.huggingface",
+    "from_huggingface": "belso.providers.huggingface"
+}
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
 
 __all__ = [
     "to_google",
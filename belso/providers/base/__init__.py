@@ -1,7 +1,25 @@
 # belso.providers.base.__init__
 
-from belso.providers.base.json_schema import json_provider
-from belso.providers.base.pydantic_model import pydantic_provider
+from importlib import import_module
+
+# `pydantic_provider` lives next to pydantic itself, so it is only imported when
+# a pydantic-based provider (OpenAI, LangChain) is first used.
+_LAZY_EXPORTS = {
+    "json_provider": "belso.providers.base.json_schema",
+    "pydantic_provider": "belso.providers.base.pydantic_model"
+}
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
 
 __all__ = [
     "json_provider",
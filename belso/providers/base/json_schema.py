@@ -1,9 +1,12 @@
 # belso.providers.base.json_schema
 
-from typing import Any, Dict, Type, Callable, Optional
+import warnings
+from typing import Any, Dict, List, Tuple, Type, Callable, Optional
 
 from belso.utils.logging import get_logger
 from belso.core.schema import Schema, BaseField
+from belso.core.ir import OBJECT, OBJECT_ARRAY, PRIMITIVE, SchemaIR, compile_ir
+from belso.core.traversal import fold
 from belso.utils.mappings.field_mappings import _JSON_FIELD_MAP
 from belso.core.field import NestedField, ArrayField
 from belso.utils.helpers import (
@@ -15,77 +18,91 @@ from belso.utils.helpers import (
 _logger = get_logger(__name__)
 
 def convert_field_to_property(
-        field: BaseField
+        ir: SchemaIR,
+        row: int
     ) -> Dict[str, Any]:
     """
     Converts a base field into a JSON schema property using a specific mapping.\n
     ---
     ### Args
-    - `field` (`BaseField`): the field to convert.\n
+    - `ir` (`SchemaIR`): the compiled schema graph.
+    - `row` (`int`): the row of the field.\n
     ---
     ### Returns
     - `dict`: the property dictionary.
     """
     base_property = {
-        "type": map_python_to_json_type(getattr(field, "type_", str)),
-        "description": field.description
+        "type": map_python_to_json_type(ir.types[row]),
+        "description": ir.fields[row].description
     }
-    for attr, mappings in _JSON_FIELD_MAP.items():
-        value = getattr(field, attr, None)
-        if value is not None:
-            if isinstance(mappings, list):
-                for key, func in mappings:
-                    base_property[key] = func(value)
-            else:
-                key, func = mappings
-                base_property[key] = func(value) if func else value
+    attrs = ir.attrs[row]
+    if attrs:
+        for attr, mappings in _JSON_FIELD_MAP.items():
+            value = attrs.get(attr)
+            if value is not None:
+                if isinstance(mappings, list):
+                    for key, func in mappings:
+                        base_property[key] = func(value)
+                else:
+                    key, func = mappings
+                    base_property[key] = func(value) if func else value
     return base_property
 
 def convert_nested_field(
-        field: NestedField,
-        to_func: Callable[[Type[Schema]], Dict[str, Any]]
+        ir: SchemaIR,
+        row: int,
+        to_func: Callable[[int], Dict[str, Any]]
     ) -> Dict[str, Any]:
     """
     Converts a nested field into a JSON schema property using a specific mapping.\n
     ---
     ### Args
-    - `field` (`NestedField`): the field to convert.
-    - `to_func` (`Callable[[Type[Schema]], Dict[str, Any]]`): the function to convert the nested schema.\n
+    - `ir` (`SchemaIR`): the compiled schema graph.
+    - `row` (`int`): the row of the field.
+    - `to_func` (`Callable[[int], Dict[str, Any]]`): the function to get the converted nested schema of a row.\n
     ---
     ### Returns
     - `dict`: the property dictionary.
     """
-    nested_schema = to_func(field.schema)
+    nested_schema = to_func(row)
+    if "$ref" in nested_schema:
+        return {"$ref": nested_schema["$ref"], "description": ir.fields[row].description}
     return {
         "type": "object",
-        "description": field.description,
-        "properties": nested_schema.get("properties", {}),
-        "required": nested_schema.get("required", [])
+        "description": ir.fields[row].description,
+        "properties": nested_schema["properties"],
+        "required": nested_schema["required"]
     }
 
 def convert_array_field(
-        field: ArrayField,
-        to_func: Callable[[Type[Schema]], Dict[str, Any]]
+        ir: SchemaIR,
+        row: int,
+        to_func: Callable[[int], Dict[str, Any]]
     ) -> Dict[str, Any]:
     """
     Converts an array field into a JSON schema property using a specific mapping.\n
     ---
     ### Args
-    - `field` (`ArrayField`): the field to convert.
-    - `to_func` (`Callable[[Type[Schema]], Dict[str, Any]]`): the function to convert the nested schema.\n
+    - `ir` (`SchemaIR`): the compiled schema graph.
+    - `row` (`int`): the row of the field.
+    - `to_func` (`Callable[[int], Dict[str, Any]]`): the function to get the converted nested schema of a row.\n
     ---
     ### Returns
     - `dict`: the property dictionary.
     """
-    if hasattr(field, 'items_schema') and field.items_schema:
-        items_schema_dict = to_func(field.items_schema)
-        items_schema = {
-            "type": "object",
-            "properties": items_schema_dict.get("properties", {}),
-            "required": items_schema_dict.get("required", [])
-        }
+    field = ir.fields[row]
+    if ir.kinds[row] == OBJECT_ARRAY:
+        items_schema_dict = to_func(row)
+        if "$ref" in items_schema_dict:
+            items_schema = {"$ref": items_schema_dict["$ref"]}
+        else:
+            items_schema = {
+                "type": "object",
+                "properties": items_schema_dict["properties"],
+                "required": items_schema_dict["required"]
+            }
     else:
-        items_schema = {"type": map_python_to_json_type(field.items_type)}
+        items_schema = {"type": map_python_to_json_type(ir.types[row])}
 
     result = {
         "type": "array",
@@ -98,37 +115,102 @@ def convert_array_field(
 
     return result
 
+def _object_schema(
+        ir: SchemaIR,
+        index: int,
+        to_func: Callable[[int], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+    """
+    Converts the fields of a schema into a JSON schema object.\n
+    ---
+    ### Args
+    - `ir` (`SchemaIR`): the compiled schema graph.
+    - `index` (`int`): the number of the schema.
+    - `to_func` (`Callable[[int], Dict[str, Any]]`): the function to get the converted nested schema of a row.\n
+    ---
+    ### Returns
+    - `dict`: the JSON schema object.
+    """
+    names, kinds = ir.names, ir.kinds
+    properties = {}
+    for row in ir.rows(index):
+        kind = kinds[row]
+        if kind == PRIMITIVE:
+            properties[names[row]] = convert_field_to_property(ir, row)
+        elif kind == OBJECT:
+            properties[names[row]] = convert_nested_field(ir, row, to_func)
+        else:
+            properties[names[row]] = convert_array_field(ir, row, to_func)
+
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(ir.required[index])
+    }
+
 def to_json_schema(
         schema: Type[Schema],
-        extra_metadata: Optional[Dict[str, Any]] = None
+        extra_metadata: Optional[Dict[str, Any]] = None,
+        use_refs: bool = False
     ) -> Dict[str, Any]:
     """
-    Converts a belso schema into a generic JSON schema format.\n
+    Converts a belso schema into a generic JSON schema format.
+    Nested schemas are inlined at every use site, unless `use_refs` is set:
+    then each distinct nested schema is emitted once under `$defs` and
+    referenced with `$ref`, keeping the output linear in the number of
+    distinct schemas. Recursive schemas are always referenced (`#` being
+    the root schema).\n
     ---
     ### Args
     - `schema` (`Type[Schema]`): the schema to convert.
-    - `extra_metadata` (`dict`, optional): extra metadata to add to the schema.\n
+    - `extra_metadata` (`dict`, optional): extra metadata to add to the schema.
+    - `use_refs` (`bool`, optional): whether to reference nested schemas from `$defs`. Defaults to `False`.\n
     ---
     ### Returns
     - `dict`: the JSON schema.
     """
     try:
-        _logger.debug(f"Translating schema '{schema.__name__}' to generic JSON schema format...")
-
-        properties = {}
-        for field in schema.fields:
-            if isinstance(field, NestedField):
-                properties[field.name] = convert_nested_field(field, lambda s: to_json_schema(s, _JSON_FIELD_MAP))
-            elif isinstance(field, ArrayField):
-                properties[field.name] = convert_array_field(field, lambda s: to_json_schema(s, _JSON_FIELD_MAP))
-            else:
-                properties[field.name] = convert_field_to_property(field)
+        _logger.debug("Translating schema '%s' to generic JSON schema format...", schema.__name__)
+
+        ir = compile_ir(schema)
+        children = ir.children
+        defs: Dict[str, Any] = {}
+        names: Dict[int, str] = {}
+        # The schemas converted for `$defs`, by number; the root is `#`
+        defined: Dict[int, Any] = {0: None}
+
+        def ref(index: int) -> Dict[str, Any]:
+            if index == 0:
+                return {"$ref": "#"}
+            if index not in names:
+                fold(ir, define, index, name, defined)
+            return {"$ref": f"#/$defs/{names[index]}"}
+
+        def name(index: int) -> None:
+            # Distinct schemas sharing a class name get numbered
+            base = ir.schemas[index].__name__
+            name = base
+            count = 1
+            while name in defs:
+                count += 1
+                name = f"{base}{count}"
+            names[index] = name
+            defs[name] = None
+
+        def define(index: int, nested: Dict[int, Any], path: List[int]) -> Dict[str, Any]:
+            defs[names[index]] = defined[index] = _object_schema(ir, index, lambda row: ref(children[row]))
+            return defined[index]
 
-        schema_dict = {
-            "type": "object",
-            "properties": properties,
-            "required": schema.get_required_fields()
-        }
+        def inline(index: int, nested: Dict[int, Any], path: List[int]) -> Dict[str, Any]:
+            # Recursive schemas cannot be inlined
+            return _object_schema(ir, index, lambda row: nested[row] if row in nested else ref(children[row]))
+
+        if use_refs:
+            schema_dict = _object_schema(ir, 0, lambda row: ref(children[row]))
+        else:
+            schema_dict = fold(ir, inline)
+        if defs:
+            schema_dict["$defs"] = defs
 
         if extra_metadata:
             schema_dict.update(extra_metadata)
@@ -136,59 +218,161 @@ def to_json_schema(
         return schema_dict
 
     except Exception as e:
-        _logger.error(f"Error converting to JSON schema: {e}")
+        _logger.error("Error converting to JSON schema: %s", e)
         return {}
 
+class _RefResolver:
+    """
+    Tracks the object schemas of a JSON schema document while they are
+    converted to belso schemas, from a work list rather than recursively.
+    Each schema is created empty and queued, so `$ref`s (recursive ones
+    included) resolve to it before its fields are filled in, and each
+    definition is converted once however many times it is referenced.
+    """
+    __slots__ = ("root", "defs", "schemas", "pending")
+
+    def __init__(self, root: Dict[str, Any]) -> None:
+        self.root = root
+        self.defs: Dict[str, Any] = {**root.get("definitions", {}), **root.get("$defs", {})}
+        # The belso schema of each object schema, by identity
+        self.schemas: Dict[int, Type[Schema]] = {}
+        # The object schemas whose fields are still to convert
+        self.pending: List[Tuple[Dict[str, Any], Type[Schema]]] = []
+
+    def create(
+            self,
+            definition: Dict[str, Any],
+            schema_name: str
+        ) -> Type[Schema]:
+        """
+        Create the belso schema of an object schema, queuing its fields for conversion.\n
+        ---
+        ### Args
+        - `definition` (`Dict[str, Any]`): the JSON schema.
+        - `schema_name` (`str`): the name of the schema.\n
+        ---
+        ### Returns
+        - `Type[Schema]`: the belso schema, not filled in yet.
+        """
+        schema = type(f"{schema_name}Schema", (Schema,), {"fields": []})
+        self.schemas[id(definition)] = schema
+        self.pending.append((definition, schema))
+        return schema
+
+    def resolve(self, ref: str) -> Type[Schema]:
+        """
+        Get the belso schema of a local reference (`#`, `#/$defs/Name` or `#/definitions/Name`).\n
+        ---
+        ### Args
+        - `ref` (`str`): the reference.\n
+        ---
+        ### Returns
+        - `Type[Schema]`: the belso schema.
+        """
+        if ref == "#":
+            name, definition = "Root", self.root
+        else:
+            name = ref.rsplit("/", 1)[-1]
+            definition = self.defs.get(name)
+            if definition is None:
+                raise ValueError(f"Unresolvable reference '{ref}'.")
+        schema = self.schemas.get(id(definition))
+        if schema is None:
+            schema = self.create(definition, name)
+        return schema
+
+def _convert_properties(
+        definition: Dict[str, Any],
+        ConvertedSchema: Type[Schema],
+        reverse_type_func: Callable[[str], Any],
+        refs: _RefResolver
+    ) -> None:
+    """
+    Converts the properties of an object schema into the fields of its belso schema.
+    Nested object schemas are created and queued for conversion.\n
+    ---
+    ### Args
+    - `definition` (`dict`): the object schema.
+    - `ConvertedSchema` (`Type[Schema]`): the belso schema to fill in.
+    - `reverse_type_func` (`Callable[[str], Any]`): the function to reverse the type mapping.
+    - `refs` (`_RefResolver`): the schemas of the document.
+    """
+    properties = definition.get("properties", {})
+    required_fields = set(definition.get("required", []))
+
+    for name, prop in properties.items():
+        prop_type = prop.get("type", "string")
+        description = prop.get("description", "")
+        required = name in required_fields
+        default = prop.get("default") if not required else None
+
+        if "$ref" in prop:
+            nested = refs.resolve(prop["$ref"])
+            ConvertedSchema.fields.append(NestedField(name=name, schema=nested, description=description, required=required, default=default))
+        elif prop_type == "object" and "properties" in prop:
+            nested = refs.create(prop, name)
+            ConvertedSchema.fields.append(NestedField(name=name, schema=nested, description=description, required=required, default=default))
+        elif prop_type == "array" and "items" in prop:
+            items = prop["items"]
+            if "$ref" in items:
+                item_schema = refs.resolve(items["$ref"])
+                ConvertedSchema.fields.append(ArrayField(name=name, items_type=item_schema, description=description, required=required, default=default))
+            elif items.get("type") == "object" and "properties" in items:
+                item_schema = refs.create(items, name)
+                ConvertedSchema.fields.append(ArrayField(name=name, items_type=item_schema, description=description, required=required, default=default))
+            else:
+                item_type = reverse_type_func(items.get("type", "string"))
+                ConvertedSchema.fields.append(ArrayField(name=name, items_type=item_type, description=description, required=required, default=default))
+        else:
+            ConvertedSchema.fields.append(BaseField(name=name, type_=reverse_type_func(prop_type), description=description, required=required, default=default))
+
 def from_json_schema(
         schema: Dict[str, Any],
         reverse_type_func: Callable[[str], Any],
-        from_func: Callable[[Dict[str, Any], str], Type[Schema]],
+        from_func: Optional[Callable[[Dict[str, Any], str], Type[Schema]]] = None,
         schema_name: str = "Schema"
     ) -> Type[Schema]:
     """
-    Converts a generic JSON schema into a belso schema.\n
+    Converts a generic JSON schema into a belso schema.
+    Local `$ref`s to `$defs` (or `definitions`) are resolved, converting each
+    definition once. Nested schemas are converted from a work list, so their
+    depth is not limited by the recursion limit.\n
     ---
     ### Args
     - `schema` (`dict`): the schema to convert.
     - `reverse_type_func` (`Callable[[str], Any]`): the function to reverse the type mapping.
-    - `from_func` (`Callable[[Dict[str, Any], str], Type[Schema]]`): the function to convert the nested schema.
+    - `from_func` (`Optional[Callable[[Dict[str, Any], str], Type[Schema]]]`): deprecated and ignored; nested schemas are converted along with the schema. Defaults to `None`.
     - `schema_name` (`str`, optional): the name of the schema.\n
     ---
     ### Returns
     - `Type[Schema]`: the converted schema.
     """
+    if from_func is not None:
+        warnings.warn(
+            "The 'from_func' argument of from_json_schema is deprecated and ignored.",
+            DeprecationWarning,
+            stacklevel=2
+        )
     try:
         _logger.debug("Starting conversion from generic JSON schema to belso format...")
 
-        ConvertedSchema = type(f"{schema_name}Schema", (Schema,), {"fields": []})
-
-        properties = schema.get("properties", {})
-        required_fields = set(schema.get("required", []))
-
-        for name, prop in properties.items():
-            prop_type = prop.get("type", "string")
-            description = prop.get("description", "")
-            required = name in required_fields
-            default = prop.get("default") if not required else None
-
-            if prop_type == "object" and "properties" in prop:
-                nested = from_func(prop, schema_name=f"{name}")
-                ConvertedSchema.fields.append(NestedField(name=name, schema=nested, description=description, required=required, default=default))
-            elif prop_type == "array" and "items" in prop:
-                items = prop["items"]
-                if items.get("type") == "object" and "properties" in items:
-                    item_schema = from_func(items, schema_name=f"{name}")
-                    ConvertedSchema.fields.append(ArrayField(name=name, items_type=dict, description=description, required=required, default=default))
-                else:
-                    item_type = reverse_type_func(items.get("type", "string"))
-                    ConvertedSchema.fields.append(ArrayField(name=name, items_type=item_type, description=description, required=required, default=default))
-            else:
-                ConvertedSchema.fields.append(BaseField(name=name, type_=reverse_type_func(prop_type), description=description, required=required, default=default))
+        refs = _RefResolver(schema)
+        ConvertedSchema = refs.create(schema, schema_name)
+        while refs.pending:
+            definition, converted = refs.pending.pop()
+            try:
+                _convert_properties(definition, converted, reverse_type_func, refs)
+            except Exception as e:
+                if converted is ConvertedSchema:
+                    raise
+                # A nested schema that fails to convert falls back on its own
+                _logger.error("Error converting from JSON schema: %s", e)
+                converted.fields = list(create_fallback_schema().fields)
 
         return ConvertedSchema
 
     except Exception as e:
-        _logger.error(f"Error converting from JSON schema: {e}")
+        _logger.error("Error converting from JSON schema: %s", e)
         return create_fallback_schema()
 
 def json_provider(extra_metadata:Optional[dict]=None):
@@ -202,17 +386,18 @@ def json_provider(extra_metadata:Optional[dict]=None):
     - `tuple`: a tuple containing the `to_func` and `from_func` functions.
     """
     def wrapper(func):
-        def to_func(schema: Type[Schema]) -> Dict[str, Any]:
+        def to_func(schema: Type[Schema], use_refs: bool = False) -> Dict[str, Any]:
             """
             Converts a belso schema into JSON Schema format for the given provider.\n
             ---
             ### Args
-            - `schema` (`Type[Schema]`): belso schema to convert.\n
+            - `schema` (`Type[Schema]`): belso schema to convert.
+            - `use_refs` (`bool`): whether to reference nested schemas from `$defs`. Defaults to `False`.\n
             ---
             ### Returns
             - `Dict[str, Any]`: JSON Schema representation.
             """
-            return to_json_schema(schema, extra_metadata=extra_metadata)
+            return to_json_schema(schema, extra_metadata=extra_metadata, use_refs=use_refs)
         def from_func(
                 schema: Dict[str, Any],
                 schema_name: str = "Schema"
@@ -227,6 +412,6 @@ def json_provider(extra_metadata:Optional[dict]=None):
             ### Returns
             - `Type[Schema]`: reconstructed belso schema.
             """
-            return from_json_schema(schema, map_json_to_python_type, from_func, schema_name)
+            return from_json_schema(schema, map_json_to_python_type, schema_name=schema_name)
         return to_func, from_func
     return wrapper
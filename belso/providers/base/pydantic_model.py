@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Dict, Any, Callable, List, Optional, Tuple, Type, get_origin
+from typing import Dict, List, Optional, Tuple, Type, Union, get_origin
 
 from pydantic import BaseModel, Field as PydanticField, create_model
 
+from belso.utils.caching import LRUCache
 from belso.utils.logging import get_logger
 from belso.core.schema import Schema, BaseField
+from belso.core.spec import _graph_digests, schema_fingerprint
+from belso.core.ir import ARRAY, OBJECT, OBJECT_ARRAY, SchemaIR, compile_ir
+from belso.core.traversal import fold
 from belso.core.field import NestedField, ArrayField
 from belso.utils.mappings.field_mappings import _PYDANTIC_FIELD_MAP
 
@@ -15,6 +19,9 @@ import pydantic.fields
 
 _logger = get_logger(__name__)
 
+# Generated models, keyed by schema fingerprint, shared by all conversions
+_MODEL_CACHE = LRUCache(maxsize=512)
+
 def _convert_field_to_pydantic(field: BaseField) -> Tuple[Type, PydanticField]:
     """
     Converts a base field into a Pydantic field definition.\n
@@ -25,7 +32,6 @@ def _convert_field_to_pydantic(field: BaseField) -> Tuple[Type, PydanticField]:
     ### Returns
     - `Tuple[Type, PydanticField]`: the field type and PydanticField instance.
     """
-    _logger.debug(f"Converting field '{field.name}' to Pydantic field...")
     field_type = field.type_
     metadata = {"description": field.description or ""}
 
@@ -43,19 +49,18 @@ def _convert_field_to_pydantic(field: BaseField) -> Tuple[Type, PydanticField]:
 
 def _convert_nested_field(
         field: NestedField,
-        to_func: Callable[[Type[Schema]], Dict[str, Any]]
+        model: Union[Type[BaseModel], str]
     ) -> Tuple[Type, PydanticField]:
     """
     Converts a NestedField to a Pydantic field definition.\n
     ---
     ### Args
     - `field` (`NestedField`): the nested field to convert.
-    - `to_func` (`Callable[[Type[Schema]], Dict[str, Any]]`): the function to convert nested schemas.\n
+    - `model` (`Union[Type[BaseModel], str]`): the model of the nested schema, or its forward reference.\n
     ---
     ### Returns
     - `Tuple[Type, PydanticField]`: the nested field type and PydanticField instance.
     """
-    model = to_func(field.schema)
     return _convert_field_to_pydantic(
         BaseField(
             name=field.name,
@@ -68,14 +73,14 @@ def _convert_nested_field(
 
 def _convert_array_field(
         field: ArrayField,
-        to_func: Callable[[Type[Schema]], Dict[str, Any]]
+        items_model: Optional[Union[Type[BaseModel], str]] = None
     ) -> Tuple[Type, PydanticField]:
     """
     Converts an ArrayField to a Pydantic field definition.\n
     ---
     ### Args
     - `field` (`ArrayField`): the array field to convert.
-    - `to_func` (`Callable[[Type[Schema]], Dict[str, Any]]`): the function to convert nested schemas.
+    - `items_model` (`Optional[Union[Type[BaseModel], str]]`): the model of the items schema, or its forward reference. Defaults to `None` (items of `field.items_type`).
     ---
     ### Returns
     - `Tuple[Type, PydanticField]`: the array field type and PydanticField instance.
@@ -87,8 +92,7 @@ def _convert_array_field(
         metadata["minItems"] = field.items_range[0]
         metadata["maxItems"] = field.items_range[1]
 
-    if isinstance(field.items_type, type) and issubclass(field.items_type, Schema):
-        items_model = to_func(field.items_type)
+    if items_model is not None:
         list_type = List[items_model]
     else:
         list_type = List[field.items_type]
@@ -100,44 +104,203 @@ def _convert_array_field(
     else:
         return list_type, PydanticField(..., **metadata)
 
-def to_pydantic_model(schema: Type[Schema]) -> Type[BaseModel]:
+class _ModelBuilder:
+    """
+    Builds the Pydantic models of a schema graph in one pass. A schema reached
+    again while its model is being built (a recursive schema) is referred to
+    by a forward reference, resolved once every model of the graph exists.
     """
-    Converts a belso Schema to a Pydantic model.\n
+    __slots__ = ("ir", "cache", "models", "building", "keys", "digests", "namespace", "created")
+
+    def __init__(self, ir: SchemaIR, cache: bool = True) -> None:
+        self.ir = ir
+        # Whether models are reused from, and shared with, other conversions
+        self.cache = cache
+        # The model of each schema of the graph, by number
+        self.models: Dict[int, Type[BaseModel]] = {}
+        # The forward reference of each schema whose model is being built
+        self.building: Dict[int, str] = {}
+        # The fingerprint of each schema whose model is being built
+        self.keys: Dict[int, str] = {}
+        # The fingerprints of the schemas of the graph, computed on first use
+        self.digests: Optional[Dict[int, str]] = None
+        # The models by forward reference
+        self.namespace: Dict[str, Type[BaseModel]] = {}
+        # The models created by this conversion, by schema fingerprint
+        self.created: List[Tuple[str, Type[BaseModel]]] = []
+
+    def fingerprint(self, index: int) -> str:
+        """
+        Get the fingerprint of a schema of the graph.\n
+        ---
+        ### Args
+        - `index` (`int`): the number of the schema in the graph.\n
+        ---
+        ### Returns
+        - `str`: the fingerprint.
+        """
+        if index == 0:
+            return schema_fingerprint(self.ir.schemas[0])
+        if self.digests is None:
+            self.digests = _graph_digests(self.ir)
+        digest = self.digests.get(index)
+        if digest is None:
+            # Recursive schemas hash differently from inside the graph
+            digest = schema_fingerprint(self.ir.schemas[index])
+        return digest
+
+    def enter(self, index: int) -> None:
+        """
+        Reuse the model of a schema built by an earlier conversion, or
+        reserve the forward reference of the model about to be built.\n
+        ---
+        ### Args
+        - `index` (`int`): the number of the schema in the graph.
+        """
+        key = self.fingerprint(index) if self.cache else None
+        model = _MODEL_CACHE.get(key) if self.cache else None
+        if model is not None:
+            self.models[index] = model
+            return
+
+        schema_name = getattr(self.ir.schemas[index], "__name__", "GeneratedModel")
+        ref = schema_name
+        while ref in self.namespace or ref in self.building.values():
+            ref = f"{schema_name}_{len(self.namespace)}"
+        self.building[index] = ref
+        self.keys[index] = key
+
+    def create(
+            self,
+            index: int,
+            nested: Dict[int, Type[BaseModel]],
+            path: List[int]
+        ) -> Type[BaseModel]:
+        """
+        Create the Pydantic model of a schema, once the models of its nested schemas exist.\n
+        ---
+        ### Args
+        - `index` (`int`): the number of the schema in the graph.
+        - `nested` (`Dict[int, Type[BaseModel]]`): the models of the nested schemas, by row; recursive ones are missing.
+        - `path` (`List[int]`): the schemas being built, ending with this one.\n
+        ---
+        ### Returns
+        - `Type[BaseModel]`: the Pydantic model.
+        """
+        ir = self.ir
+        schema_name = getattr(ir.schemas[index], "__name__", "GeneratedModel")
+        _logger.debug("Creating Pydantic model '%s'...", schema_name)
+
+        fields = {}
+        for row in ir.rows(index):
+            kind, f = ir.kinds[row], ir.fields[row]
+            if kind == OBJECT or kind == OBJECT_ARRAY:
+                model = nested.get(row)
+                if model is None:
+                    model = self.building[ir.children[row]]
+                if kind == OBJECT:
+                    fields[f.name] = _convert_nested_field(f, model)
+                else:
+                    fields[f.name] = _convert_array_field(f, model)
+            elif kind == ARRAY:
+                fields[f.name] = _convert_array_field(f)
+            else:
+                fields[f.name] = _convert_field_to_pydantic(f)
+
+        ref = self.building.pop(index)
+        model = create_model(schema_name, **fields)
+        self.namespace[ref] = model
+        self.created.append((self.keys.pop(index), model))
+        self.models[index] = model
+        return model
+
+    def build(self, index: int = 0) -> Type[BaseModel]:
+        """
+        Get the Pydantic model of a schema, creating it and the models of
+        its nested schemas unless an earlier conversion built them.\n
+        ---
+        ### Args
+        - `index` (`int`): the number of the schema in the graph. Defaults to `0`, the root.\n
+        ---
+        ### Returns
+        - `Type[BaseModel]`: the Pydantic model.
+        """
+        return fold(self.ir, self.create, index, self.enter, self.models)
+
+    def finish(self) -> None:
+        """
+        Resolve the forward references of the created models and share them with later conversions.
+        """
+        for _, model in self.created:
+            if not model.__pydantic_complete__:
+                model.model_rebuild(_types_namespace=self.namespace)
+        if self.cache:
+            for key, model in self.created:
+                _MODEL_CACHE.put(key, model)
+
+def to_pydantic_model(
+        schema: Type[Schema],
+        cache: bool = True
+    ) -> Type[BaseModel]:
+    """
+    Converts a belso Schema to a Pydantic model.
+    Each distinct nested schema maps to a single model class, which is reused
+    by later conversions of structurally identical schemas. Recursive schemas
+    become self-referencing models. Schemas that cannot be fingerprinted (see
+    `belso.core.spec.schema_fingerprint`) get models of their own.\n
     ---
     ### Args
-    - `schema` (`Type[Schema]`): the belso schema.\n
+    - `schema` (`Type[Schema]`): the belso schema.
+    - `cache` (`bool`): whether to reuse the models built by earlier conversions, and share the new ones. Defaults to `True`.\n
     ---
     ### Returns
     - `Type[BaseModel]`: the Pydantic model.
     """
-    schema_name = getattr(schema, "__name__", "GeneratedModel")
-    _logger.debug(f"Creating Pydantic model '{schema_name}'...")
-    fields = {}
-    for f in schema.fields:
-        if isinstance(f, NestedField):
-            fields[f.name] = _convert_nested_field(f, to_pydantic_model)
-        elif isinstance(f, ArrayField):
-            fields[f.name] = _convert_array_field(f, to_pydantic_model)
-        else:
-            fields[f.name] = _convert_field_to_pydantic(f)
+    if cache:
+        try:
+            schema_fingerprint(schema)
+        except TypeError as e:
+            _logger.debug("Not sharing the Pydantic models of '%s': %s", schema.__name__, e)
+            cache = False
+    builder = _ModelBuilder(compile_ir(schema), cache)
+    model = builder.build()
+    builder.finish()
+    return model
 
-    return create_model(schema_name, **fields)
+def clear_model_cache() -> int:
+    """
+    Drop the Pydantic models reused across conversions.\n
+    ---
+    ### Returns
+    - `int`: the number of dropped models.
+    """
+    removed = len(_MODEL_CACHE)
+    _MODEL_CACHE.clear()
+    return removed
 
 def from_pydantic_model(
         schema: Type[BaseModel],
-        schema_name: str = "Schema"
+        schema_name: str = "Schema",
+        converted: Optional[Dict[type, Type[Schema]]] = None
     ) -> Type[Schema]:
     """
-    Converts a Pydantic model back to a belso Schema.\n
+    Converts a Pydantic model back to a belso Schema.
+    Self-referencing models become recursive schemas.\n
     ---
     ### Args
     - `schema` (`Type[BaseModel]`): the Pydantic model.
-    - `schema_name` (`str`): base name of the resulting belso schema.\n
+    - `schema_name` (`str`): base name of the resulting belso schema.
+    - `converted` (`Optional[Dict[type, Type[Schema]]]`): the schemas already created for the models of the graph. Defaults to `None`.\n
     ---
     ### Returns
     - `Type[Schema]`: the belso schema.
     """
+    if converted is None:
+        converted = {}
+    elif schema in converted:
+        return converted[schema]
     ConvertedSchema = type(f"{schema_name}Schema", (Schema,), {"fields": []})
+    converted[schema] = ConvertedSchema
     for name, field_info in schema.__fields__.items():
         field_type = field_info.outer_type_ if hasattr(field_info, "outer_type_") else field_info.annotation
         required = getattr(field_info, "required", True)
@@ -145,12 +308,13 @@ def from_pydantic_model(
         description = getattr(field_info, "description", "")
 
         if isinstance(field_type, type) and issubclass(field_type, BaseModel):
-            nested = from_pydantic_model(field_type, schema_name=name)
+            nested = from_pydantic_model(field_type, schema_name=name, converted=converted)
             ConvertedSchema.fields.append(NestedField(name, nested, description, required, default))
         elif get_origin(field_type) in (list, List):
             item_type = field_type.__args__[0]
             if isinstance(item_type, type) and issubclass(item_type, BaseModel):
-                ConvertedSchema.fields.append(ArrayField(name, dict, description, required, default))
+                items_schema = from_pydantic_model(item_type, schema_name=name, converted=converted)
+                ConvertedSchema.fields.append(ArrayField(name, items_schema, description, required, default))
             else:
                 ConvertedSchema.fields.append(ArrayField(name, item_type, description, required, default))
         else:
@@ -1,12 +1,14 @@
 # belso.providers.google
 
-from typing import Type
+from typing import Dict, List, Type
 
 from google.ai.generativelanguage_v1beta.types import content
 
 from belso.utils.logging import get_logger
 from belso.core.schema import Schema, BaseField
 from belso.core.field import NestedField, ArrayField
+from belso.core.ir import ARRAY, OBJECT, PRIMITIVE, SchemaIR, compile_ir
+from belso.core.traversal import fold
 from belso.utils.helpers import create_fallback_schema
 from belso.utils.mappings.type_mappings import _GOOGLE_TYPE_MAP, _REVERSE_GOOGLE_TYPE_MAP
 
@@ -22,8 +24,6 @@ def _convert_field_to_schema(field: BaseField) -> content.Schema:
     ### Returns
     - `content.Schema`: the corresponding Google schema.
     """
-    _logger.debug(f"Converting base field '{field.name}' to Google Schema...")
-
     schema = content.Schema(
         type=_GOOGLE_TYPE_MAP.get(field.type_, content.Type.TYPE_UNSPECIFIED),
         description=field.description or "",
@@ -38,20 +38,20 @@ def _convert_field_to_schema(field: BaseField) -> content.Schema:
     return schema
 
 
-def _convert_nested_field(field: NestedField) -> content.Schema:
+def _convert_nested_field(
+        field: BaseField,
+        nested_schema: content.Schema
+    ) -> content.Schema:
     """
     Converts a NestedField to a Google content.Schema object.\n
     ---
     ### Args
-    - `field` (`NestedField`): the nested field.\n
+    - `field` (`BaseField`): the nested field.
+    - `nested_schema` (`content.Schema`): the converted nested schema.\n
     ---
     ### Returns
     - `content.Schema`: the nested schema.
     """
-    _logger.debug(f"Converting nested field '{field.name}' to Google Schema...")
-
-    nested_schema = to_google(field.schema)
-
     return content.Schema(
         type=content.Type.OBJECT,
         description=field.description or "",
@@ -60,25 +60,20 @@ def _convert_nested_field(field: NestedField) -> content.Schema:
         required=nested_schema.required
     )
 
-def _convert_array_field(field: ArrayField) -> content.Schema:
+def _convert_array_field(
+        field: BaseField,
+        items_schema: content.Schema
+    ) -> content.Schema:
     """
     Converts an ArrayField to a Google content.Schema object.\n
     ---
     ### Args
-    - `field` (`ArrayField`): the array field.\n
+    - `field` (`BaseField`): the array field.
+    - `items_schema` (`content.Schema`): the converted items schema.\n
     ---
     ### Returns
     - `content.Schema`: the array schema.
     """
-    _logger.debug(f"Converting array field '{field.name}' to Google Schema...")
-
-    if isinstance(field.items_type, type) and issubclass(field.items_type, Schema):
-        items_schema = to_google(field.items_type)
-    else:
-        items_schema = content.Schema(
-            type=_GOOGLE_TYPE_MAP.get(field.items_type, content.Type.TYPE_UNSPECIFIED)
-        )
-
     schema = content.Schema(
         type=content.Type.ARRAY,
         description=field.description or "",
@@ -92,6 +87,53 @@ def _convert_array_field(field: ArrayField) -> content.Schema:
 
     return schema
 
+def _convert_object(
+        ir: SchemaIR,
+        index: int,
+        nested: Dict[int, content.Schema],
+        path: List[int]
+    ) -> content.Schema:
+    """
+    Converts the fields of a schema into a Google object schema.
+    Google schemas cannot refer to themselves, so a schema nested in itself
+    is emitted as an object without properties.\n
+    ---
+    ### Args
+    - `ir` (`SchemaIR`): the compiled schema graph.
+    - `index` (`int`): the number of the schema.
+    - `nested` (`Dict[int, content.Schema]`): the converted nested schemas, by row; recursive ones are missing.
+    - `path` (`List[int]`): the schemas being converted, ending with this one.\n
+    ---
+    ### Returns
+    - `content.Schema`: the object schema.
+    """
+    properties = {}
+    for row in ir.rows(index):
+        kind, field = ir.kinds[row], ir.fields[row]
+        if kind == PRIMITIVE:
+            properties[field.name] = _convert_field_to_schema(field)
+            continue
+
+        if kind == ARRAY:
+            nested_schema = content.Schema(
+                type=_GOOGLE_TYPE_MAP.get(ir.types[row], content.Type.TYPE_UNSPECIFIED)
+            )
+        elif row in nested:
+            nested_schema = nested[row]
+        else:
+            _logger.debug("Schema '%s' is recursive, emitting it as an untyped object.", ir.schemas[ir.children[row]].__name__)
+            nested_schema = content.Schema(type=content.Type.OBJECT)
+
+        if kind == OBJECT:
+            properties[field.name] = _convert_nested_field(field, nested_schema)
+        else:
+            properties[field.name] = _convert_array_field(field, nested_schema)
+
+    return content.Schema(
+        type=content.Type.OBJECT,
+        properties=properties,
+        required=list(ir.required[index])
+    )
 
 def to_google(schema: Type[Schema]) -> content.Schema:
     """
@@ -105,25 +147,12 @@ def to_google(schema: Type[Schema]) -> content.Schema:
     """
     try:
         schema_name = getattr(schema, "__name__", "UnnamedSchema")
-        _logger.debug(f"Translating schema '{schema_name}' to Google format...")
-
-        properties = {}
-        for field in schema.fields:
-            if isinstance(field, NestedField):
-                properties[field.name] = _convert_nested_field(field)
-            elif isinstance(field, ArrayField):
-                properties[field.name] = _convert_array_field(field)
-            else:
-                properties[field.name] = _convert_field_to_schema(field)
-
-        return content.Schema(
-            type=content.Type.OBJECT,
-            properties=properties,
-            required=schema.get_required_fields()
-        )
+        _logger.debug("Translating schema '%s' to Google format...", schema_name)
+        ir = compile_ir(schema)
+        return fold(ir, lambda index, nested, path: _convert_object(ir, index, nested, path))
 
     except Exception as e:
-        _logger.error(f"Error translating schema to Google format: {e}")
+        _logger.error("Error translating schema to Google format: %s", e)
         _logger.debug("Translation error details", exc_info=True)
         return content.Schema()
 
@@ -197,6 +226,9 @@ def from_google(
         return ConvertedSchema
 
     except Exception as e:
-        _logger.error(f"Error converting Google schema to belso format: {e}")
+        _logger.error("Error converting Google schema to belso format: %s", e)
         _logger.debug("Conversion error details", exc_info=True)
         return create_fallback_schema()
+
+# Codec used by the disk cache to store converted schemas
+_DISK_CODEC = (content.Schema.serialize, content.Schema.deserialize)
@@ -1,8 +1,29 @@
 # belso.formats.__init__
 
-from belso.serialization.xml_format import to_xml, from_xml
-from belso.serialization.json_format import to_json, from_json
-from belso.serialization.yaml_format import to_yaml, from_yaml
+from importlib import import_module
+
+# Serializers are imported on first access, so PyYAML and `xml.etree` are only
+# loaded when the matching format is used.
+_LAZY_EXPORTS = {
+    "to_xml": "belso.serialization.xml_format",
+    "from_xml": "belso.serialization.xml_format",
+    "to_json": "belso.serialization.json_format",
+    "from_json": "belso.serialization.json_format",
+    "to_yaml": "belso.serialization.yaml_format",
+    "from_yaml": "belso.serialization.yaml_format"
+}
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
 
 __all__ = [
     "to_xml",
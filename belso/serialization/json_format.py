@@ -2,11 +2,13 @@
 
 import json
 from pathlib import Path
-from typing import Any, Dict, Optional, Type, Union
+from typing import Any, Dict, List, Optional, Type, Union
 
 from belso.utils import get_logger
 from belso.core import Schema, BaseField
 from belso.core.field import NestedField, ArrayField
+from belso.core.ir import OBJECT, OBJECT_ARRAY, PRIMITIVE, SchemaIR, compile_ir
+from belso.core.traversal import fold
 from belso.utils.helpers import create_fallback_schema
 from belso.utils.mappings.type_mappings import _FILE_TYPE_MAP
 
@@ -28,6 +30,25 @@ def _add_prefix(
     """
     return base if not prefix or base.startswith(prefix) else f"{prefix}{base}"
 
+def _resolve_ref(
+        name: str,
+        ancestors: Dict[str, Type[Schema]]
+    ) -> Type[Schema]:
+    """
+    Resolve a reference to an enclosing schema, written for recursive schemas.\n
+    ---
+    ### Args
+    - `name` (`str`): name of the referenced schema.
+    - `ancestors` (`Dict[str, Type[Schema]]`): enclosing schemas by name.\n
+    ---
+    ### Returns
+    - `Type[Schema]`: the referenced schema.
+    """
+    try:
+        return ancestors[name]
+    except KeyError:
+        raise ValueError(f"Reference to unknown enclosing schema '{name}'.") from None
+
 def _field_dict(field: BaseField) -> Dict[str, Any]:
     """
     Convert `field` to a dict.\n
@@ -48,41 +69,71 @@ def _field_dict(field: BaseField) -> Dict[str, Any]:
         d["default"] = field.default
     return d
 
+def _schema_name(
+        ir: SchemaIR,
+        index: int,
+        root_prefix: str
+    ) -> str:
+    """
+    Get the serialized name of a schema of the graph.\n
+    ---
+    ### Args
+    - `ir` (`SchemaIR`): compiled schema graph.
+    - `index` (`int`): number of the schema.
+    - `root_prefix` (`str`): prefix to apply to the root schema name.\n
+    ---
+    ### Returns
+    - `str`: the schema name, prefixed if it is the root.
+    """
+    return _add_prefix(ir.schemas[index].__name__, root_prefix if index == 0 else "")
+
 def _to_json(
-        schema: Type[Schema], *,
+        ir: SchemaIR,
+        index: int,
+        nested: Dict[int, Dict[str, Any]],
+        path: List[int],
         root_prefix: str = ""
     ) -> Dict[str, Any]:
     """
-    Serialize `schema` in a dict JSON-ready.\n
+    Serialize a schema of the graph in a dict JSON-ready, once its nested schemas are.\n
     ---
     ### Args
-    - `schema` (`Type[Schema]`): schema to serialize.
-    - `root_prefix` (`str`, optional): prefix to apply to the root schema name.\n
+    - `ir` (`SchemaIR`): compiled schema graph.
+    - `index` (`int`): number of the schema to serialize.
+    - `nested` (`Dict[int, Dict[str, Any]]`): the serialized nested schemas, by row; a schema nested in itself is missing and referred to by name instead.
+    - `path` (`List[int]`): the schemas being serialized, ending with this one.
+    - `root_prefix` (`str`): prefix to apply to the root schema name.\n
     ---
     ### Returns
-    - `Dict[str, Any]`: dict JSON-ready representation of `schema`.
+    - `Dict[str, Any]`: dict JSON-ready representation of the schema.
     """
     schema_json: Dict[str, Any] = {
-        "name": _add_prefix(schema.__name__, root_prefix),
+        "name": _schema_name(ir, index, root_prefix),
         "fields": []
     }
+    for row in ir.rows(index):
+        fld, kind, child = ir.fields[row], ir.kinds[row], ir.children[row]
 
-    for fld in schema.fields:
         # nested object
-        if isinstance(fld, NestedField):
+        if kind == OBJECT:
             fld_dict = _field_dict(fld)
-            fld_dict["schema"] = _to_json(fld.schema, root_prefix="")
+            if row in nested:
+                fld_dict["schema"] = nested[row]
+            else:
+                fld_dict["schema_ref"] = _schema_name(ir, child, root_prefix)
             schema_json["fields"].append(fld_dict)
             continue
 
         # array
-        if isinstance(fld, ArrayField):
+        if kind != PRIMITIVE:
             fld_dict = _field_dict(fld)
             fld_dict["items_type"] = (
                 fld.items_type.__name__ if hasattr(fld.items_type, "__name__") else str(fld.items_type)
             )
-            if fld.items_schema:
-                fld_dict["items_schema"] = _to_json(fld.items_schema, root_prefix="")
+            if row in nested:
+                fld_dict["items_schema"] = nested[row]
+            elif kind == OBJECT_ARRAY:
+                fld_dict["items_schema_ref"] = _schema_name(ir, child, root_prefix)
             schema_json["fields"].append(fld_dict)
             continue
 
@@ -108,87 +159,115 @@ def to_json(
     - `Dict[str, Any]`: dict JSON-ready representation of `schema`.
     """
     try:
-        data = _to_json(schema, root_prefix=schema_name)
+        ir = compile_ir(schema)
+        data = fold(ir, lambda index, nested, path: _to_json(ir, index, nested, path, schema_name))
         if file_path:
-            _logger.debug(f"Saving JSON schema to file \"{file_path}\"...")
+            _logger.debug("Saving JSON schema to file \"%s\"...", file_path)
             with open(file_path, "w", encoding="utf-8") as fp:
                 json.dump(data, fp, indent=2)
-            _logger.info(f"JSON schema saved to file \"{file_path}\".")
+            _logger.info("JSON schema saved to file \"%s\".", file_path)
         return data
     except Exception as exc:  # pragma: no cover
         _logger.error("Error converting schema to JSON: %s", exc, exc_info=True)
         return {"name": "ErrorSchema", "fields": []}
 
-def _from_json(data: Dict[str, Any]) -> Type[Schema]:
+def _new_schema(name: str) -> Type[Schema]:
     """
-    Load JSON data into a belso Schema.\n
+    Create an empty schema, whose fields are loaded afterwards.\n
     ---
     ### Args
-    - `data` (`Dict[str, Any]`): JSON data to load.\n
+    - `name` (`str`): name of the schema.\n
     ---
     ### Returns
-    - `Type[Schema]`: belso Schema loaded from JSON data.
+    - `Type[Schema]`: the schema class.
     """
     class DynamicSchema(Schema):
         fields: list = []
 
-    DynamicSchema.__name__ = data.get("name", "LoadedSchema")
+    DynamicSchema.__name__ = name
+    return DynamicSchema
 
-    for fld in data.get("fields", []):
-        name: str = fld["name"]
-        required: bool = fld.get("required", True)
-        default = fld.get("default")
-        descr = fld.get("description", "")
+def _from_json(
+        data: Dict[str, Any]
+    ) -> Type[Schema]:
+    """
+    Load JSON data into a belso Schema. Nested schemas are loaded from a
+    work list, so their depth is not limited by the recursion limit.\n
+    ---
+    ### Args
+    - `data` (`Dict[str, Any]`): JSON data to load.\n
+    ---
+    ### Returns
+    - `Type[Schema]`: belso Schema loaded from JSON data.
+    """
+    root = _new_schema(data.get("name", "LoadedSchema"))
+    # The schemas whose fields are still to load, with their data and the enclosing schemas
+    pending = [(root, data, {})]
 
-        # nested object
-        if "schema" in fld:
-            nested_schema = _from_json(fld["schema"])
-            DynamicSchema.fields.append(
-                NestedField(
-                    name=name,
-                    schema=nested_schema,
-                    description=descr,
-                    required=required,
-                    default=default)
-            )
-            continue
+    def defer(nested: Dict[str, Any], ancestors: Dict[str, Type[Schema]]) -> Type[Schema]:
+        nested_schema = _new_schema(nested.get("name", "LoadedSchema"))
+        pending.append((nested_schema, nested, ancestors))
+        return nested_schema
 
-        # array
-        if "items_schema" in fld:
-            items_schema = _from_json(fld["items_schema"])
-            DynamicSchema.fields.append(
-                ArrayField(
-                    name=name,
-                    items_type=list,
-                    items_schema=items_schema,
-                    description=descr,
-                    required=required,
-                    default=default)
-            )
-            continue
-        if fld.get("type", "").lower() == "list":
-            DynamicSchema.fields.append(
-                ArrayField(
+    while pending:
+        schema_cls, data, ancestors = pending.pop()
+        ancestors = {**ancestors, schema_cls.__name__: schema_cls}
+
+        for fld in data.get("fields", []):
+            name: str = fld["name"]
+            required: bool = fld.get("required", True)
+            default = fld.get("default")
+            descr = fld.get("description", "")
+
+            # nested object
+            if "schema" in fld or "schema_ref" in fld:
+                nested_schema = _resolve_ref(fld["schema_ref"], ancestors) if "schema_ref" in fld else defer(fld["schema"], ancestors)
+                schema_cls.fields.append(
+                    NestedField(
+                        name=name,
+                        schema=nested_schema,
+                        description=descr,
+                        required=required,
+                        default=default)
+                )
+                continue
+
+            # array
+            if "items_schema" in fld or "items_schema_ref" in fld:
+                items_schema = _resolve_ref(fld["items_schema_ref"], ancestors) if "items_schema_ref" in fld else defer(fld["items_schema"], ancestors)
+                schema_cls.fields.append(
+                    ArrayField(
+                        name=name,
+                        items_type=list,
+                        items_schema=items_schema,
+                        description=descr,
+                        required=required,
+                        default=default)
+                )
+                continue
+            if fld.get("type", "").lower() == "list":
+                schema_cls.fields.append(
+                    ArrayField(
+                        name=name,
+                        items_type=str,
+                        description=descr,
+                        required=required,
+                        default=default)
+                )
+                continue
+
+            # primitive
+            py_type = _FILE_TYPE_MAP.get(fld.get("type", "str").lower(), str)
+            schema_cls.fields.append(
+                BaseField(
                     name=name,
-                    items_type=str,
+                    type_=py_type,
                     description=descr,
                     required=required,
                     default=default)
             )
-            continue
 
-        # primitive
-        py_type = _FILE_TYPE_MAP.get(fld.get("type", "str").lower(), str)
-        DynamicSchema.fields.append(
-            BaseField(
-                name=name,
-                type_=py_type,
-                description=descr,
-                required=required,
-                default=default)
-        )
-
-    return DynamicSchema
+    return root
 
 def from_json(
         json_input: Union[str, Path, Dict[str, Any]],
@@ -207,10 +286,10 @@ def from_json(
     try:
         _logger.debug("Loading JSON schema...")
         if isinstance(json_input, (str, Path)):
-            _logger.debug(f"Loading JSON schema from \"{json_input}\"...")
+            _logger.debug("Loading JSON schema from \"%s\"...", json_input)
             with open(json_input, "r", encoding="utf-8") as fp:
                 data = json.load(fp)
-            _logger.info(f"JSON schema loaded from \"{json_input}\".")
+            _logger.info("JSON schema loaded from \"%s\".", json_input)
         else:
             data = json_input
             _logger.info("JSON schema loaded from memory.")
@@ -1,12 +1,14 @@
 # belso.serialization.xml_format
 
 from pathlib import Path
-from typing import Optional, Type, Union
+from typing import Dict, List, Optional, Type, Union
 
 from belso.utils import get_logger
 import xml.etree.ElementTree as ET
 from belso.core import Schema, BaseField
 from belso.core.field import NestedField, ArrayField
+from belso.core.ir import OBJECT, OBJECT_ARRAY, PRIMITIVE, SchemaIR, compile_ir
+from belso.core.traversal import fold
 from belso.utils.helpers import create_fallback_schema
 from belso.utils.mappings.type_mappings import _FILE_TYPE_MAP
 
@@ -28,52 +30,95 @@ def _add_prefix(
     """
     return base if (not prefix or base.startswith(prefix)) else f"{prefix}{base}"
 
-def _indent(
-        elem: ET.Element,
-        level: int = 0
-    ) -> None:
+def _resolve_ref(
+        name: str,
+        ancestors: Dict[str, Type[Schema]]
+    ) -> Type[Schema]:
+    """
+    Resolve a reference to an enclosing schema, written for recursive schemas.\n
+    ---
+    ### Args
+    - `name` (`str`): name of the referenced schema.
+    - `ancestors` (`Dict[str, Type[Schema]]`): enclosing schemas by name.\n
+    ---
+    ### Returns
+    - `Type[Schema]`: the referenced schema.
+    """
+    try:
+        return ancestors[name]
+    except KeyError:
+        raise ValueError(f"Reference to unknown enclosing schema '{name}'.") from None
+
+def _indent(elem: ET.Element) -> None:
     """
     Pretty-print helper.\n
     ---
     ### Args
-    - `elem` (`ET.Element`): element to pretty-print.
-    - `level` (`int`): current level of indentation.\n
+    - `elem` (`ET.Element`): element to pretty-print.\n
     ---
     ### Returns
     - `None`: pretty-printing is done in-place.
     """
-    i = "\n" + level * "  "
-    if len(elem):
+    stack = [(elem, 0)]
+    while stack:
+        elem, level = stack.pop()
+        if not len(elem):
+            continue
+        i = "\n" + level * "  "
         if not elem.text or not elem.text.strip():
             elem.text = i + "  "
         for child in elem:
-            _indent(child, level + 1)
             if not child.tail or not child.tail.strip():
                 child.tail = i + "  "
+            stack.append((child, level + 1))
         if not elem[-1].tail or not elem[-1].tail.strip():
             elem[-1].tail = i
-    elif level and (not elem.tail or not elem.tail.strip()):
-        elem.tail = i
+
+def _schema_name(
+        ir: SchemaIR,
+        index: int,
+        root_prefix: str
+    ) -> str:
+    """
+    Get the serialised name of a schema of the graph.\n
+    ---
+    ### Args
+    - `ir` (`SchemaIR`): compiled schema graph.
+    - `index` (`int`): number of the schema.
+    - `root_prefix` (`str`): prefix to apply to the root schema name.\n
+    ---
+    ### Returns
+    - `str`: the schema name, prefixed if it is the root.
+    """
+    return _add_prefix(ir.schemas[index].__name__, root_prefix if index == 0 else "")
 
 def _to_xml(
-        schema: Type[Schema], *,
+        ir: SchemaIR,
+        index: int,
+        nested: Dict[int, ET.Element],
+        path: List[int],
         root_prefix: str = ""
     ) -> ET.Element:
     """
-    Serialise `schema` to XML. `root_prefix` is applied once to the
-    root schema only; children keep their own names untouched.\n
+    Serialise a schema of the graph to XML, once its nested schemas are.
+    `root_prefix` is applied once to the root schema only; children keep
+    their own names untouched.\n
     ---
     ### Args
-    - `schema` (`Type[Schema]`): schema to serialise.
+    - `ir` (`SchemaIR`): compiled schema graph.
+    - `index` (`int`): number of the schema to serialise.
+    - `nested` (`Dict[int, ET.Element]`): the serialised nested schemas, by row; a schema nested in itself is missing and referred to by name instead.
+    - `path` (`List[int]`): the schemas being serialised, ending with this one.
     - `root_prefix` (`str`): prefix to apply to the root schema name.\n
     ---
     ### Returns
-    - `ET.Element`: root element of the XML representation of `schema`.
+    - `ET.Element`: root element of the XML representation of the schema.
     """
-    root = ET.Element("schema", {"name": _add_prefix(schema.__name__, root_prefix)})
+    root = ET.Element("schema", {"name": _schema_name(ir, index, root_prefix)})
     fields_el = ET.SubElement(root, "fields")
 
-    for fld in schema.fields:
+    for row in ir.rows(index):
+        fld, kind, child = ir.fields[row], ir.kinds[row], ir.children[row]
         f_el = ET.SubElement(fields_el, "field", {
             "name": fld.name,
             "type": fld.type_.__name__ if hasattr(fld.type_, "__name__") else str(fld.type_),
@@ -85,20 +130,25 @@ def _to_xml(
             ET.SubElement(f_el, "default").text = str(fld.default)
 
         # nested object
-        if isinstance(fld, NestedField):
+        if kind == OBJECT:
             n_el = ET.SubElement(f_el, "nested_schema")
-            n_el.append(_to_xml(fld.schema, root_prefix=""))  # no extra prefix
+            if row in nested:
+                n_el.append(nested[row])  # no extra prefix
+            else:
+                n_el.set("ref", _schema_name(ir, child, root_prefix))  # no extra prefix
             continue
 
         # array
-        if isinstance(fld, ArrayField):
+        if kind != PRIMITIVE:
             a_el = ET.SubElement(f_el, "array_info")
             ET.SubElement(a_el, "items_type").text = (
                 fld.items_type.__name__ if hasattr(fld.items_type, "__name__") else str(fld.items_type)
             )
-            if fld.items_schema:
+            if row in nested:
                 is_el = ET.SubElement(a_el, "items_schema")
-                is_el.append(_to_xml(fld.items_schema, root_prefix=""))  # no extra prefix
+                is_el.append(nested[row])  # no extra prefix
+            elif kind == OBJECT_ARRAY:
+                ET.SubElement(a_el, "items_schema", {"ref": _schema_name(ir, child, root_prefix)})  # no extra prefix
             continue
 
     return root
@@ -120,97 +170,131 @@ def to_xml(
     - `str`: XML representation of `schema`.
     """
     try:
-        root = _to_xml(schema, root_prefix=schema_name)
+        ir = compile_ir(schema)
+        root = fold(ir, lambda index, nested, path: _to_xml(ir, index, nested, path, schema_name))
         _indent(root)
         xml_text = ET.tostring(root, encoding="unicode")
         if file_path:
-            _logger.debug(f"Saving XML schema to file \"{file_path}\"...")
+            _logger.debug("Saving XML schema to file \"%s\"...", file_path)
             Path(file_path).write_text(xml_text, encoding="utf-8")
-            _logger.info(f"XML schema saved to file \"{file_path}\".")
+            _logger.info("XML schema saved to file \"%s\".", file_path)
             return str(file_path)
         return xml_text
     except Exception as e:  # pragma: no cover
-        _logger.error(f"Error converting schema to XML: {e}", exc_info=True)
+        _logger.error("Error converting schema to XML: %s", e, exc_info=True)
         return "<schema><fields></fields></schema>"
 
-def _from_xml(elem: ET.Element) -> Type[Schema]:
+def _new_schema(name: str) -> Type[Schema]:
     """
-    Deserialise XML into a belso Schema.\n
+    Create an empty schema, whose fields are loaded afterwards.\n
     ---
     ### Args
-    - `elem` (`ET.Element`): root element of the XML representation of a schema.\n
+    - `name` (`str`): name of the schema.\n
     ---
     ### Returns
-    - `Type[Schema]`: schema deserialised from `elem`.
+    - `Type[Schema]`: the schema class.
     """
     class DynamicSchema(Schema):
         fields: list = []
 
-    DynamicSchema.__name__ = elem.get("name", "LoadedSchema")
-
-    for f_el in elem.find("fields").findall("field"):
-        fname = f_el.get("name")
-        ftype_str = f_el.get("type", "str")
-        ftype = _FILE_TYPE_MAP.get(ftype_str.lower(), str)
-        frequired = f_el.get("required", "true") == "true"
-        fdesc = f_el.findtext("description", "")
-        fdef_el = f_el.find("default")
-        fdefault = fdef_el.text if fdef_el is not None else None
-
-        # nested
-        nested_root = f_el.find("nested_schema/schema")
-        if nested_root is not None:
-            nested_schema = _from_xml(nested_root)
-            DynamicSchema.fields.append(
-                NestedField(
-                    name=fname,
-                    schema=nested_schema,
-                    description=fdesc,
-                    required=frequired,
-                    default=fdefault)
-            )
-            continue
+    DynamicSchema.__name__ = name
+    return DynamicSchema
 
-        # array
-        arr_info = f_el.find("array_info")
-        if arr_info is not None:
-            items_type_str = arr_info.findtext("items_type", "str")
-            items_type = _FILE_TYPE_MAP.get(items_type_str.lower(), str)
-            items_schema_root = arr_info.find("items_schema/schema")
-
-            if items_schema_root is not None:
-                items_schema = _from_xml(items_schema_root)
-                DynamicSchema.fields.append(
-                    ArrayField(
-                        name=fname,
-                        items_type=items_type,
-                        items_schema=items_schema,
-                        description=fdesc,
-                        required=frequired,
-                        default=fdefault)
-                )
-            else:
-                DynamicSchema.fields.append(
-                    ArrayField(
+def _from_xml(
+        elem: ET.Element
+    ) -> Type[Schema]:
+    """
+    Deserialise XML into a belso Schema. Nested schemas are loaded from a
+    work list, so their depth is not limited by the recursion limit.\n
+    ---
+    ### Args
+    - `elem` (`ET.Element`): root element of the XML representation of a schema.\n
+    ---
+    ### Returns
+    - `Type[Schema]`: schema deserialised from `elem`.
+    """
+    root = _new_schema(elem.get("name", "LoadedSchema"))
+    # The schemas whose fields are still to load, with their element and the enclosing schemas
+    pending = [(root, elem, {})]
+
+    def defer(nested: ET.Element, ancestors: Dict[str, Type[Schema]]) -> Type[Schema]:
+        nested_schema = _new_schema(nested.get("name", "LoadedSchema"))
+        pending.append((nested_schema, nested, ancestors))
+        return nested_schema
+
+    while pending:
+        schema_cls, elem, ancestors = pending.pop()
+        ancestors = {**ancestors, schema_cls.__name__: schema_cls}
+
+        for f_el in elem.find("fields").findall("field"):
+            fname = f_el.get("name")
+            ftype_str = f_el.get("type", "str")
+            ftype = _FILE_TYPE_MAP.get(ftype_str.lower(), str)
+            frequired = f_el.get("required", "true") == "true"
+            fdesc = f_el.findtext("description", "")
+            fdef_el = f_el.find("default")
+            fdefault = fdef_el.text if fdef_el is not None else None
+
+            # nested
+            nested_el = f_el.find("nested_schema")
+            if nested_el is not None:
+                if nested_el.get("ref") is not None:
+                    nested_schema = _resolve_ref(nested_el.get("ref"), ancestors)
+                else:
+                    nested_schema = defer(nested_el.find("schema"), ancestors)
+                schema_cls.fields.append(
+                    NestedField(
                         name=fname,
-                        items_type=items_type,
+                        schema=nested_schema,
                         description=fdesc,
                         required=frequired,
                         default=fdefault)
                 )
-            continue
+                continue
 
-        # primitive
-        DynamicSchema.fields.append(
-            BaseField(
-                name=fname,
-                type_=ftype,
-                description=fdesc,
-                required=frequired,
-                default=fdefault)
-        )
+            # array
+            arr_info = f_el.find("array_info")
+            if arr_info is not None:
+                items_type_str = arr_info.findtext("items_type", "str")
+                items_type = _FILE_TYPE_MAP.get(items_type_str.lower(), str)
+                items_el = arr_info.find("items_schema")
 
-    return DynamicSchema
+                if items_el is not None:
+                    if items_el.get("ref") is not None:
+                        items_schema = _resolve_ref(items_el.get("ref"), ancestors)
+                    else:
+                        items_schema = defer(items_el.find("schema"), ancestors)
+                    schema_cls.fields.append(
+                        ArrayField(
+                            name=fname,
+                            items_type=items_type,
+                            items_schema=items_schema,
+                            description=fdesc,
+                            required=frequired,
+                            default=fdefault)
+                    )
+                else:
+                    schema_cls.fields.append(
+                        ArrayField(
+                            name=fname,
+                            items_type=items_type,
+                            description=fdesc,
+                            required=frequired,
+                            default=fdefault)
+                    )
+                continue
+
+            # primitive
+            schema_cls.fields.append(
+                BaseField(
+                    name=fname,
+                    type_=ftype,
+                    description=fdesc,
+                    required=frequired,
+                    default=fdefault)
+            )
+
+    return root
 
 def from_xml(
         xml_input: Union[str, Path, ET.Element],
@@ -228,25 +312,25 @@ def from_xml(
     - `Type[Schema]`: schema deserialised from `xml_input`.
     """
     try:
-        _logger.debug(f"Loading XML schema...")
+        _logger.debug("Loading XML schema...")
         if isinstance(xml_input, (str, Path)):
-            _logger.debug(f"Loading XML schema from \"{xml_input}\"...")
+            _logger.debug("Loading XML schema from \"%s\"...", xml_input)
             xml_text = Path(xml_input).read_text(encoding="utf-8") if Path(xml_input).exists() else xml_input
             root = ET.fromstring(xml_text)
             if isinstance(xml_input, Path) or (isinstance(xml_input, str) and Path(xml_input).exists()):
-                _logger.info(f"XML schema loaded from file: \"{xml_input}\".")
+                _logger.info("XML schema loaded from file: \"%s\".", xml_input)
             elif isinstance(xml_input, str):
                 _logger.debug("XML schema loaded from string input.")
             else:
                 _logger.debug("XML schema loaded from ElementTree memory object.")
         else:
             root = xml_input
-            _logger.debug(f"XML schema loaded from memory.")
+            _logger.debug("XML schema loaded from memory.")
 
         schema_cls = _from_xml(root)
         schema_cls.__name__ = _add_prefix(schema_cls.__name__, schema_name)
         return schema_cls
 
     except Exception as e:  # pragma: no cover
-        _logger.error(f"Error loading schema from XML: {e}", exc_info=True)
+        _logger.error("Error loading schema from XML: %s", e, exc_info=True)
         return create_fallback_schema()
@@ -2,11 +2,13 @@
 
 import yaml
 from pathlib import Path
-from typing import Any, Dict, Optional, Type, Union
+from typing import Any, Dict, List, Optional, Type, Union
 
 from belso.utils import get_logger
 from belso.core.schema import Schema, BaseField
 from belso.core.field import NestedField, ArrayField
+from belso.core.ir import OBJECT, OBJECT_ARRAY, PRIMITIVE, SchemaIR, compile_ir
+from belso.core.traversal import fold
 from belso.utils.helpers import create_fallback_schema
 from belso.utils.mappings.type_mappings import _FILE_TYPE_MAP
 
@@ -28,6 +30,25 @@ def _add_prefix(
     """
     return base if (not prefix or base.startswith(prefix)) else f"{prefix}{base}"
 
+def _resolve_ref(
+        name: str,
+        ancestors: Dict[str, Type[Schema]]
+    ) -> Type[Schema]:
+    """
+    Resolve a reference to an enclosing schema, written for recursive schemas.\n
+    ---
+    ### Args
+    - `name` (`str`): name of the referenced schema.
+    - `ancestors` (`Dict[str, Type[Schema]]`): enclosing schemas by name.\n
+    ---
+    ### Returns
+    - `Type[Schema]`: the referenced schema.
+    """
+    try:
+        return ancestors[name]
+    except KeyError:
+        raise ValueError(f"Reference to unknown enclosing schema '{name}'.") from None
+
 def _field_dict(f: BaseField) -> Dict[str, Any]:
     """
     Return a dict representation of `f` (used for YAML serialisation).\n
@@ -48,42 +69,73 @@ def _field_dict(f: BaseField) -> Dict[str, Any]:
         d["default"] = f.default
     return d
 
+def _schema_name(
+        ir: SchemaIR,
+        index: int,
+        root_prefix: str
+    ) -> str:
+    """
+    Get the serialised name of a schema of the graph.\n
+    ---
+    ### Args
+    - `ir` (`SchemaIR`): compiled schema graph.
+    - `index` (`int`): number of the schema.
+    - `root_prefix` (`str`): prefix to apply to the root schema name.\n
+    ---
+    ### Returns
+    - `str`: the schema name, prefixed if it is the root.
+    """
+    return _add_prefix(ir.schemas[index].__name__, root_prefix if index == 0 else "")
+
 def _to_yaml(
-        schema: Type[Schema], *,
+        ir: SchemaIR,
+        index: int,
+        nested: Dict[int, Dict[str, Any]],
+        path: List[int],
         root_prefix: str = ""
     ) -> Dict[str, Any]:
     """
-    Recursively serialise `schema` to YAML. `root_prefix` is applied
-    once to the root schema only; children keep their own names untouched.\n
+    Serialise a schema of the graph to YAML, once its nested schemas are.
+    `root_prefix` is applied once to the root schema only; children keep
+    their own names untouched.\n
     ---
     ### Args
-    - `schema` (`Type[Schema]`): schema to serialise.
+    - `ir` (`SchemaIR`): compiled schema graph.
+    - `index` (`int`): number of the schema to serialise.
+    - `nested` (`Dict[int, Dict[str, Any]]`): the serialised nested schemas, by row; a schema nested in itself is missing and referred to by name instead.
+    - `path` (`List[int]`): the schemas being serialised, ending with this one.
     - `root_prefix` (`str`): prefix to apply to the root schema name.\n
     ---
     ### Returns
-    - `Dict[str, Any]`: dict representation of `schema`.
+    - `Dict[str, Any]`: dict representation of the schema.
     """
     data: Dict[str, Any] = {
-        "name": _add_prefix(schema.__name__, root_prefix),
+        "name": _schema_name(ir, index, root_prefix),
         "fields": []
     }
+    for row in ir.rows(index):
+        fld, kind, child = ir.fields[row], ir.kinds[row], ir.children[row]
 
-    for fld in schema.fields:
         # nested object
-        if isinstance(fld, NestedField):
+        if kind == OBJECT:
             fd = _field_dict(fld)
-            fd["schema"] = _to_yaml(fld.schema, root_prefix="")  # no extra prefix
+            if row in nested:
+                fd["schema"] = nested[row]
+            else:
+                fd["schema_ref"] = _schema_name(ir, child, root_prefix)
             data["fields"].append(fd)
             continue
 
         # array
-        if isinstance(fld, ArrayField):
+        if kind != PRIMITIVE:
             fd = _field_dict(fld)
             fd["items_type"] = (
                 fld.items_type.__name__ if hasattr(fld.items_type, "__name__") else str(fld.items_type)
             )
-            if fld.items_schema:
-                fd["items_schema"] = _to_yaml(fld.items_schema, root_prefix="")
+            if row in nested:
+                fd["items_schema"] = nested[row]
+            elif kind == OBJECT_ARRAY:
+                fd["items_schema_ref"] = _schema_name(ir, child, root_prefix)
             data["fields"].append(fd)
             continue
 
@@ -110,87 +162,115 @@ def to_yaml(
     - `str`: YAML representation of `schema`.
     """
     try:
-        data = _to_yaml(schema, root_prefix=schema_name)
+        ir = compile_ir(schema)
+        data = fold(ir, lambda index, nested, path: _to_yaml(ir, index, nested, path, schema_name))
         yaml_text = yaml.dump(data, sort_keys=False, allow_unicode=True)
         if file_path:
-            _logger.debug(f"Saving YAML schema to file \"{file_path}\"...")
+            _logger.debug("Saving YAML schema to file \"%s\"...", file_path)
             Path(file_path).write_text(yaml_text, encoding="utf-8")
-            _logger.info(f"YAML schema saved to file \"{file_path}\".")
+            _logger.info("YAML schema saved to file \"%s\".", file_path)
         return yaml_text
     except Exception as e: # pragma: no cover
-        _logger.error(f"Error converting schema to YAML: {e}", exc_info=True)
+        _logger.error("Error converting schema to YAML: %s", e, exc_info=True)
         return "name: ErrorSchema\nfields: []\n"
 
-def _from_yaml(data: Dict[str, Any]) -> Type[Schema]:
+def _new_schema(name: str) -> Type[Schema]:
     """
-    Recursively deserialise `data` from YAML.\n
+    Create an empty schema, whose fields are loaded afterwards.\n
     ---
     ### Args
-    - `data` (`Dict[str, Any]`): dict representation of the schema.\n
+    - `name` (`str`): name of the schema.\n
     ---
     ### Returns
-    - `Type[Schema]`: schema deserialised from `data`.
+    - `Type[Schema]`: the schema class.
     """
     class DynamicSchema(Schema):
         fields: list = []
 
-    DynamicSchema.__name__ = data.get("name", "LoadedSchema")
+    DynamicSchema.__name__ = name
+    return DynamicSchema
+
+def _from_yaml(
+        data: Dict[str, Any]
+    ) -> Type[Schema]:
+    """
+    Deserialise `data` from YAML. Nested schemas are loaded from a work
+    list, so their depth is not limited by the recursion limit.\n
+    ---
+    ### Args
+    - `data` (`Dict[str, Any]`): dict representation of the schema.\n
+    ---
+    ### Returns
+    - `Type[Schema]`: schema deserialised from `data`.
+    """
+    root = _new_schema(data.get("name", "LoadedSchema"))
+    # The schemas whose fields are still to load, with their data and the enclosing schemas
+    pending = [(root, data, {})]
+
+    def defer(nested: Dict[str, Any], ancestors: Dict[str, Type[Schema]]) -> Type[Schema]:
+        nested_schema = _new_schema(nested.get("name", "LoadedSchema"))
+        pending.append((nested_schema, nested, ancestors))
+        return nested_schema
 
-    for fld in data.get("fields", []):
-        name: str = fld["name"]
-        required: bool = fld.get("required", True)
-        default = fld.get("default")
-        descr = fld.get("description", "")
+    while pending:
+        schema_cls, data, ancestors = pending.pop()
+        ancestors = {**ancestors, schema_cls.__name__: schema_cls}
 
-        # nested
-        if "schema" in fld:
-            nested_schema = _from_yaml(fld["schema"])
-            DynamicSchema.fields.append(
-                NestedField(
-                    name=name,
-                    schema=nested_schema,
-                    description=descr,
-                    required=required,
-                    default=default)
-            )
-            continue
+        for fld in data.get("fields", []):
+            name: str = fld["name"]
+            required: bool = fld.get("required", True)
+            default = fld.get("default")
+            descr = fld.get("description", "")
 
-        # array
-        if "items_schema" in fld:
-            items_schema = _from_yaml(fld["items_schema"])
-            DynamicSchema.fields.append(
-                ArrayField(
-                    name=name,
-                    items_type=list,
-                    items_schema=items_schema,
-                    description=descr,
-                    required=required,
-                    default=default)
-            )
-            continue
-        if fld.get("type", "").lower() == "list":
-            DynamicSchema.fields.append(
-                ArrayField(
+            # nested
+            if "schema" in fld or "schema_ref" in fld:
+                nested_schema = _resolve_ref(fld["schema_ref"], ancestors) if "schema_ref" in fld else defer(fld["schema"], ancestors)
+                schema_cls.fields.append(
+                    NestedField(
+                        name=name,
+                        schema=nested_schema,
+                        description=descr,
+                        required=required,
+                        default=default)
+                )
+                continue
+
+            # array
+            if "items_schema" in fld or "items_schema_ref" in fld:
+                items_schema = _resolve_ref(fld["items_schema_ref"], ancestors) if "items_schema_ref" in fld else defer(fld["items_schema"], ancestors)
+                schema_cls.fields.append(
+                    ArrayField(
+                        name=name,
+                        items_type=list,
+                        items_schema=items_schema,
+                        description=descr,
+                        required=required,
+                        default=default)
+                )
+                continue
+            if fld.get("type", "").lower() == "list":
+                schema_cls.fields.append(
+                    ArrayField(
+                        name=name,
+                        items_type=str,
+                        description=descr,
+                        required=required,
+                        default=default)
+                )
+                continue
+
+            # primitive
+            py_type = _FILE_TYPE_MAP.get(fld.get("type", "str").lower(), str)
+            schema_cls.fields.append(
+                BaseField(
                     name=name,
-                    items_type=str,
+                    type_=py_type,
                     description=descr,
                     required=required,
                     default=default)
             )
-            continue
 
-        # primitive
-        py_type = _FILE_TYPE_MAP.get(fld.get("type", "str").lower(), str)
-        DynamicSchema.fields.append(
-            BaseField(
-                name=name,
-                type_=py_type,
-                description=descr,
-                required=required,
-                default=default)
-        )
-
-    return DynamicSchema
+    return root
 
 def from_yaml(
         yaml_input: Union[str, Path, Dict[str, Any]],
@@ -208,12 +288,12 @@ def from_yaml(
     - `Type[Schema]`: schema deserialised from `yaml_input`.
     """
     try:
-        _logger.debug(f"Loading YAML...")
+        _logger.debug("Loading YAML...")
         if isinstance(yaml_input, Path) or (isinstance(yaml_input, str) and Path(yaml_input).exists()):
-            _logger.debug(f"Reading YAML from file: \"{yaml_input}\"...")
+            _logger.debug("Reading YAML from file: \"%s\"...", yaml_input)
             text = Path(yaml_input).read_text(encoding="utf-8")
             data = yaml.safe_load(text)
-            _logger.info(f"YAML schema loaded from file: \"{yaml_input}\".")
+            _logger.info("YAML schema loaded from file: \"%s\".", yaml_input)
         elif isinstance(yaml_input, str):
             _logger.debug("Parsing YAML from raw string input.")
             data = yaml.safe_load(yaml_input)
@@ -227,5 +307,5 @@ def from_yaml(
         return schema_cls
 
     except Exception as e:
-        _logger.error(f"Error loading schema from YAML: {e}", exc_info=True)
+        _logger.error("Error loading schema from YAML: %s", e, exc_info=True)
         return create_fallback_schema()
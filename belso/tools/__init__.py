@@ -1,9 +1,37 @@
 # belso.tools.__init__
 
 from belso.tools.displaying import display_schema
-from belso.tools.validating import validate_schema
+from belso.tools.validating import (
+    validate_schema,
+    validate_many,
+    validate_stream,
+    collect_errors,
+    compile_validator,
+    clear_validators,
+    CompiledValidator,
+    BatchValidationResult,
+    RecordError,
+    ValidationIssue
+)
+from belso.tools.streaming import (
+    IncrementalValidator,
+    iter_fields,
+    aiter_fields
+)
 
 __all__ = [
     "display_schema",
-    "validate_schema"
+    "validate_schema",
+    "validate_many",
+    "validate_stream",
+    "collect_errors",
+    "compile_validator",
+    "clear_validators",
+    "CompiledValidator",
+    "BatchValidationResult",
+    "RecordError",
+    "ValidationIssue",
+    "IncrementalValidator",
+    "iter_fields",
+    "aiter_fields"
 ]
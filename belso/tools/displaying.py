@@ -1,24 +1,34 @@
 # belso.tools.displaying
 
 import logging
-from typing import Type, Optional, Dict
-
-from rich import box
-from rich.table import Table
-from rich.console import Console
+from typing import Type, Optional, Dict, Tuple
 
 from belso.core.schema import Schema
 from belso.core.field import NestedField, ArrayField
 
 _logger = logging.getLogger(__name__)
 
-_console = Console()
+_console = None
+
+def _get_console():
+    """
+    Get the shared `rich` console, importing `rich` on first use.\n
+    ---
+    ### Returns
+    - `rich.console.Console`: the console used to print schemas.
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
 
 def _display_schema(
         schema_cls: Type[Schema],
         parent_path: str = "",
         seen_counter: Optional[Dict[str, int]] = None,
-        visited_ids: Optional[Dict[int, str]] = None
+        visited_ids: Optional[Dict[int, str]] = None,
+        ancestors: Tuple[int, ...] = ()
     ) -> None:
     """
     Recursive function to display a schema with nested fields.\n
@@ -27,8 +37,12 @@ def _display_schema(
     - `schema_cls` (Type[Schema]): The schema class to display.
     - `parent_path` (str): The parent path of the schema. Defaults to "".
     - `seen_counter` (Optional[Dict[str, int]], optional): Counter for duplicate contexts. Defaults to None.
-    - `visited_ids` (Optional[Dict[int, str]], optional): Dictionary of visited schema IDs. Defaults to None.\n
+    - `visited_ids` (Optional[Dict[int, str]], optional): Dictionary of visited schema IDs. Defaults to None.
+    - `ancestors` (Tuple[int, ...], optional): IDs of the enclosing schemas, which are not displayed again. Defaults to ().\n
     """
+    from rich import box
+    from rich.table import Table
+
     if seen_counter is None:
         seen_counter = {}
     if visited_ids is None:
@@ -36,6 +50,11 @@ def _display_schema(
 
     schema_id = id(schema_cls)
 
+    # A recursive schema is displayed once, at its outermost occurrence
+    if schema_id in ancestors:
+        return
+    ancestors += (schema_id,)
+
     # Usa il path intero per identificare contesti duplicati
     path_key = parent_path or schema_cls.__name__
     count = seen_counter.get(path_key, 0)
@@ -75,15 +94,15 @@ def _display_schema(
 
         table.add_row(field.name, type_name, required, default, description)
 
-    _console.print(table)
+    _get_console().print(table)
 
     # Visita ricorsiva per Nested e ArrayField
     for field in schema_cls.fields:
         field_path = f"{path_key}.{field.name}"
         if isinstance(field, NestedField):
-            _display_schema(field.schema, field_path, seen_counter, visited_ids)
+            _display_schema(field.schema, field_path, seen_counter, visited_ids, ancestors)
         elif isinstance(field, ArrayField) and isinstance(field.items_type, type) and issubclass(field.items_type, Schema):
-            _display_schema(field.items_type, field_path, seen_counter, visited_ids)
+            _display_schema(field.items_type, field_path, seen_counter, visited_ids, ancestors)
 
 def display_schema(schema: Type[Schema]) -> None:
     """
@@ -95,6 +114,6 @@ def display_schema(schema: Type[Schema]) -> None:
     try:
         _display_schema(schema, seen_counter={}, visited_ids={})
     except Exception as e:
-        _logger.error(f"Error printing schema: {e}")
+        _logger.error("Error printing schema: %s", e)
         _logger.debug("Schema printing error details", exc_info=True)
-        _console.print(f"[bold red]Error printing schema: {e}")
+        _get_console().print(f"[bold red]Error printing schema: {e}")
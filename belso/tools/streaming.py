@@ -0,0 +1,559 @@
+# belso.tools.streaming
+
+import re
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union, get_origin
+
+from belso.utils import get_logger
+from belso.core.schema import Schema, BaseField
+from belso.tools.validating import (
+    ValidationIssue,
+    compile_validator,
+    _pointer,
+    _type_name,
+    _runtime_type,
+    _field_constraints,
+    _constraint_issue
+)
+
+_logger = get_logger(__name__)
+
+_WHITESPACE = frozenset(" \t\n\r")
+_DIGITS = frozenset("-0123456789")
+_NUMBER = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?")
+_NUMBER_RUN = re.compile(r"[-+0-9.eE]*")
+# Characters that must be escaped in strings, as rejected by `json.loads`
+_CONTROL = re.compile(r"[\x00-\x1f]")
+_LITERALS = (("true", True), ("false", False), ("null", None))
+
+# Parser states, telling which tokens may come next
+_VALUE, _VALUE_OR_END, _KEY, _KEY_OR_END, _COLON, _COMMA_OR_END, _DONE = range(7)
+
+class _JsonEventParser:
+    """
+    Push parser turning JSON text, fed in chunks of any size, into events:
+    `("start_map", None)`, `("map_key", key)`, `("end_map", None)`,
+    `("start_array", None)`, `("end_array", None)` and `("value", value)`.\n
+    Text is scanned once: a token cut by the end of a chunk is kept and
+    resumed with the next chunk, so the document is never parsed again
+    from the start.
+    """
+    __slots__ = ("_pending", "_offset", "_scan", "_stack", "_state")
+
+    def __init__(self) -> None:
+        # Unparsed text, starting with an incomplete token
+        self._pending: List[str] = []
+        # Position of the pending text in the whole document
+        self._offset = 0
+        # Where to resume looking for the end of a pending string, from its opening quote
+        self._scan = 1
+        # Open containers, as "{" or "["
+        self._stack: List[str] = []
+        self._state = _VALUE
+
+    @property
+    def done(self) -> bool:
+        """
+        Whether a complete JSON document has been parsed.
+        """
+        return self._state == _DONE
+
+    def feed(self, text: str) -> List[Tuple[str, Any]]:
+        """
+        Parse the next chunk of the document.\n
+        ---
+        ### Args
+        - `text` (`str`): the chunk.\n
+        ---
+        ### Returns
+        - `List[Tuple[str, Any]]`: the events completed by the chunk.
+        """
+        pending = self._pending
+        if pending and pending[0][0] == '"' and '"' not in text:
+            # The chunk cannot end the pending string
+            pending.append(text)
+            return []
+        pending.append(text)
+        return self._parse("".join(pending), False)
+
+    def close(self) -> List[Tuple[str, Any]]:
+        """
+        Signal the end of the document, flushing a trailing number.\n
+        ---
+        ### Returns
+        - `List[Tuple[str, Any]]`: the last events.
+        """
+        events = self._parse("".join(self._pending), True)
+        if self._state != _DONE:
+            raise self._error("unexpected end of input", 0)
+        return events
+
+    def _error(self, reason: str, pos: int) -> ValueError:
+        """
+        Build the error for invalid JSON at `pos` in the pending text.
+        """
+        return ValueError(f"Invalid JSON at character {self._offset + pos}: {reason}.")
+
+    def _string_end(self, buffer: str, pos: int) -> int:
+        """
+        Find the closing quote of the string starting at `pos`, or `-1` if it
+        is not in the buffer yet.
+        """
+        index = buffer.find('"', pos + self._scan)
+        while index >= 0:
+            escapes = 0
+            while buffer[index - escapes - 1] == "\\":
+                escapes += 1
+            if not escapes % 2:
+                self._scan = 1
+                return index
+            index = buffer.find('"', index + 1)
+        self._scan = max(1, len(buffer) - pos)
+        return -1
+
+    def _parse(self, buffer: str, final: bool) -> List[Tuple[str, Any]]:
+        """
+        Parse as many tokens of `buffer` as possible, keeping an incomplete
+        trailing token pending (unless `final`).
+        """
+        events = []
+        stack = self._stack
+        state = self._state
+        pos = 0
+        end = len(buffer)
+        while True:
+            while pos < end and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos == end:
+                break
+            if state == _DONE:
+                raise self._error("extra data after the document", pos)
+            char = buffer[pos]
+
+            if char == '"':
+                close = self._string_end(buffer, pos)
+                if close < 0:
+                    break
+                raw = buffer[pos + 1:close]
+                control = _CONTROL.search(raw)
+                if control is not None:
+                    raise self._error("invalid control character in string", pos + 1 + control.start())
+                value = json.loads(buffer[pos:close + 1]) if "\\" in raw else raw
+                pos = close + 1
+                if state == _KEY or state == _KEY_OR_END:
+                    events.append(("map_key", value))
+                    state = _COLON
+                    continue
+
+            elif char == "{" or char == "[":
+                if state != _VALUE and state != _VALUE_OR_END:
+                    raise self._error(f"unexpected {char!r}", pos)
+                stack.append(char)
+                if char == "{":
+                    events.append(("start_map", None))
+                    state = _KEY_OR_END
+                else:
+                    events.append(("start_array", None))
+                    state = _VALUE_OR_END
+                pos += 1
+                continue
+
+            elif char == "}" or char == "]":
+                opening, allowed = ("{", _KEY_OR_END) if char == "}" else ("[", _VALUE_OR_END)
+                if not stack or stack[-1] != opening or (state != allowed and state != _COMMA_OR_END):
+                    raise self._error(f"unexpected {char!r}", pos)
+                stack.pop()
+                events.append(("end_map" if char == "}" else "end_array", None))
+                state = _COMMA_OR_END if stack else _DONE
+                pos += 1
+                continue
+
+            elif char == ":" or char == ",":
+                if char == ":" and state == _COLON:
+                    state = _VALUE
+                elif char == "," and state == _COMMA_OR_END:
+                    state = _KEY if stack[-1] == "{" else _VALUE
+                else:
+                    raise self._error(f"unexpected {char!r}", pos)
+                pos += 1
+                continue
+
+            elif char in _DIGITS:
+                run = _NUMBER_RUN.match(buffer, pos).end()
+                if run == end and not final:
+                    # The number may go on in the next chunk
+                    break
+                token = buffer[pos:run]
+                if _NUMBER.fullmatch(token) is None:
+                    raise self._error(f"invalid number {token!r}", pos)
+                value = float(token) if "." in token or "e" in token or "E" in token else int(token)
+                pos = run
+
+            else:
+                for literal, value in _LITERALS:
+                    if buffer.startswith(literal, pos):
+                        pos += len(literal)
+                        break
+                else:
+                    if not final and any(literal.startswith(buffer[pos:]) for literal, _ in _LITERALS):
+                        break
+                    raise self._error(f"unexpected {char!r}", pos)
+
+            # A complete scalar value
+            if state != _VALUE and state != _VALUE_OR_END:
+                raise self._error("unexpected value", pos)
+            events.append(("value", value))
+            state = _COMMA_OR_END if stack else _DONE
+
+        self._offset += pos
+        self._pending = [buffer[pos:]] if pos < end else []
+        self._state = state
+        return events
+
+# What a value is checked against, as the first item of an expectation:
+# the root object, a nested field, an array item schema, an array field,
+# a primitive field or a primitive array item
+_ROOT, _NESTED, _ITEMS, _ARRAY, _FIELD, _ITEM = range(6)
+
+# Kind of the issue reported for a value of the wrong type, by expectation
+_WRONG_TYPE_KIND = ("object", "type", "object", "type", "type", "item_type")
+
+# Expectations accepting `null` for optional fields
+_OPTIONAL_MODES = frozenset({_NESTED, _ARRAY, _FIELD})
+
+_Expectation = Tuple[int, Optional[BaseField], Any, str, Optional[list]]
+
+def _expectation(field: BaseField) -> _Expectation:
+    """
+    Resolve what the value of `field` is checked against.\n
+    ---
+    ### Args
+    - `field` (`BaseField`): the field.\n
+    ---
+    ### Returns
+    - `_Expectation`: the `(mode, field, target, type_name, checks)` expectation, where `target` is a schema, a runtime type or the array item expectation.
+    """
+    if hasattr(field, "items_type") or get_origin(field.type_) is list:
+        item_type = getattr(field, "items_type", None)
+        if item_type is None and hasattr(field.type_, "__args__"):
+            item_type = field.type_.__args__[0]
+        item = None
+        if isinstance(item_type, type) and issubclass(item_type, Schema):
+            item = (_ITEMS, field, item_type, "dict", None)
+        elif item_type and _runtime_type(item_type) is not None:
+            item = (_ITEM, field, _runtime_type(item_type), _type_name(item_type), None)
+        return (_ARRAY, field, item, "list", None)
+    if hasattr(field, "schema"):
+        return (_NESTED, field, field.schema, "dict", _field_constraints(field))
+    return (_FIELD, field, _runtime_type(field.type_), _type_name(field.type_), _field_constraints(field))
+
+class _Frame:
+    """
+    An object or array being received.
+    """
+    __slots__ = ("container", "key", "expect", "plan", "deferred", "full")
+
+    def __init__(self, container: Union[Dict[str, Any], List[Any]]) -> None:
+        self.container = container
+        # The current key, or the index of the current item
+        self.key: Union[str, int, None] = None if isinstance(container, dict) else -1
+        # The expectation the container is checked against, `None` if its content is not checked
+        self.expect: Optional[_Expectation] = None
+        # The field plan of an object, or the item expectation of an array
+        self.plan: Any = None
+        # The expectation the whole container is checked against once complete
+        self.deferred: Optional[_Expectation] = None
+        # Whether an array was already reported as having too many items
+        self.full = False
+
+class IncrementalValidator:
+    """
+    Validates a JSON document against a schema while it is being received,
+    e.g. from a streamed LLM response. Every key and value is checked as soon
+    as it is complete, so a bad generation can be aborted before it ends.\n
+    Feed text chunks with `feed`, which returns the issues found so far in
+    the chunk, then call `close` to get the validated data.
+    """
+    __slots__ = ("schema", "issues", "_parser", "_frames", "_root", "_plans", "_failed", "_completed")
+
+    def __init__(self, schema: Type[Schema]) -> None:
+        self.schema = schema
+        # Every issue found so far, in document order
+        self.issues: List[ValidationIssue] = []
+        self._parser = _JsonEventParser()
+        self._frames: List[_Frame] = []
+        self._root: Any = None
+        # Field plans by schema, built on first use
+        self._plans: Dict[type, Tuple[Dict[str, _Expectation], Tuple[str, ...]]] = {}
+        self._failed = False
+        # Values completed without issues, as `(path, value)`, when tracked by `iter_fields`
+        self._completed: Optional[List[Tuple[str, Any]]] = None
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether no issue was found so far.
+        """
+        return not self.issues
+
+    def feed(self, chunk: str) -> List[ValidationIssue]:
+        """
+        Validate the next chunk of the document.\n
+        ---
+        ### Args
+        - `chunk` (`str`): the chunk of JSON text.\n
+        ---
+        ### Returns
+        - `List[ValidationIssue]`: the issues found in the chunk.
+        """
+        start = len(self.issues)
+        if not self._failed:
+            try:
+                self._handle(self._parser.feed(chunk))
+            except ValueError as e:
+                self._fail(e)
+        return self.issues[start:]
+
+    def close(self) -> Dict[str, Any]:
+        """
+        End the document and get the validated data.\n
+        ---
+        ### Returns
+        - `Dict[str, Any]`: the validated data. Raises the first issue found, if any, as `validate` does.
+        """
+        if not self._failed:
+            try:
+                self._handle(self._parser.close())
+            except ValueError as e:
+                self._fail(e)
+        if self.issues:
+            raise self.issues[0].to_exception()
+        return self._root
+
+    def _fail(self, error: ValueError) -> None:
+        """
+        Record invalid JSON, and stop checking the document.
+        """
+        _logger.debug("Failed to parse streamed JSON: %s", error)
+        self.issues.append(ValidationIssue("json", self._parts(), actual=str(error)))
+        self._failed = True
+
+    def _parts(self) -> Tuple[Union[str, int], ...]:
+        """
+        Get the path of the current value.
+        """
+        return tuple(frame.key for frame in self._frames)
+
+    def _plan(self, schema: Type[Schema]) -> Tuple[Dict[str, _Expectation], Tuple[str, ...]]:
+        """
+        Get the expectations of the fields of `schema`, by name, and its
+        required field names.
+        """
+        plan = self._plans.get(schema)
+        if plan is None:
+            fields = compile_validator(schema).fields
+            plan = (
+                {name: _expectation(field) for name, field in fields.items()},
+                tuple(schema.get_required_fields())
+            )
+            self._plans[schema] = plan
+        return plan
+
+    def _wrong_type(self, expect: _Expectation, value: Any) -> None:
+        """
+        Report a value of the wrong type.
+        """
+        self.issues.append(ValidationIssue(_WRONG_TYPE_KIND[expect[0]], self._parts(), expect[3], type(value).__name__))
+
+    def _handle(self, events: List[Tuple[str, Any]]) -> None:
+        """
+        Check parser events and build the data they describe.
+        """
+        frames = self._frames
+        for event, value in events:
+            if event == "map_key":
+                frames[-1].key = value
+                continue
+            if event == "end_map" or event == "end_array":
+                frame = frames.pop()
+                self._close(frame)
+                if self._completed is not None and frames and not self.issues:
+                    self._completed.append((_pointer(self._parts()), frame.container))
+                continue
+
+            # A value starts: a scalar, or a container
+            if frames:
+                parent = frames[-1]
+                is_list = isinstance(parent.container, list)
+                if is_list:
+                    parent.key += 1
+                if parent.expect is None:
+                    expect = None
+                elif is_list:
+                    expect = parent.plan
+                    self._check_items_max(parent)
+                else:
+                    expect = parent.plan[0].get(parent.key)
+            else:
+                parent = None
+                expect = (_ROOT, None, self.schema, "dict", None)
+
+            if event == "value":
+                value = self._check(expect, value)
+                if self._completed is not None and frames and not self.issues:
+                    self._completed.append((_pointer(self._parts()), value))
+            else:
+                value = {} if event == "start_map" else []
+                frames.append(self._open(expect, value))
+
+            if parent is None:
+                self._root = value
+            elif isinstance(parent.container, dict):
+                parent.container[parent.key] = value
+            else:
+                parent.container.append(value)
+
+    def _check(self, expect: Optional[_Expectation], value: Any) -> Any:
+        """
+        Check a complete value, returning it as stored (ints are converted for float fields).
+        """
+        if expect is None:
+            return value
+        mode, field, target, _, checks = expect
+        if value is None and mode in _OPTIONAL_MODES and not field.required:
+            return value
+        if mode != _FIELD and mode != _ITEM:
+            self._wrong_type(expect, value)
+            return value
+        if target is not None and not isinstance(value, target):
+            if mode == _FIELD and field.type_ is float and isinstance(value, int):
+                value = float(value)
+            else:
+                self._wrong_type(expect, value)
+                return value
+        if checks:
+            issue = _constraint_issue(field, value, checks)
+            if issue is not None:
+                self.issues.append(issue.prefixed(self._parts()[:-1]))
+        return value
+
+    def _open(self, expect: Optional[_Expectation], container: Union[Dict[str, Any], List[Any]]) -> _Frame:
+        """
+        Start receiving an object or an array.
+        """
+        frame = _Frame(container)
+        if expect is None:
+            return frame
+        mode, _, target, _, _ = expect
+        is_dict = isinstance(container, dict)
+        if mode == _ROOT or mode == _NESTED or mode == _ITEMS:
+            if is_dict:
+                frame.expect = expect
+                frame.plan = self._plan(target)
+            else:
+                self._wrong_type(expect, container)
+        elif mode == _ARRAY:
+            if not is_dict:
+                frame.expect = expect
+                frame.plan = target
+            else:
+                self._wrong_type(expect, container)
+        elif target is None or isinstance(container, target):
+            # The content is only known once complete
+            frame.deferred = expect
+        else:
+            self._wrong_type(expect, container)
+        return frame
+
+    def _check_items_max(self, frame: _Frame) -> None:
+        """
+        Report an array as soon as it has more items than allowed.
+        """
+        items_range = frame.expect[1].items_range
+        if items_range and not frame.full and frame.key + 1 > items_range[1]:
+            frame.full = True
+            self.issues.append(ValidationIssue("items_range", self._parts()[:-1], tuple(items_range), frame.key + 1))
+
+    def _close(self, frame: _Frame) -> None:
+        """
+        Finish receiving an object or an array.
+        """
+        if frame.deferred is not None:
+            self._check(frame.deferred, frame.container)
+            return
+        if frame.expect is None:
+            return
+        mode, field, _, _, checks = frame.expect
+        container = frame.container
+        parts = self._parts()
+        if mode == _ARRAY:
+            if field.items_range and not frame.full and len(container) < field.items_range[0]:
+                self.issues.append(ValidationIssue("items_range", parts, tuple(field.items_range), len(container)))
+            return
+        for name in frame.plan[1]:
+            if name not in container:
+                self.issues.append(ValidationIssue("missing", parts + (name,)))
+        if checks:
+            issue = _constraint_issue(field, container, checks)
+            if issue is not None:
+                self.issues.append(issue.prefixed(parts[:-1]))
+
+    def _drain(self) -> List[Tuple[str, Any]]:
+        """
+        Take the values completed since the last call.
+        """
+        completed = self._completed
+        self._completed = []
+        return completed
+
+def iter_fields(
+        chunks: Iterable[str],
+        schema: Type[Schema]
+    ) -> Iterator[Tuple[str, Any]]:
+    """
+    Consume a stream of JSON text chunks (e.g. LLM output) and yield every
+    field value and array item as soon as it is complete and valid. Nested
+    values come first, followed by the object or array that contains them.\n
+    ---
+    ### Args
+    - `chunks` (`Iterable[str]`): the text chunks.
+    - `schema` (`Type[belso.Schema]`): the schema to validate against.\n
+    ---
+    ### Returns
+    - `Iterator[Tuple[str, Any]]`: `(path, value)` pairs, where `path` is a JSON pointer (e.g. `/items/0/price`). Raises the first issue found, as `validate` does.
+    """
+    validator = IncrementalValidator(schema)
+    validator._completed = []
+    for chunk in chunks:
+        validator.feed(chunk)
+        yield from validator._drain()
+        if validator.issues:
+            raise validator.issues[0].to_exception()
+    validator.close()
+    yield from validator._drain()
+
+async def aiter_fields(
+        chunks: AsyncIterable[str],
+        schema: Type[Schema]
+    ) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    Asynchronous version of `iter_fields`, consuming an async stream of JSON text chunks.\n
+    ---
+    ### Args
+    - `chunks` (`AsyncIterable[str]`): the text chunks.
+    - `schema` (`Type[belso.Schema]`): the schema to validate against.\n
+    ---
+    ### Returns
+    - `AsyncIterator[Tuple[str, Any]]`: `(path, value)` pairs, where `path` is a JSON pointer. Raises the first issue found, as `validate` does.
+    """
+    validator = IncrementalValidator(schema)
+    validator._completed = []
+    async for chunk in chunks:
+        validator.feed(chunk)
+        for completed in validator._drain():
+            yield completed
+        if validator.issues:
+            raise validator.issues[0].to_exception()
+    validator.close()
+    for completed in validator._drain():
+        yield completed
@@ -1,21 +1,154 @@
 # belso.tools.validating
 
-from typing import Any, Dict, Type, Union
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union, get_args, get_origin
 
+import os
+import re
 import json
+import ipaddress
+from pathlib import Path
+from collections import deque
+from itertools import islice
+from threading import local
+from weakref import WeakValueDictionary
+from concurrent.futures import ProcessPoolExecutor
 
 from belso.utils import get_logger
-from belso.core.schema import Schema
+from belso.core.schema import Schema, BaseField
+from belso.core.spec import schema_to_spec, schema_from_spec
+from belso.core.ir import ARRAY, OBJECT, OBJECT_ARRAY, PRIMITIVE, SchemaIR, compile_ir
 
 _logger = get_logger(__name__)
 
+# Nesting depth up to which nested schemas are inlined in a compiled validator
+_MAX_INLINE_DEPTH = 4
+
+# Bytes read at once when validating a JSON Lines stream
+_STREAM_CHUNK_SIZE = 1 << 20
+
+# Schemas with a compiled validator, by id. The validator is stored on its
+# schema class (`_belso_validator`), with the schema graph it was compiled
+# from, so it lives and dies with the class
+_VALIDATED: "WeakValueDictionary[int, type]" = WeakValueDictionary()
+
+# Validators being compiled by the current thread, in order, whose `check` is
+# set once compiled: nested schemas refer to them instead of compiling themselves
+# recursively
+_COMPILING = local()
+
+def _check_fields(
+        data: Union[Dict[str, Any], str],
+        schema: Type[Schema],
+        parse: bool = True
+    ) -> Iterator[Tuple[Any, Type[Schema], str]]:
+    """
+    Check data against the fields of a schema, for `validate_schema`. The
+    data of nested schemas is yielded to be checked before going on, so that
+    nested schemas are checked in order without recursion.\n
+    ---
+    ### Args
+    - `data` (`Union[Dict[str, Any], str]`): the data to validate (either a dict or JSON string).
+    - `schema` (`Type[belso.Schema]`): the schema to validate against.
+    - `parse` (`bool`): whether to parse string data as JSON. Defaults to `True`.\n
+    ---
+    ### Returns
+    - `Iterator[Tuple[Any, Type[belso.Schema], str]]`: the nested data, its schema and the prefix of its error messages.
+    """
+    # Convert string to dict if needed
+    if parse and isinstance(data, str):
+        try:
+            data = json.loads(data)
+        except json.JSONDecodeError as e:
+            _logger.debug("Failed to parse JSON string: %s", e)
+            raise ValueError("Invalid JSON string provided")
+    if not isinstance(data, dict):
+        raise TypeError(f"Expected an object, got {type(data).__name__}.")
+
+    # Check required fields
+    for field_name in schema.get_required_fields():
+        if field_name not in data:
+            raise ValueError(f"Missing required field: {field_name}.")
+
+    # Validate field types
+    for field in schema.fields:
+        if field.name in data:
+            value = data[field.name]
+
+            # Skip None values for non-required fields
+            if value is None and not field.required:
+                continue
+
+            # Handle array fields
+            if hasattr(field, 'items_type') or (hasattr(field.type_, "__origin__") and field.type_.__origin__ is list):
+                if not isinstance(value, list):
+                    raise TypeError(f"Field '{field.name}' expected type list, got {type(value).__name__}.")
+
+                # Check array length constraints if specified
+                if hasattr(field, 'items_range') and field.items_range:
+                    min_items, max_items = field.items_range
+                    if len(value) < min_items:
+                        raise ValueError(f"Array field '{field.name}' must have at least {min_items} items, got {len(value)}.")
+                    if len(value) > max_items:
+                        raise ValueError(f"Array field '{field.name}' must have at most {max_items} items, got {len(value)}.")
+
+                # Get item type for validation
+                item_type = getattr(field, 'items_type', None)
+                if item_type is None and hasattr(field.type_, "__args__"):
+                    item_type = field.type_.__args__[0]
+
+                # Validate each item in the array
+                if item_type:
+                    for i, item in enumerate(value):
+                        # For nested schemas, validate the item first
+                        if isinstance(item_type, type) and issubclass(item_type, Schema):
+                            # Items are data, not JSON documents: strings are not parsed, as by compiled validators
+                            if not isinstance(item, dict):
+                                raise ValueError(f"Invalid item at index {i} in array field '{field.name}': Expected an object, got {type(item).__name__}.")
+                            yield item, item_type, f"Invalid item at index {i} in array field '{field.name}': "
+                        # For primitive types, check type
+                        elif not isinstance(item, item_type):
+                            item_type_name = item_type.__name__ if hasattr(item_type, "__name__") else str(item_type)
+                            raise TypeError(f"Item at index {i} in array field '{field.name}' expected type {item_type_name}, got {type(item).__name__}.")
+
+            # Handle nested schema fields
+            elif hasattr(field, 'schema') and isinstance(value, dict):
+                issue = _constraint_issue(field, value)
+                if issue is not None:
+                    raise issue.to_exception()
+                yield value, field.schema, f"Invalid data for nested field '{field.name}': "
+
+            # Type validation for primitive fields
+            else:
+                if not isinstance(value, field.type_):
+                    # Special case for int/float compatibility
+                    if field.type_ == float and isinstance(value, int):
+                        data[field.name] = float(value)
+                    else:
+                        field_type = field.type_.__name__ if hasattr(field.type_, "__name__") else str(field.type_)
+                        raise TypeError(f"Field '{field.name}' expected type {field_type}, got {type(value).__name__}.")
+
+                # Field constraints (enum, ranges, pattern, format...)
+                issue = _constraint_issue(field, value)
+                if issue is not None:
+                    raise issue.to_exception()
+
+def _log_unexpected(error: Exception) -> None:
+    """
+    Log an error raised while validating, unless it is a validation failure reported to the caller.
+    """
+    if not isinstance(error, (ValueError, TypeError)):
+        _logger.error("Unexpected error during validation: %s", error)
+        _logger.debug("Validation error details", exc_info=True)
+
 @staticmethod
 def validate_schema(
         data: Union[Dict[str, Any], str],
         schema: Type[Schema]
     ) -> Dict[str, Any]:
     """
-    Validate that the provided data conforms to the given schema.\n
+    Validate that the provided data conforms to the given schema.
+    Nested data is checked with an explicit stack, so its depth is not
+    limited by the interpreter's recursion limit.\n
     ---
     ### Args
     - `data` (`Union[Dict[str, Any], str]`): the data to validate (either a dict or JSON string).
@@ -25,114 +158,1164 @@ def validate_schema(
     - `Dict[str, Any]`: the validated data.
      """
     try:
-        schema_name = schema.__name__ if hasattr(schema, "__name__") else "unnamed"
-        _logger.debug(f"Starting validation against schema '{schema_name}'...")
-
         # Convert string to dict if needed
         if isinstance(data, str):
-            _logger.debug("Input data is a string, attempting to parse as JSON...")
             try:
                 data = json.loads(data)
-                _logger.debug("Successfully parsed JSON string.")
             except json.JSONDecodeError as e:
-                _logger.error(f"Failed to parse JSON string: {e}")
-                _logger.debug("JSON parsing error details", exc_info=True)
+                _logger.debug("Failed to parse JSON string: %s", e)
                 raise ValueError("Invalid JSON string provided")
 
-        # Get required fields
-        required_fields = schema.get_required_fields()
-        _logger.debug(f"Schema has {len(required_fields)} required fields: {', '.join(required_fields)}")
-
-        # Check required fields
-        _logger.debug("Checking for required fields...")
-        for field_name in required_fields:
-            if field_name not in data:
-                _logger.error(f"Missing required field: '{field_name}'.")
-                raise ValueError(f"Missing required field: {field_name}.")
-        _logger.debug("All required fields are present.")
-
-        # Validate field types
-        _logger.debug("Validating field types...")
-        for field in schema.fields:
-            if field.name in data:
-                value = data[field.name]
-                field_type = field.type_.__name__ if hasattr(field.type_, "__name__") else str(field.type_)
-
-                # Skip None values for non-required fields
-                if value is None and not field.required:
-                    _logger.debug(f"Field '{field.name}' has None value, which is allowed for optional fields.")
-                    continue
-
-                # Log the field being validated
-                _logger.debug(f"Validating field '{field.name}' with value '{value}' against type '{field_type}'...")
-
-                # Handle array fields
-                if hasattr(field, 'items_type') or (hasattr(field.type_, "__origin__") and field.type_.__origin__ is list):
-                    if not isinstance(value, list):
-                        value_type = type(value).__name__
-                        _logger.error(f"Type mismatch for field '{field.name}': expected list, got '{value_type}'.")
-                        raise TypeError(f"Field '{field.name}' expected type list, got {value_type}.")
-
-                    # Check array length constraints if specified
-                    if hasattr(field, 'items_range') and field.items_range:
-                        min_items, max_items = field.items_range
-                        if len(value) < min_items:
-                            _logger.error(f"Array field '{field.name}' has too few items: {len(value)} < {min_items}")
-                            raise ValueError(f"Array field '{field.name}' must have at least {min_items} items, got {len(value)}.")
-                        if len(value) > max_items:
-                            _logger.error(f"Array field '{field.name}' has too many items: {len(value)} > {max_items}")
-                            raise ValueError(f"Array field '{field.name}' must have at most {max_items} items, got {len(value)}.")
-
-                    # Get item type for validation
-                    item_type = getattr(field, 'items_type', None)
-                    if item_type is None and hasattr(field.type_, "__args__"):
-                        item_type = field.type_.__args__[0]
-
-                    # Validate each item in the array
-                    if item_type:
-                        for i, item in enumerate(value):
-                            # For nested schemas, recursively validate
-                            if isinstance(item_type, type) and issubclass(item_type, Schema):
-                                try:
-                                    # This is where the fix is needed - we need to ensure the validation
-                                    # properly checks types and raises exceptions
-                                    validate_schema(item, item_type)
-                                except Exception as e:
-                                    _logger.error(f"Validation failed for item {i} in array field '{field.name}': {e}")
-                                    raise ValueError(f"Invalid item at index {i} in array field '{field.name}': {e}")
-                            # For primitive types, check type
-                            elif not isinstance(item, item_type):
-                                item_value_type = type(item).__name__
-                                item_type_name = item_type.__name__ if hasattr(item_type, "__name__") else str(item_type)
-                                _logger.error(f"Type mismatch for item {i} in array field '{field.name}': expected '{item_type_name}', got '{item_value_type}'.")
-                                raise TypeError(f"Item at index {i} in array field '{field.name}' expected type {item_type_name}, got {item_value_type}.")
-
-                # Handle nested schema fields
-                elif hasattr(field, 'schema') and isinstance(value, dict):
-                    try:
-                        validate_schema(value, field.schema)
-                    except Exception as e:
-                        _logger.error(f"Validation failed for nested field '{field.name}': {e}")
-                        raise ValueError(f"Invalid data for nested field '{field.name}': {e}")
-
-                # Type validation for primitive fields
-                elif not isinstance(value, field.type_):
-                    # Special case for int/float compatibility
-                    if field.type_ == float and isinstance(value, int):
-                        _logger.debug(f"Converting integer value {value} to float for field '{field.name}'...")
-                        data[field.name] = float(value)
-                    else:
-                        value_type = type(value).__name__
-                        _logger.error(f"Type mismatch for field '{field.name}': expected '{field_type}', got '{value_type}'.")
-                        raise TypeError(f"Field '{field.name}' expected type {field_type}, got {value_type}.")
-                else:
-                    _logger.debug(f"Field '{field.name}' passed type validation.")
+        # The checks in progress, outermost first, with the prefix of their
+        # error messages: nested failures are reported as failures of the
+        # fields leading to them
+        stack = [(_check_fields(data, schema, parse=False), "")]
+        while stack:
+            checks, prefix = stack[-1]
+            try:
+                nested = next(checks, None)
+            except Exception as e:
+                if not prefix:
+                    raise
+                _log_unexpected(e)
+                raise ValueError(f"{prefix}{e}") from e
+            if nested is None:
+                stack.pop()
+            else:
+                item, item_schema, item_prefix = nested
+                stack.append((_check_fields(item, item_schema), prefix + item_prefix))
 
-        _logger.debug("All fields passed validation.")
         return data
 
     except Exception as e:
-        if not isinstance(e, (ValueError, TypeError)):
-            # Only log unexpected errors, as ValueError and TypeError are already logged
-            _logger.error(f"Unexpected error during validation: {e}")
-            _logger.debug("Validation error details", exc_info=True)
+        _log_unexpected(e)
+        raise
+
+def _type_name(type_: Any) -> str:
+    """
+    Get a readable name for a type, as used in validation messages.\n
+    ---
+    ### Args
+    - `type_` (`Any`): the type.\n
+    ---
+    ### Returns
+    - `str`: the type name.
+    """
+    return type_.__name__ if hasattr(type_, "__name__") else str(type_)
+
+def _runtime_type(type_: Any) -> Optional[Union[type, Tuple[type, ...]]]:
+    """
+    Resolve a type annotation to something usable with `isinstance`.\n
+    ---
+    ### Args
+    - `type_` (`Any`): the annotation.\n
+    ---
+    ### Returns
+    - `Optional[Union[type, Tuple[type, ...]]]`: the runtime type(s), or `None` if any value is accepted.
+    """
+    if type_ is Any:
+        return None
+    origin = get_origin(type_)
+    if origin is Union:
+        resolved = tuple(_runtime_type(arg) for arg in get_args(type_))
+        return None if None in resolved else resolved
+    return origin or type_
+
+# Number of trailing path parts locating the failure itself, per issue kind;
+# the parts before them are the enclosing nested fields and array items
+_LEAF_PARTS = {
+    "json": 0, "object": 0, "type": 1, "missing": 1, "items_range": 1, "item_type": 2,
+    "enum": 1, "range": 1, "multiple_of": 1, "length": 1, "pattern": 1, "format": 1, "properties": 1,
+}
+
+# Issue kinds raised as `TypeError`, the others are raised as `ValueError`
+_TYPE_KINDS = frozenset({"object", "type", "item_type"})
+
+# Marks a missing key when collecting every issue of a record
+_ABSENT = object()
+
+def _pointer(parts: Tuple[Union[str, int], ...]) -> str:
+    """
+    Format path parts as a JSON pointer (e.g. `/items/3/price`).
+    """
+    return "".join("/" + str(part).replace("~", "~0").replace("/", "~1") for part in parts)
+
+class ValidationIssue:
+    """
+    A single validation failure. Issues only record where the failure is and
+    what was expected, so creating one is cheap: the message is formatted the
+    first time it is read.\n
+    The `kind` is one of `"json"`, `"object"`, `"type"`, `"item_type"`,
+    `"missing"` or `"items_range"`, or the violated field constraint: `"enum"`,
+    `"range"`, `"multiple_of"`, `"length"`, `"pattern"`, `"format"` or
+    `"properties"`. `parts` locates the failure as a tuple of keys and array
+    indices, from the root of the record.
+    """
+    __slots__ = ("kind", "parts", "expected", "actual", "_message")
+
+    def __init__(
+            self,
+            kind: str,
+            parts: Tuple[Union[str, int], ...],
+            expected: Any = None,
+            actual: Any = None
+        ) -> None:
+        self.kind = kind
+        self.parts = parts
+        self.expected = expected
+        self.actual = actual
+        self._message: Optional[str] = None
+
+    @property
+    def path(self) -> str:
+        """
+        The location of the failure as a JSON pointer (e.g. `/items/3/price`).
+        The root of the record is the empty pointer.
+        """
+        return _pointer(self.parts)
+
+    @property
+    def message(self) -> str:
+        """
+        The description of the failure, without its enclosing fields.
+        """
+        if self._message is None:
+            self._message = self._format()
+        return self._message
+
+    def _format(self) -> str:
+        """
+        Format the message, worded as the errors raised by `validate_schema`.
+        """
+        kind = self.kind
+        if kind == "type":
+            return f"Field '{self.parts[-1]}' expected type {self.expected}, got {self.actual}."
+        if kind == "item_type":
+            return f"Item at index {self.parts[-1]} in array field '{self.parts[-2]}' expected type {self.expected}, got {self.actual}."
+        if kind == "missing":
+            return f"Missing required field: {self.parts[-1]}."
+        if kind == "items_range":
+            min_items, max_items = self.expected
+            if self.actual < min_items:
+                return f"Array field '{self.parts[-1]}' must have at least {min_items} items, got {self.actual}."
+            return f"Array field '{self.parts[-1]}' must have at most {max_items} items, got {self.actual}."
+        if kind == "object":
+            return f"Expected an object, got {self.actual}."
+        if kind == "enum":
+            return f"Field '{self.parts[-1]}' must be one of {list(self.expected)}, got {self.actual!r}."
+        if kind == "range":
+            return f"Field '{self.parts[-1]}' must be {self.expected[0]} {self.expected[1]}, got {self.actual}."
+        if kind == "multiple_of":
+            return f"Field '{self.parts[-1]}' must be a multiple of {self.expected}, got {self.actual}."
+        if kind == "length":
+            return f"Field '{self.parts[-1]}' must have a length {self.expected[0]} {self.expected[1]}, got {self.actual}."
+        if kind == "pattern":
+            return f"Field '{self.parts[-1]}' must match pattern '{self.expected}', got {self.actual!r}."
+        if kind == "format":
+            return f"Field '{self.parts[-1]}' must be a valid {self.expected}, got {self.actual!r}."
+        if kind == "properties":
+            return f"Field '{self.parts[-1]}' must have {self.expected[0]} {self.expected[1]} properties, got {self.actual}."
+        if self.actual is not None:
+            return f"Invalid JSON string provided: {self.actual}"
+        return "Invalid JSON string provided"
+
+    def prefixed(self, parts: Tuple[Union[str, int], ...]) -> "ValidationIssue":
+        """
+        Get a copy of the issue located under `parts`.\n
+        ---
+        ### Args
+        - `parts` (`Tuple[Union[str, int], ...]`): the path parts to prepend.\n
+        ---
+        ### Returns
+        - `ValidationIssue`: the relocated issue.
+        """
+        return ValidationIssue(self.kind, parts + self.parts, self.expected, self.actual)
+
+    def to_exception(self) -> Exception:
+        """
+        Build the exception `validate_schema` raises for this failure, with
+        the message wrapped once per enclosing nested field or array item.\n
+        ---
+        ### Returns
+        - `Exception`: a `TypeError` or `ValueError`.
+        """
+        error = (TypeError if self.kind in _TYPE_KINDS else ValueError)(self.message)
+        # Invalid JSON is reported where parsing stopped, not inside the enclosing fields
+        enclosing = () if self.kind == "json" else self.parts[:len(self.parts) - _LEAF_PARTS[self.kind]]
+        wrappers = []
+        i = 0
+        while i < len(enclosing):
+            name = enclosing[i]
+            if i + 1 < len(enclosing) and isinstance(enclosing[i + 1], int):
+                wrappers.append(f"Invalid item at index {enclosing[i + 1]} in array field '{name}': ")
+                i += 2
+            else:
+                wrappers.append(f"Invalid data for nested field '{name}': ")
+                i += 1
+        if wrappers:
+            error = ValueError("".join(wrappers) + str(error))
+        return error
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.message}" if self.parts else self.message
+
+    def __repr__(self) -> str:
+        return (
+            f"ValidationIssue(kind={self.kind!r}, path={self.path!r}, "
+            f"expected={self.expected!r}, actual={self.actual!r})"
+        )
+
+# Source of the test failing each kind of constraint check, over `{value}` and its operands `{0}`, `{1}`...
+_CONSTRAINT_TESTS = {
+    "in": "{value} not in {0}",
+    "ge": "{value} < {0}",
+    "gt": "{value} <= {0}",
+    "le": "{value} > {0}",
+    "lt": "{value} >= {0}",
+    "mod": "{value} % {0}",
+    "multiple": "{0} < {value} % {1} < {2}",
+    "min_len": "len({value}) < {0}",
+    "max_len": "len({value}) > {0}",
+    "search": "{0}({value}) is None",
+}
+
+# Tolerance of float `multiple_of` checks, relative to the step
+_MULTIPLE_TOLERANCE = 1e-6
+
+# Constraint kinds reporting the size of the value rather than the value itself
+_SIZE_KINDS = frozenset({"length", "properties"})
+
+# Patterns of the string formats that are checked, the others are accepted as is
+_FORMAT_PATTERNS = {
+    "date": r"\d{4}-\d{2}-\d{2}",
+    "time": r"\d{2}:\d{2}:\d{2}(\.\d+)?([Zz]|[+-]\d{2}:\d{2})?",
+    "date-time": r"\d{4}-\d{2}-\d{2}[Tt ]\d{2}:\d{2}:\d{2}(\.\d+)?([Zz]|[+-]\d{2}:\d{2})",
+    "email": r"[^@\s]+@[^@\s]+\.[^@\s]+",
+    "uuid": r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}",
+    "uri": r"[A-Za-z][A-Za-z0-9+.-]*:\S*",
+    "hostname": r"(?=.{1,253}$)[A-Za-z0-9]([A-Za-z0-9-]{0,61}[A-Za-z0-9])?(\.[A-Za-z0-9]([A-Za-z0-9-]{0,61}[A-Za-z0-9])?)*",
+}
+
+# Matchers of the string formats, compiled on first use
+_FORMAT_MATCHERS: Dict[str, Callable[[str], Any]] = {}
+
+def _ip_matcher(version: int) -> Callable[[str], Any]:
+    """
+    Build the matcher of an IP address format.
+    """
+    def match(value: str) -> Any:
+        try:
+            address = ipaddress.ip_address(value)
+        except ValueError:
+            return None
+        return address if address.version == version else None
+    return match
+
+def _format_matcher(format_: str) -> Optional[Callable[[str], Any]]:
+    """
+    Get the matcher of a string format, which like `re.fullmatch` returns
+    `None` for invalid strings.\n
+    ---
+    ### Args
+    - `format_` (`str`): the format name (e.g. `"date-time"`).\n
+    ---
+    ### Returns
+    - `Optional[Callable[[str], Any]]`: the matcher, or `None` for unchecked formats.
+    """
+    if format_ not in _FORMAT_MATCHERS:
+        if format_ in _FORMAT_PATTERNS:
+            _FORMAT_MATCHERS[format_] = re.compile(_FORMAT_PATTERNS[format_]).fullmatch
+        elif format_ in ("ipv4", "ipv6"):
+            _FORMAT_MATCHERS[format_] = _ip_matcher(int(format_[-1]))
+        else:
+            return None
+    return _FORMAT_MATCHERS[format_]
+
+def _field_constraints(field: BaseField) -> List[Tuple[str, Any, str, Tuple[Any, ...]]]:
+    """
+    Resolve the constraints of a field into checks with precompiled operands:
+    enums become sets, patterns are compiled and bounds are split into single
+    comparisons. Constraints that do not apply to the field type are ignored.\n
+    ---
+    ### Args
+    - `field` (`BaseField`): the field.\n
+    ---
+    ### Returns
+    - `List[Tuple[str, Any, str, Tuple[Any, ...]]]`: the `(kind, expected, test, operands)` checks, where `test` is a key of `_CONSTRAINT_TESTS`.
+    """
+    checks = []
+    type_ = field.type_
+
+    if field.enum is not None:
+        # Values of other types may be unhashable, so they are looked up in a tuple
+        values = tuple(field.enum)
+        if type_ in (str, int, float, bool):
+            try:
+                values = frozenset(values)
+            except TypeError:
+                pass
+        checks.append(("enum", tuple(field.enum), "in", (values,)))
+
+    if type_ in (int, float):
+        low, high = field.range_ or (None, None)
+        exclusive = field.exclusive_range or (None, None)
+        # Booleans make the `range_` bounds exclusive, numbers are exclusive bounds of their own
+        low_flag, high_flag = (isinstance(bound, bool) and bound for bound in exclusive)
+        if low is not None:
+            checks.append(("range", (">" if low_flag else ">=", low), "gt" if low_flag else "ge", (low,)))
+        if high is not None:
+            checks.append(("range", ("<" if high_flag else "<=", high), "lt" if high_flag else "le", (high,)))
+        if exclusive[0] is not None and not isinstance(exclusive[0], bool):
+            checks.append(("range", (">", exclusive[0]), "gt", (exclusive[0],)))
+        if exclusive[1] is not None and not isinstance(exclusive[1], bool):
+            checks.append(("range", ("<", exclusive[1]), "lt", (exclusive[1],)))
+        if field.multiple_of:
+            if type_ is int and float(field.multiple_of).is_integer():
+                # Exact for integers, whatever their size
+                checks.append(("multiple_of", field.multiple_of, "mod", (int(field.multiple_of),)))
+            else:
+                # The remainder must be within the tolerance of 0 or of the step
+                step = abs(field.multiple_of)
+                tolerance = step * _MULTIPLE_TOLERANCE
+                checks.append(("multiple_of", field.multiple_of, "multiple", (tolerance, step, step - tolerance)))
+
+    elif type_ is str:
+        low, high = field.length_range or (None, None)
+        if low is not None:
+            checks.append(("length", (">=", low), "min_len", (low,)))
+        if high is not None:
+            checks.append(("length", ("<=", high), "max_len", (high,)))
+        if field.regex is not None:
+            checks.append(("pattern", field.regex, "search", (re.compile(field.regex).search,)))
+        if field.format_ is not None:
+            match = _format_matcher(field.format_)
+            if match is not None:
+                checks.append(("format", field.format_, "search", (match,)))
+
+    elif type_ is dict and field.properties_range:
+        low, high = field.properties_range
+        if low is not None:
+            checks.append(("properties", (">=", low), "min_len", (low,)))
+        if high is not None:
+            checks.append(("properties", ("<=", high), "max_len", (high,)))
+
+    return checks
+
+# The constraint tests as functions, for the interpreted `validate_schema`
+_CONSTRAINT_VIOLATED = {
+    test: eval(f"lambda value, operands: {source.format(*(f'operands[{i}]' for i in range(3)), value='value')}")
+    for test, source in _CONSTRAINT_TESTS.items()
+}
+
+def _constraint_issue(
+        field: BaseField,
+        value: Any,
+        checks: Optional[List[Tuple[str, Any, str, Tuple[Any, ...]]]] = None
+    ) -> Optional[ValidationIssue]:
+    """
+    Find the first constraint of `field` violated by `value`, without compiling the field.\n
+    ---
+    ### Args
+    - `field` (`BaseField`): the field.
+    - `value` (`Any`): a value of the field type.
+    - `checks` (`Optional[List[Tuple[str, Any, str, Tuple[Any, ...]]]]`): the checks from `_field_constraints`, if already resolved. Defaults to `None`.\n
+    ---
+    ### Returns
+    - `Optional[ValidationIssue]`: the issue, or `None` if every constraint holds.
+    """
+    if checks is None:
+        checks = _field_constraints(field)
+    for kind, expected, test, operands in checks:
+        if _CONSTRAINT_VIOLATED[test](value, operands):
+            return ValidationIssue(kind, (field.name,), expected, len(value) if kind in _SIZE_KINDS else value)
+    return None
+
+def _missing_issue(
+        parts: Tuple[Union[str, int], ...],
+        data: Dict[str, Any],
+        required: Tuple[str, ...]
+    ) -> ValidationIssue:
+    """
+    Build the issue for the first required field missing from `data`.
+    """
+    missing = next(name for name in required if name not in data)
+    return ValidationIssue("missing", parts + (missing,))
+
+def _item_type_issue(
+        parts: Tuple[Union[str, int], ...],
+        item_type: Any,
+        type_name: str,
+        value: list
+    ) -> ValidationIssue:
+    """
+    Build the issue for the first array item of the wrong type.
+    """
+    index, item = next((i, item) for i, item in enumerate(value) if not isinstance(item, item_type))
+    return ValidationIssue("item_type", parts + (index,), type_name, type(item).__name__)
+
+class _CodeGenerator:
+    """
+    Emits the source of a check function for a schema. Nested schemas and
+    array items are inlined into the parent function, so checking a record
+    runs as straight-line code with every constant pre-bound.\n
+    By default the function returns the first `ValidationIssue` found, or
+    `None`. With `collect`, it returns the list of every issue instead.
+    """
+    __slots__ = ("ir", "namespace", "lines", "collect", "_counter", "_path")
+
+    def __init__(self, ir: SchemaIR, collect: bool = False) -> None:
+        self.ir = ir
+        self.namespace: Dict[str, Any] = {
+            "_Issue": ValidationIssue,
+            "_missing_issue": _missing_issue,
+            "_item_type_issue": _item_type_issue,
+            "_ABSENT": _ABSENT,
+        }
+        self.lines = []
+        self.collect = collect
+        self._counter = 0
+        # Source expressions of the path parts leading to the data being checked
+        self._path = []
+
+    def bind(self, value: Any) -> str:
+        """
+        Bind a constant in the generated function's namespace.\n
+        ---
+        ### Args
+        - `value` (`Any`): the constant.\n
+        ---
+        ### Returns
+        - `str`: the name under which the constant is reachable.
+        """
+        self._counter += 1
+        name = f"_c{self._counter}"
+        self.namespace[name] = value
+        return name
+
+    def emit(self, line: str, indent: int) -> None:
+        """
+        Append a source line at the given indentation level.
+        """
+        self.lines.append("    " * indent + line)
+
+    def parts(self, *extra: str) -> str:
+        """
+        Get the source of the path parts tuple of the current location,
+        followed by `extra`.
+        """
+        parts = self._path + list(extra)
+        return f"({', '.join(parts)},)" if parts else "()"
+
+    def fail(self, issue: str, indent: int) -> None:
+        """
+        Emit the reporting of `issue`: returned, or appended to the
+        collected issues.
+        """
+        self.emit(f"append({issue})" if self.collect else f"return {issue}", indent)
+
+    def check(self, condition: str, issue: str, indent: int) -> None:
+        """
+        Emit a check reporting `issue` when `condition` holds.
+        """
+        self.emit(f"if {condition}:", indent)
+        self.fail(issue, indent + 1)
+
+    def guard(self, condition: str, issue: str, indent: int) -> int:
+        """
+        Emit a check that the following code relies on, reporting `issue`
+        when `condition` holds.\n
+        ---
+        ### Returns
+        - `int`: the indentation level of the code run only if the check passed.
+        """
+        self.check(condition, issue, indent)
+        if not self.collect:
+            return indent
+        self.emit("else:", indent)
+        return indent + 1
+
+    def constraints(
+            self,
+            field: BaseField,
+            value: str,
+            indent: int
+        ) -> None:
+        """
+        Emit the constraint checks of a field, on a value already known to be
+        of the field type. Operands are bound as constants, so each check is a
+        single comparison, set lookup or pattern search.\n
+        ---
+        ### Args
+        - `field` (`BaseField`): the field.
+        - `value` (`str`): the variable holding the field value.
+        - `indent` (`int`): the indentation level.
+        """
+        parts = self.parts(repr(field.name))
+        for kind, expected, test, operands in _field_constraints(field):
+            actual = f"len({value})" if kind in _SIZE_KINDS else value
+            self.check(
+                _CONSTRAINT_TESTS[test].format(*map(self.bind, operands), value=value),
+                f"_Issue({kind!r}, {parts}, {self.bind(expected)}, {actual})",
+                indent
+            )
+
+    def call(
+            self,
+            schema: Type[Schema],
+            var: str,
+            indent: int,
+            depth: int
+        ) -> None:
+        """
+        Emit a call to the compiled check of `schema` on the data held by `var`.\n
+        ---
+        ### Args
+        - `schema` (`Type[belso.Schema]`): the schema to check against.
+        - `var` (`str`): the variable holding the data.
+        - `indent` (`int`): the indentation level.
+        - `depth` (`int`): the nesting depth, used to name local variables.
+        """
+        validator = self.bind(compile_validator(schema))
+        if self.collect:
+            self.emit(f"for issue in {validator}._collect({var}):", indent)
+            self.emit(f"append(issue.prefixed({self.parts()}))", indent + 1)
+        else:
+            issue = f"e{depth}"
+            self.emit(f"{issue} = {validator}.check({var})", indent)
+            self.check(f"{issue} is not None", f"{issue}.prefixed({self.parts()})", indent)
+
+    def schema(
+            self,
+            index: int,
+            var: str,
+            indent: int,
+            depth: int,
+            is_dict: bool = False
+        ) -> None:
+        """
+        Emit the checks of the dict held by `var` against a schema of the
+        graph. Past `_MAX_INLINE_DEPTH`, the schema's own compiled check is
+        called instead of being inlined.\n
+        ---
+        ### Args
+        - `index` (`int`): the number of the schema to check against.
+        - `var` (`str`): the variable holding the data.
+        - `indent` (`int`): the indentation level.
+        - `depth` (`int`): the nesting depth, used to name local variables.
+        - `is_dict` (`bool`): whether `var` is already known to be a dict. Defaults to `False`.
+        """
+        if depth > _MAX_INLINE_DEPTH:
+            self.call(self.ir.schemas[index], var, indent, depth)
+            return
+
+        value = f"v{depth}"
+        if not is_dict:
+            indent = self.guard(
+                f"not isinstance({var}, dict)",
+                f"_Issue('object', {self.parts()}, 'dict', type({var}).__name__)",
+                indent
+            )
+        ir = self.ir
+        required = ir.required[index]
+        if required and not self.collect:
+            presence = " and ".join(f"{name!r} in {var}" for name in required)
+            self.check(f"not ({presence})", f"_missing_issue({self.parts()}, {var}, {self.bind(required)})", indent)
+
+        for row in ir.rows(index):
+            name = repr(ir.names[row])
+            if ir.fields[row].required and self.collect:
+                self.emit(f"{value} = {var}.get({name}, _ABSENT)", indent)
+                inner = self.guard(f"{value} is _ABSENT", f"_Issue('missing', {self.parts(name)})", indent)
+                self.field(row, var, value, inner, depth)
+            elif ir.fields[row].required:
+                self.emit(f"{value} = {var}[{name}]", indent)
+                self.field(row, var, value, indent, depth)
+            else:
+                # Missing and `None` values are both accepted for optional fields
+                self.emit(f"{value} = {var}.get({name})", indent)
+                self.emit(f"if {value} is not None:", indent)
+                self.field(row, var, value, indent + 1, depth)
+
+    def field(
+            self,
+            row: int,
+            var: str,
+            value: str,
+            indent: int,
+            depth: int
+        ) -> None:
+        """
+        Emit the checks for the value of a single field.\n
+        ---
+        ### Args
+        - `row` (`int`): the row of the field in the schema graph.
+        - `var` (`str`): the variable holding the parent dict.
+        - `value` (`str`): the variable holding the field value.
+        - `indent` (`int`): the indentation level.
+        - `depth` (`int`): the nesting depth.
+        """
+        field, kind = self.ir.fields[row], self.ir.kinds[row]
+        name = repr(field.name)
+        parts = self.parts(name)
+
+        # Arrays, including plain fields typed as `List[...]`
+        if kind == ARRAY or kind == OBJECT_ARRAY or (kind == PRIMITIVE and get_origin(field.type_) is list):
+            item_type = self.ir.types[row] if kind != PRIMITIVE else None
+            if item_type is None and hasattr(field.type_, "__args__"):
+                item_type = field.type_.__args__[0]
+            indent = self.guard(
+                f"not isinstance({value}, list)",
+                f"_Issue('type', {parts}, 'list', type({value}).__name__)",
+                indent
+            )
+            if field.items_range:
+                low, high = self.bind(field.items_range[0]), self.bind(field.items_range[1])
+                self.check(
+                    f"not {low} <= len({value}) <= {high}",
+                    f"_Issue('items_range', {parts}, ({low}, {high}), len({value}))",
+                    indent
+                )
+            if kind == OBJECT_ARRAY:
+                index, item = f"i{depth}", f"d{depth + 1}"
+                self.emit(f"for {index}, {item} in enumerate({value}):", indent)
+                self._path += [name, index]
+                self.schema(self.ir.children[row], item, indent + 1, depth + 1)
+                del self._path[-2:]
+            elif isinstance(item_type, type) and issubclass(item_type, Schema):
+                # Schemas of plain `List[...]` fields are not part of the graph
+                index, item = f"i{depth}", f"d{depth + 1}"
+                self.emit(f"for {index}, {item} in enumerate({value}):", indent)
+                self._path += [name, index]
+                self.call(item_type, item, indent + 1, depth + 1)
+                del self._path[-2:]
+            elif item_type and _runtime_type(item_type) is not None:
+                runtime_type = self.bind(_runtime_type(item_type))
+                type_name = repr(_type_name(item_type))
+                if self.collect:
+                    index = f"i{depth}"
+                    self.emit(f"for {index}, item in enumerate({value}):", indent)
+                    self.check(
+                        f"not isinstance(item, {runtime_type})",
+                        f"_Issue('item_type', {self.parts(name, index)}, {type_name}, type(item).__name__)",
+                        indent + 1
+                    )
+                else:
+                    self.emit(f"for item in {value}:", indent)
+                    self.check(
+                        f"not isinstance(item, {runtime_type})",
+                        f"_item_type_issue({parts}, {runtime_type}, {type_name}, {value})",
+                        indent + 1
+                    )
+
+        # Nested schemas
+        elif kind == OBJECT:
+            indent = self.guard(
+                f"not isinstance({value}, dict)",
+                f"_Issue('type', {parts}, 'dict', type({value}).__name__)",
+                indent
+            )
+            self.constraints(field, value, indent)
+            nested = f"d{depth + 1}"
+            self.emit(f"{nested} = {value}", indent)
+            self._path.append(name)
+            self.schema(self.ir.children[row], nested, indent, depth + 1, is_dict=True)
+            self._path.pop()
+
+        # Primitives
+        else:
+            runtime_type = _runtime_type(field.type_)
+            issue = f"_Issue('type', {parts}, {_type_name(field.type_)!r}, type({value}).__name__)"
+            start = len(self.lines)
+            if runtime_type is None:
+                # Any value is accepted, only the constraints are checked
+                pass
+            elif field.type_ is float and self.collect:
+                # Integers are accepted for float fields and converted in place
+                indent = self.guard(f"not isinstance({value}, {self.bind((float, int))})", issue, indent)
+                self.emit(f"if not isinstance({value}, float):", indent)
+                self.emit(f"{var}[{name}] = float({value})", indent + 1)
+            elif field.type_ is float:
+                self.emit(f"if not isinstance({value}, {self.bind(runtime_type)}):", indent)
+                self.emit(f"if isinstance({value}, int):", indent + 1)
+                self.emit(f"{var}[{name}] = float({value})", indent + 2)
+                self.emit("else:", indent + 1)
+                self.fail(issue, indent + 2)
+            else:
+                indent = self.guard(f"not isinstance({value}, {self.bind(runtime_type)})", issue, indent)
+            self.constraints(field, value, indent)
+            if len(self.lines) == start or self.lines[-1].endswith("else:"):
+                self.emit("pass", indent)
+
+def _compile_schema(
+        schema: Type[Schema],
+        collect: bool = False
+    ) -> Callable[[Any], Any]:
+    """
+    Generate a check function for parsed data. Required keys, runtime
+    types, items ranges and nested schemas are resolved once and inlined
+    into straight-line Python code.\n
+    ---
+    ### Args
+    - `schema` (`Type[belso.Schema]`): the schema to compile.
+    - `collect` (`bool`): whether to report every issue rather than the first one. Defaults to `False`.\n
+    ---
+    ### Returns
+    - `Callable[[Any], Any]`: a function returning the first `ValidationIssue` found in the data (or `None`), or the list of every issue with `collect`.
+    """
+    generator = _CodeGenerator(compile_ir(schema), collect)
+    if collect:
+        generator.emit("def check(d0):", 0)
+        generator.emit("issues = []", 1)
+        generator.emit("append = issues.append", 1)
+        generator.schema(0, "d0", 1, 0)
+        generator.emit("return issues", 1)
+    else:
+        generator.emit("def check(d0):", 0)
+        generator.schema(0, "d0", 1, 0)
+        generator.emit("return None", 1)
+    source = "\n".join(generator.lines)
+    exec(compile(source, f"<belso validator {_type_name(schema)}>", "exec"), generator.namespace)
+    return generator.namespace["check"]
+
+def _parse_json(data: Union[str, bytes]) -> Tuple[Any, Optional[ValidationIssue]]:
+    """
+    Parse a JSON record, returning the parsing failure instead of raising it.\n
+    ---
+    ### Args
+    - `data` (`Union[str, bytes]`): the JSON document.\n
+    ---
+    ### Returns
+    - `Tuple[Any, Optional[ValidationIssue]]`: the parsed data and the issue, if any.
+    """
+    try:
+        return json.loads(data), None
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        _logger.debug("Failed to parse JSON string: %s", e)
+        return None, ValidationIssue("json", ())
+
+def _iter_lines(
+        stream: IO,
+        chunk_size: int
+    ) -> Iterator[bytes]:
+    """
+    Split a stream into lines, reading it in chunks of `chunk_size` bytes.
+    Only the current chunk and the trailing partial line are held in memory.\n
+    ---
+    ### Args
+    - `stream` (`IO`): a binary (or text) file-like object.
+    - `chunk_size` (`int`): the number of bytes to read at once.\n
+    ---
+    ### Returns
+    - `Iterator[bytes]`: the lines, without their newline.
+    """
+    tail = b""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        lines = (tail + chunk).split(b"\n")
+        tail = lines.pop()
+        yield from lines
+    if tail:
+        yield tail
+
+class RecordError:
+    """
+    A record rejected by batch validation, with its position in the batch.
+    """
+    __slots__ = ("index", "error")
+
+    def __init__(
+            self,
+            index: int,
+            error: ValidationIssue
+        ) -> None:
+        self.index = index
+        self.error = error
+
+    @property
+    def message(self) -> str:
+        """
+        The validation error message, prefixed with its path.
+        """
+        return str(self.error)
+
+    def __repr__(self) -> str:
+        return f"RecordError(index={self.index}, error={self.error!r})"
+
+class BatchValidationResult:
+    """
+    The outcome of validating a batch of records: the valid records, in
+    input order, and one `RecordError` per rejected record.
+    """
+    __slots__ = ("valid", "errors")
+
+    def __init__(
+            self,
+            valid: List[Dict[str, Any]],
+            errors: List[RecordError]
+        ) -> None:
+        self.valid = valid
+        self.errors = errors
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether every record in the batch is valid.
+        """
+        return not self.errors
+
+    def __repr__(self) -> str:
+        return f"BatchValidationResult(valid={len(self.valid)}, errors={len(self.errors)})"
+
+class CompiledValidator:
+    """
+    A validator specialized for a single schema, built by `compile_validator`.
+    Calling it accepts the same inputs and raises the same errors as
+    `validate_schema`, without re-interpreting the schema on every call.
+    """
+    __slots__ = ("schema", "fields", "check", "_collector", "__weakref__")
+
+    def __init__(
+            self,
+            schema: Type[Schema],
+            check: Optional[Callable[[Any], Optional[ValidationIssue]]]
+        ) -> None:
+        self.schema = schema
+        # The schema fields by name
+        self.fields: Dict[str, BaseField] = {field.name: field for field in schema.fields}
+        # Returns the first issue found in parsed data, or `None`, without raising
+        self.check = check
+        # Collects every issue of parsed data, compiled on first use
+        self._collector: Optional[Callable[[Any], List[ValidationIssue]]] = None
+
+    def __call__(self, data: Union[Dict[str, Any], str]) -> Dict[str, Any]:
+        """
+        Validate `data` against the compiled schema.\n
+        ---
+        ### Args
+        - `data` (`Union[Dict[str, Any], str]`): the data to validate (either a dict or JSON string).\n
+        ---
+        ### Returns
+        - `Dict[str, Any]`: the validated data.
+        """
+        if isinstance(data, str):
+            data, issue = _parse_json(data)
+            if issue is not None:
+                raise issue.to_exception()
+        issue = self.check(data)
+        if issue is not None:
+            raise issue.to_exception()
+        return data
+
+    def _collect(self, data: Any) -> List[ValidationIssue]:
+        """
+        Collect every issue of parsed data, compiling the collecting check on first use.
+        """
+        if self._collector is None:
+            self._collector = _compile_schema(self.schema, collect=True)
+        return self._collector(data)
+
+    def errors(self, data: Union[Dict[str, Any], str]) -> List[ValidationIssue]:
+        """
+        Find every violation in `data` in a single pass, instead of stopping
+        at the first one. A value of the wrong type is reported once, without
+        checking what it contains.\n
+        ---
+        ### Args
+        - `data` (`Union[Dict[str, Any], str]`): the data to validate (either a dict or JSON string).\n
+        ---
+        ### Returns
+        - `List[ValidationIssue]`: the issues, in schema field order. Empty if the data is valid.
+        """
+        if isinstance(data, str):
+            data, issue = _parse_json(data)
+            if issue is not None:
+                return [issue]
+        return self._collect(data)
+
+    def validate_many(self, records: Iterable[Union[Dict[str, Any], str]]) -> BatchValidationResult:
+        """
+        Validate a batch of records, collecting errors instead of raising.\n
+        ---
+        ### Args
+        - `records` (`Iterable[Union[Dict[str, Any], str]]`): the records to validate (dicts or JSON strings).\n
+        ---
+        ### Returns
+        - `BatchValidationResult`: the valid records and the per-index errors.
+        """
+        check = self.check
+        valid = []
+        errors = []
+        for index, data in enumerate(records):
+            if isinstance(data, str):
+                data, error = _parse_json(data)
+                if error is None:
+                    error = check(data)
+            else:
+                error = check(data)
+            if error is None:
+                valid.append(data)
+            else:
+                errors.append(RecordError(index, error))
+        return BatchValidationResult(valid, errors)
+
+    def validate_stream(
+            self,
+            source: Union[str, Path, IO],
+            chunk_size: int = _STREAM_CHUNK_SIZE,
+            valid_sink: Optional[IO] = None,
+            invalid_sink: Optional[IO] = None
+        ) -> Iterator[Union[Dict[str, Any], RecordError]]:
+        """
+        Validate a JSON Lines (NDJSON) source record by record. The source is
+        read in chunks, so memory use does not depend on its size.\n
+        ---
+        ### Args
+        - `source` (`Union[str, Path, IO]`): a path, or a binary file-like object.
+        - `chunk_size` (`int`): the number of bytes read at once. Defaults to 1 MiB.
+        - `valid_sink` (`Optional[IO]`): a binary file-like object receiving the raw valid lines. Defaults to `None`.
+        - `invalid_sink` (`Optional[IO]`): a binary file-like object receiving the raw invalid lines. Defaults to `None`.\n
+        ---
+        ### Returns
+        - `Iterator[Union[Dict[str, Any], RecordError]]`: each validated record, or a `RecordError` whose index is the 0-based line number. Blank lines are skipped.
+        """
+        if isinstance(source, (str, Path)):
+            with open(source, "rb") as stream:
+                yield from self.validate_stream(stream, chunk_size, valid_sink, invalid_sink)
+            return
+
+        check = self.check
+        for index, line in enumerate(_iter_lines(source, chunk_size)):
+            if not line.strip():
+                continue
+            data, error = _parse_json(line)
+            if error is None:
+                error = check(data)
+            if error is None:
+                if valid_sink is not None:
+                    valid_sink.write(line + b"\n")
+                yield data
+            else:
+                if invalid_sink is not None:
+                    invalid_sink.write(line + b"\n")
+                yield RecordError(index, error)
+
+def compile_validator(schema: Type[Schema]) -> CompiledValidator:
+    """
+    Compile `schema` into a reusable validator. The result is cached on the
+    schema and rebuilt when the compiled graph of the schema is (see
+    `belso.core.ir.compile_ir`): if a `fields` list of the schema or of a
+    nested schema is replaced or mutated.
+    Recursive schemas are supported: nested schemas are inlined up to a fixed
+    depth, then checked by calling their own validator, compiled along
+    without recursing however deep the schema is.\n
+    ---
+    ### Args
+    - `schema` (`Type[belso.Schema]`): the schema to compile.\n
+    ---
+    ### Returns
+    - `CompiledValidator`: the compiled validator.
+    """
+    cached = schema.__dict__.get("_belso_validator")
+    if cached is not None and cached[0] is compile_ir(schema):
+        return cached[1]
+
+    compiling = getattr(_COMPILING, "validators", None)
+    if compiling is None:
+        compiling = _COMPILING.validators = {}
+    validator = compiling.get(schema)
+    if validator is not None:
+        # Reached again through a nested field: the generated code calls its
+        # `check` at run time, when it is compiled
+        return validator
+
+    validator = CompiledValidator(schema, None)
+    if compiling:
+        # Deferred by the schema being compiled, which calls the validators of
+        # deeply nested schemas: they are compiled in turn, not recursively
+        compiling[schema] = validator
+        return validator
+
+    compiling[schema] = validator
+    try:
+        # Compiling a schema may defer more nested schemas
+        compiled = 0
+        while compiled < len(compiling):
+            pending = list(compiling.values())[compiled]
+            compiled += 1
+            _logger.debug("Compiling validator for schema '%s'...", _type_name(pending.schema))
+            pending.check = _compile_schema(pending.schema)
+            type.__setattr__(pending.schema, "_belso_validator", (compile_ir(pending.schema), pending))
+            _VALIDATED[id(pending.schema)] = pending.schema
+    finally:
+        compiling.clear()
+    return validator
+
+def clear_validators(schema: Optional[Type[Schema]] = None) -> int:
+    """
+    Drop the compiled validators of the schemas that nest a schema, or are
+    the schema, e.g. after changing the attributes of its fields in place.\n
+    ---
+    ### Args
+    - `schema` (`Optional[Type[belso.Schema]]`): the schema. Defaults to `None` (every validator).\n
+    ---
+    ### Returns
+    - `int`: the number of dropped validators.
+    """
+    stale = []
+    for validated in list(_VALIDATED.values()):
+        cached = validated.__dict__.get("_belso_validator")
+        if cached is not None and (schema is None or schema in cached[0].indices):
+            stale.append(validated)
+    for validated in stale:
+        type.__delattr__(validated, "_belso_validator")
+        _VALIDATED.pop(id(validated), None)
+    return len(stale)
+
+# Validator of the current pool worker, set once by `_init_worker`
+_worker_validator: Optional[CompiledValidator] = None
+
+def _init_worker(spec: Dict[str, Any]) -> None:
+    """
+    Pool initializer: rebuild the schema from its spec and compile it, once per worker.\n
+    ---
+    ### Args
+    - `spec` (`Dict[str, Any]`): the schema spec, from `belso.core.spec.schema_to_spec`.
+    """
+    global _worker_validator
+    _worker_validator = compile_validator(schema_from_spec(spec))
+
+def _validate_chunk(records: List[Union[Dict[str, Any], str]]) -> BatchValidationResult:
+    """
+    Pool task: validate a chunk of records with the worker's validator.\n
+    ---
+    ### Args
+    - `records` (`List[Union[Dict[str, Any], str]]`): the chunk.\n
+    ---
+    ### Returns
+    - `BatchValidationResult`: the chunk result, indexed from the start of the chunk.
+    """
+    return _worker_validator.validate_many(records)
+
+def _validate_parallel(
+        records: Iterable[Union[Dict[str, Any], str]],
+        schema: Type[Schema],
+        workers: Optional[int],
+        chunk_size: int
+    ) -> BatchValidationResult:
+    """
+    Validate records in chunks on a process pool, merging the chunk results
+    in input order. At most two chunks per worker are in flight at a time.\n
+    ---
+    ### Args
+    - `records` (`Iterable[Union[Dict[str, Any], str]]`): the records to validate.
+    - `schema` (`Type[belso.Schema]`): the schema to validate against.
+    - `workers` (`Optional[int]`): the number of processes, or `None` for one per CPU.
+    - `chunk_size` (`int`): the number of records sent to a worker at once.\n
+    ---
+    ### Returns
+    - `BatchValidationResult`: the merged result.
+    """
+    workers = workers or os.cpu_count() or 1
+    valid = []
+    errors = []
+    iterator = iter(records)
+    pending = deque()
+    offset = 0
+
+    def collect(future, start: int) -> None:
+        result = future.result()
+        valid.extend(result.valid)
+        for error in result.errors:
+            error.index += start
+            errors.append(error)
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(schema_to_spec(schema),)
+    ) as executor:
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            pending.append((executor.submit(_validate_chunk, chunk), offset))
+            offset += len(chunk)
+            if len(pending) >= 2 * workers:
+                collect(*pending.popleft())
+        while pending:
+            collect(*pending.popleft())
+
+    return BatchValidationResult(valid, errors)
+
+def validate_many(
+        records: Iterable[Union[Dict[str, Any], str]],
+        schema: Type[Schema],
+        workers: Optional[int] = 1,
+        chunk_size: int = 10_000
+    ) -> BatchValidationResult:
+    """
+    Validate a batch of records against the given schema. The schema is
+    compiled once for the whole batch, and invalid records are reported
+    as `RecordError`s instead of raising.\n
+    With `workers` other than 1, chunks of records are validated on a
+    process pool. Each worker receives the schema once, as a picklable spec,
+    and results are returned in input order.\n
+    ---
+    ### Args
+    - `records` (`Iterable[Union[Dict[str, Any], str]]`): the records to validate (dicts or JSON strings).
+    - `schema` (`Type[belso.Schema]`): the schema to validate against.
+    - `workers` (`Optional[int]`): the number of worker processes, `None` for one per CPU. Defaults to `1` (no pool).
+    - `chunk_size` (`int`): the number of records sent to a worker at once. Defaults to `10_000`.\n
+    ---
+    ### Returns
+    - `BatchValidationResult`: the valid records and the per-index errors.
+    """
+    if workers == 1:
+        return compile_validator(schema).validate_many(records)
+    return _validate_parallel(records, schema, workers, chunk_size)
+
+def validate_stream(
+        source: Union[str, Path, IO],
+        schema: Type[Schema],
+        chunk_size: int = _STREAM_CHUNK_SIZE,
+        valid_sink: Optional[IO] = None,
+        invalid_sink: Optional[IO] = None
+    ) -> Iterator[Union[Dict[str, Any], RecordError]]:
+    """
+    Validate a JSON Lines (NDJSON) file or stream against the given schema,
+    yielding each validated record or a `RecordError` for each invalid line.
+    The source is read in chunks, so memory use is bounded regardless of its size.\n
+    ---
+    ### Args
+    - `source` (`Union[str, Path, IO]`): a path, or a binary file-like object.
+    - `schema` (`Type[belso.Schema]`): the schema to validate against.
+    - `chunk_size` (`int`): the number of bytes read at once. Defaults to 1 MiB.
+    - `valid_sink` (`Optional[IO]`): a binary file-like object receiving the raw valid lines. Defaults to `None`.
+    - `invalid_sink` (`Optional[IO]`): a binary file-like object receiving the raw invalid lines. Defaults to `None`.\n
+    ---
+    ### Returns
+    - `Iterator[Union[Dict[str, Any], RecordError]]`: the validated records and errors, in source order.
+    """
+    return compile_validator(schema).validate_stream(source, chunk_size, valid_sink, invalid_sink)
+
+def collect_errors(
+        data: Union[Dict[str, Any], str],
+        schema: Type[Schema]
+    ) -> List[ValidationIssue]:
+    """
+    Find every violation of the given schema in `data` in a single pass.
+    Issues are located by JSON pointer and their messages are only
+    formatted when read.\n
+    ---
+    ### Args
+    - `data` (`Union[Dict[str, Any], str]`): the data to validate (either a dict or JSON string).
+    - `schema` (`Type[belso.Schema]`): the schema to validate against.\n
+    ---
+    ### Returns
+    - `List[ValidationIssue]`: the issues found. Empty if the data is valid.
+    """
+    return compile_validator(schema).errors(data)
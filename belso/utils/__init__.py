@@ -3,10 +3,15 @@
 from belso.utils.formats import FORMATS
 from belso.utils.detecting import detect_schema_format
 from belso.utils.logging import get_logger, configure_logger
+from belso.utils.caching import LRUCache, CacheInfo, DiskCache, default_cache_dir
 
 __all__ = [
     "FORMATS",
     "detect_schema_format",
     "get_logger",
-    "configure_logger"
+    "configure_logger",
+    "LRUCache",
+    "CacheInfo",
+    "DiskCache",
+    "default_cache_dir"
 ]
@@ -0,0 +1,222 @@
+# belso.utils.caching
+
+import os
+import json
+import tempfile
+from pathlib import Path
+from threading import Lock
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, NamedTuple, Optional, Tuple, Union
+
+from belso.version import __version__
+from belso.utils.logging import get_logger
+
+_logger = get_logger(__name__)
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics of an `LRUCache`.
+    """
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+class LRUCache:
+    """
+    Bounded, thread-safe mapping that evicts the least recently used entry
+    once `maxsize` entries are stored, counting lookup hits and misses.
+    """
+    __slots__ = ("maxsize", "_data", "_lock", "_hits", "_misses")
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(
+            self,
+            key: Hashable,
+            default: Any = None,
+            valid: Optional[Callable[[Any], bool]] = None
+        ) -> Any:
+        """
+        Look up `key`, marking it as the most recently used.\n
+        ---
+        ### Args
+        - `key` (`Hashable`): the key.
+        - `default` (`Any`): the value returned for missing keys. Defaults to `None`.
+        - `valid` (`Optional[Callable[[Any], bool]]`): a check of the cached value; stale values are dropped and count as misses. Defaults to `None`.\n
+        ---
+        ### Returns
+        - `Any`: the cached value, or `default`.
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            if valid is not None and not valid(value):
+                del self._data[key]
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store `value` under `key`, evicting the least recently used entry if full.\n
+        ---
+        ### Args
+        - `key` (`Hashable`): the key.
+        - `value` (`Any`): the value.
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, match: Optional[Callable[[Hashable], bool]] = None) -> int:
+        """
+        Remove the entries whose key satisfies `match`, or every entry.\n
+        ---
+        ### Args
+        - `match` (`Optional[Callable[[Hashable], bool]]`): the key predicate. Defaults to `None` (all entries).\n
+        ---
+        ### Returns
+        - `int`: the number of removed entries.
+        """
+        with self._lock:
+            if match is None:
+                removed = len(self._data)
+                self._data.clear()
+                return removed
+            keys = [key for key in self._data if match(key)]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """
+        Remove every entry and reset the statistics.
+        """
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Get the cache statistics.\n
+        ---
+        ### Returns
+        - `CacheInfo`: the hits, misses, maximum and current size.
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+def default_cache_dir() -> Path:
+    """
+    Get the default directory of the disk cache: `$XDG_CACHE_HOME/belso`,
+    or `~/.cache/belso` if `XDG_CACHE_HOME` is not set.\n
+    ---
+    ### Returns
+    - `Path`: the cache directory.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "belso"
+
+class DiskCache:
+    """
+    Directory of cached blobs, shared between processes. Entries live in a
+    subdirectory per belso version, so upgrading never reads stale payloads.\n
+    Writes go to a temporary file that is atomically renamed into place, so
+    concurrent readers see either no entry or a complete one, and a crash
+    never leaves a partial entry behind.
+    """
+    __slots__ = ("directory",)
+
+    def __init__(self, directory: Optional[Union[str, Path]] = None) -> None:
+        self.directory = Path(directory or default_cache_dir()) / __version__
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Read the entry stored under `key`.\n
+        ---
+        ### Args
+        - `key` (`str`): the key, a valid file name.\n
+        ---
+        ### Returns
+        - `Optional[bytes]`: the entry, or `None` if it is missing or unreadable.
+        """
+        try:
+            return self._path(key).read_bytes()
+        except OSError:
+            return None
+
+    def put(self, key: str, data: bytes) -> bool:
+        """
+        Store `data` under `key`, replacing any previous entry atomically.
+        Failures (e.g. a read-only directory) are logged, not raised.\n
+        ---
+        ### Args
+        - `key` (`str`): the key, a valid file name.
+        - `data` (`bytes`): the entry.\n
+        ---
+        ### Returns
+        - `bool`: whether the entry was stored.
+        """
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as file:
+                    file.write(data)
+                os.replace(tmp, self._path(key))
+            except BaseException:
+                os.unlink(tmp)
+                raise
+            return True
+        except OSError as e:
+            _logger.warning("Could not write disk cache entry '%s': %s", key, e)
+            return False
+
+    def clear(self) -> int:
+        """
+        Remove every entry of the current belso version.\n
+        ---
+        ### Returns
+        - `int`: the number of removed entries.
+        """
+        removed = 0
+        try:
+            paths = list(self.directory.iterdir())
+        except OSError:
+            return 0
+        for path in paths:
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+def _encode_json(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+def _decode_json(data: bytes) -> Any:
+    return json.loads(data)
+
+# Codec of the converted schemas that are plain JSON data (dicts and strings)
+_JSON_CODEC: Tuple[Callable[[Any], bytes], Callable[[bytes], Any]] = (_encode_json, _decode_json)
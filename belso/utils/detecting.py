@@ -1,19 +1,47 @@
 # belso.utils.detecting
 
+import sys
 import json
 from typing import Any
 
-import yaml
-from pydantic import BaseModel
-import xml.etree.ElementTree as ET
-from google.ai.generativelanguage_v1beta.types import content
-
 from belso.utils.formats import FORMATS
 from belso.utils.logging import get_logger
 
 # Get a module-specific _logger
 _logger = get_logger(__name__)
 
+def _is_instance_of_loaded(
+        obj: Any,
+        module_name: str,
+        class_path: str,
+        subclass: bool = False
+    ) -> bool:
+    """
+    Check `obj` against a class from an optional backend without importing it.
+    If the backend module has never been imported, no instance of its classes
+    can exist, so the check short-circuits to `False`.\n
+    ---
+    ### Args
+    - `obj` (`Any`): the object to check.
+    - `module_name` (`str`): the module defining the class.
+    - `class_path` (`str`): dotted path of the class inside the module.
+    - `subclass` (`bool`): check `obj` as a class instead of as an instance. Defaults to `False`.\n
+    ---
+    ### Returns
+    - `bool`: whether `obj` is an instance (or subclass) of the class.
+    """
+    module = sys.modules.get(module_name)
+    if module is None:
+        return False
+    cls = module
+    for part in class_path.split("."):
+        cls = getattr(cls, part, None)
+        if cls is None:
+            return False
+    if subclass:
+        return isinstance(obj, type) and issubclass(obj, cls)
+    return isinstance(obj, cls)
+
 def detect_schema_format(schema: Any) -> str:
     """
     Detect the format of the input schema.\n
@@ -35,15 +63,15 @@ def detect_schema_format(schema: Any) -> str:
             _logger.debug("Detected belso schema format.")
             return FORMATS.BELSO
 
-        if isinstance(schema, type) and issubclass(schema, BaseModel):
+        if _is_instance_of_loaded(schema, "pydantic", "BaseModel", subclass=True):
             _logger.debug("Detected OpenAI schema format (Pydantic).")
             return FORMATS.OPENAI
 
-        if isinstance(schema, content.Schema):
+        if _is_instance_of_loaded(schema, "google.ai.generativelanguage_v1beta.types.content", "Schema"):
             _logger.debug("Detected Google Gemini schema format.")
             return FORMATS.GOOGLE
 
-        if isinstance(schema, ET.Element):
+        if _is_instance_of_loaded(schema, "xml.etree.ElementTree", "Element"):
             _logger.debug("Detected XML ElementTree schema format.")
             return FORMATS.XML
 
@@ -81,6 +109,7 @@ def detect_schema_format(schema: Any) -> str:
                 _logger.debug("String is not valid JSON.")
 
             # Try parsing as YAML
+            import yaml
             try:
                 parsed_yaml = yaml.safe_load(schema_str)
                 if isinstance(parsed_yaml, dict):
@@ -96,6 +125,6 @@ def detect_schema_format(schema: Any) -> str:
         return "unknown"
 
     except Exception as e:
-        _logger.error(f"Error during schema format detection: {e}")
+        _logger.error("Error during schema format detection: %s", e)
         _logger.debug("Detection error details", exc_info=True)
         return "unknown"
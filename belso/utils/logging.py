@@ -5,8 +5,10 @@ import sys
 import logging
 from typing import Optional, Dict, Any
 
-# Create a dedicated logger for the belso package
+# Create a dedicated logger for the belso package. As a library, belso only
+# attaches a `NullHandler`: nothing is printed until `configure_logger()` is called.
 logger = logging.getLogger("belso")
+logger.addHandler(logging.NullHandler())
 
 # Store original logger level to restore it if needed
 _original_level = logger.level
@@ -58,7 +60,7 @@ def configure_logger(
         log_format = "[%(levelname)s][%(name)s] %(message)s"
 
     # Configure handlers based on what's requested
-    if log_file or not logger.handlers:
+    if log_file or not any(not isinstance(h, logging.NullHandler) for h in logger.handlers):
         # Clear existing handlers if we're explicitly configuring
         for handler in logger.handlers[:]:
             logger.removeHandler(handler)
@@ -82,7 +84,7 @@ def configure_logger(
             except (OSError, IOError) as e:
                 # Don't fail if log file can't be created, just log a warning
                 console_handler.setLevel(logging.WARNING)
-                logger.warning(f"Could not create log file at {log_file}: {e}")
+                logger.warning("Could not create log file at %s: %s", log_file, e)
 
     # Apply any additional handler configuration
     if handler_config:
@@ -116,5 +118,5 @@ def log_exception(
     - `e` (`Exception`): the exception to log.
     - `message` (`str`): a message to accompany the exception.
     """
-    logger.error(f"{message}: {str(e)}")
+    logger.error("%s: %s", message, e)
     logger.debug("Exception details", exc_info=True)
@@ -1,57 +1,90 @@
 # belso.utils.mappings.extra_mappings
 
-from belso.providers import (
-    to_google, from_google,
-    to_ollama, from_ollama,
-    to_openai, from_openai,
-    to_anthropic, from_anthropic,
-    to_langchain, from_langchain,
-    to_huggingface, from_huggingface,
-    to_mistral, from_mistral
-)
-from belso.serialization import (
-    to_json, from_json,
-    to_xml, from_xml,
-    to_yaml, from_yaml
-)
+from importlib import import_module
+from typing import Any, Callable, Dict, Iterator, Mapping, Tuple
+
 from belso.utils.formats import FORMATS
 
-_CONVERT_TO_MAP = {
-    FORMATS.GOOGLE: to_google,
-    FORMATS.OLLAMA: to_ollama,
-    FORMATS.OPENAI: to_openai,
-    FORMATS.ANTHROPIC: to_anthropic,
-    FORMATS.LANGCHAIN: to_langchain,
-    FORMATS.HUGGINGFACE: to_huggingface,
-    FORMATS.MISTRAL: to_mistral,
-    FORMATS.JSON: to_json,
-    FORMATS.XML: to_xml,
-    FORMATS.YAML: to_yaml,
-}
-
-_CONVERT_FROM_MAP = {
-    FORMATS.GOOGLE: from_google,
-    FORMATS.OLLAMA: from_ollama,
-    FORMATS.OPENAI: from_openai,
-    FORMATS.ANTHROPIC: from_anthropic,
-    FORMATS.LANGCHAIN: from_langchain,
-    FORMATS.HUGGINGFACE: from_huggingface,
-    FORMATS.MISTRAL: from_mistral,
-    FORMATS.JSON: from_json,
-    FORMATS.XML: from_xml,
-    FORMATS.YAML: from_yaml,
-}
-
-_SAVE_TO_MAP = {
-    ".json": to_json,
-    ".xml": to_xml,
-    ".yaml": to_yaml,
-    ".yml": to_yaml,
-}
-
-_LOAD_FROM_MAP = {
-    ".json": from_json,
-    ".xml": from_xml,
-    ".yaml": from_yaml,
-    ".yml": from_yaml,
-}
+class _LazyRegistry(Mapping):
+    """
+    Read-only mapping whose values are imported on first access.\n
+    Values are declared as `(module, attribute)` pairs, so looking up a single
+    key only imports the backend it points to (e.g. converting to Ollama never
+    imports the Google protobuf stack).
+    """
+    __slots__ = ("_targets", "_resolved")
+
+    def __init__(self, targets: Dict[str, Tuple[str, str]]) -> None:
+        self._targets = targets
+        self._resolved: Dict[str, Callable[..., Any]] = {}
+
+    def __getitem__(self, key: str) -> Callable[..., Any]:
+        try:
+            return self._resolved[key]
+        except KeyError:
+            module_name, attr = self._targets[key]
+            func = getattr(import_module(module_name), attr)
+            self._resolved[key] = func
+            return func
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._targets
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._targets)
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
+_CONVERT_TO_MAP = _LazyRegistry({
+    FORMATS.GOOGLE: ("belso.providers.google", "to_google"),
+    FORMATS.OLLAMA: ("belso.providers.ollama", "to_ollama"),
+    FORMATS.OPENAI: ("belso.providers.openai", "to_openai"),
+    FORMATS.ANTHROPIC: ("belso.providers.anthropic", "to_anthropic"),
+    FORMATS.LANGCHAIN: ("belso.providers.langchain", "to_langchain"),
+    FORMATS.HUGGINGFACE: ("belso.providers.huggingface", "to_huggingface"),
+    FORMATS.MISTRAL: ("belso.providers.mistral", "to_mistral"),
+    FORMATS.JSON: ("belso.serialization.json_format", "to_json"),
+    FORMATS.XML: ("belso.serialization.xml_format", "to_xml"),
+    FORMATS.YAML: ("belso.serialization.yaml_format", "to_yaml"),
+})
+
+_CONVERT_FROM_MAP = _LazyRegistry({
+    FORMATS.GOOGLE: ("belso.providers.google", "from_google"),
+    FORMATS.OLLAMA: ("belso.providers.ollama", "from_ollama"),
+    FORMATS.OPENAI: ("belso.providers.openai", "from_openai"),
+    FORMATS.ANTHROPIC: ("belso.providers.anthropic", "from_anthropic"),
+    FORMATS.LANGCHAIN: ("belso.providers.langchain", "from_langchain"),
+    FORMATS.HUGGINGFACE: ("belso.providers.huggingface", "from_huggingface"),
+    FORMATS.MISTRAL: ("belso.providers.mistral", "from_mistral"),
+    FORMATS.JSON: ("belso.serialization.json_format", "from_json"),
+    FORMATS.XML: ("belso.serialization.xml_format", "from_xml"),
+    FORMATS.YAML: ("belso.serialization.yaml_format", "from_yaml"),
+})
+
+_SAVE_TO_MAP = _LazyRegistry({
+    ".json": ("belso.serialization.json_format", "to_json"),
+    ".xml": ("belso.serialization.xml_format", "to_xml"),
+    ".yaml": ("belso.serialization.yaml_format", "to_yaml"),
+    ".yml": ("belso.serialization.yaml_format", "to_yaml"),
+})
+
+_LOAD_FROM_MAP = _LazyRegistry({
+    ".json": ("belso.serialization.json_format", "from_json"),
+    ".xml": ("belso.serialization.xml_format", "from_xml"),
+    ".yaml": ("belso.serialization.yaml_format", "from_yaml"),
+    ".yml": ("belso.serialization.yaml_format", "from_yaml"),
+})
+
+# Codecs `(encode, decode)` of the converted schemas stored by the disk cache.
+# Pydantic targets (OpenAI, LangChain) are dynamic classes and are never stored.
+_DISK_CODEC_MAP = _LazyRegistry({
+    FORMATS.GOOGLE: ("belso.providers.google", "_DISK_CODEC"),
+    FORMATS.OLLAMA: ("belso.utils.caching", "_JSON_CODEC"),
+    FORMATS.ANTHROPIC: ("belso.utils.caching", "_JSON_CODEC"),
+    FORMATS.HUGGINGFACE: ("belso.utils.caching", "_JSON_CODEC"),
+    FORMATS.MISTRAL: ("belso.utils.caching", "_JSON_CODEC"),
+    FORMATS.JSON: ("belso.utils.caching", "_JSON_CODEC"),
+    FORMATS.XML: ("belso.utils.caching", "_JSON_CODEC"),
+    FORMATS.YAML: ("belso.utils.caching", "_JSON_CODEC"),
+})
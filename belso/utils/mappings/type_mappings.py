@@ -1,7 +1,6 @@
 # belso.utils.mappings.type_mappings
 
 from typing import Any
-from google.ai.generativelanguage_v1beta.types import content
 
 _FILE_TYPE_MAP = {
     "str": str,
@@ -13,14 +12,27 @@ _FILE_TYPE_MAP = {
     "any": Any
 }
 
-_GOOGLE_TYPE_MAP = {
-    str: content.Type.STRING,
-    int: content.Type.INTEGER,
-    float: content.Type.NUMBER,
-    bool: content.Type.BOOLEAN,
-    list: content.Type.ARRAY,
-    dict: content.Type.OBJECT,
-    Any: content.Type.TYPE_UNSPECIFIED
-}
+def _build_google_type_maps() -> None:
+    """
+    Build the Google type mappings, importing the protobuf types only when
+    a Google map is first requested.
+    """
+    from google.ai.generativelanguage_v1beta.types import content
+
+    google_map = {
+        str: content.Type.STRING,
+        int: content.Type.INTEGER,
+        float: content.Type.NUMBER,
+        bool: content.Type.BOOLEAN,
+        list: content.Type.ARRAY,
+        dict: content.Type.OBJECT,
+        Any: content.Type.TYPE_UNSPECIFIED
+    }
+    globals()["_GOOGLE_TYPE_MAP"] = google_map
+    globals()["_REVERSE_GOOGLE_TYPE_MAP"] = {v: k for k, v in google_map.items()}
 
-_REVERSE_GOOGLE_TYPE_MAP = {v: k for k, v in _GOOGLE_TYPE_MAP.items()}
+def __getattr__(name: str):
+    if name in ("_GOOGLE_TYPE_MAP", "_REVERSE_GOOGLE_TYPE_MAP"):
+        _build_google_type_maps()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,79 @@
+"""
+Batch validation benchmark.
+
+Compares `SchemaProcessor.validate_many` with a Python loop calling
+`validate_schema` on each record and catching its exceptions, on a batch
+where a share of the records is invalid.
+
+Run with: `python benchmarks/batch_validation.py`
+"""
+
+import random
+from time import perf_counter
+from typing import List
+
+from belso import Schema, Field, SchemaProcessor
+from belso.tools import validate_schema
+
+class Item(Schema):
+    fields = [
+        Field("sku", type=str, description="Item code"),
+        Field("price", type=float, description="Unit price"),
+        Field("quantity", type=int, description="Units ordered"),
+    ]
+
+class Order(Schema):
+    fields = [
+        Field("id", type=str, description="Order id"),
+        Field("customer", type=str, description="Customer name"),
+        Field("paid", type=bool, description="Whether the order is paid"),
+        Field("items", type=List[Item], description="Ordered items"),
+        Field("notes", type=str, description="Free text", required=False),
+    ]
+
+def _make_records(count: int, invalid_ratio: float, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        record = {
+            "id": f"A-{i}",
+            "customer": "ACME",
+            "paid": True,
+            "items": [{"sku": f"S{j}", "price": 1.5, "quantity": j} for j in range(3)],
+        }
+        if rng.random() < invalid_ratio:
+            # Break the record deep inside, so the error is wrapped twice
+            record["items"][2]["quantity"] = "many"
+        records.append(record)
+    return records
+
+def _loop(records: list) -> tuple:
+    valid, errors = [], []
+    for index, record in enumerate(records):
+        try:
+            valid.append(validate_schema(record, Order))
+        except (ValueError, TypeError) as e:
+            errors.append((index, e))
+    return valid, errors
+
+def main(count: int = 50_000, invalid_ratio: float = 0.2) -> None:
+    records = _make_records(count, invalid_ratio)
+
+    start = perf_counter()
+    valid, errors = _loop(records)
+    loop_time = perf_counter() - start
+
+    start = perf_counter()
+    result = SchemaProcessor.validate_many(records, Order)
+    batch_time = perf_counter() - start
+
+    assert len(result.valid) == len(valid) and len(result.errors) == len(errors)
+    assert [e.index for e in result.errors] == [index for index, _ in errors]
+
+    print(f"{count} records, {len(errors)} invalid")
+    print(f"validate_schema loop: {loop_time * 1000:8.1f} ms")
+    print(f"validate_many:        {batch_time * 1000:8.1f} ms")
+    print(f"speed-up:             {loop_time / batch_time:8.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Bulk schema construction benchmark.
+
+Times building a 10,000-field schema with the `Field` factory and with
+`Schema.from_spec`, from rows given as dicts of `Field` arguments and as
+tuples in `Field` order.
+
+Run with: `python benchmarks/bulk_fields.py`
+"""
+
+from time import perf_counter
+from typing import Any, Dict, List
+
+from belso import Schema, Field
+
+class Address(Schema):
+    fields = [Field("street", type=str, description="Street")]
+
+def _rows(size: int) -> List[Dict[str, Any]]:
+    templates = (
+        {"type": str, "description": "Text", "length_range": (1, 64)},
+        {"type": int, "description": "Count", "range": (0, 100), "required": False, "default": 0},
+        {"type": float, "description": "Score", "multiple_of": 0.5},
+        {"type": bool, "description": "Flag"},
+        {"type": List[str], "description": "Tags", "items_range": (0, 8)},
+        {"type": Address, "description": "Address", "required": False},
+    )
+    return [dict(templates[i % len(templates)], name=f"field{i}") for i in range(size)]
+
+def _with_field(rows: List[Dict[str, Any]]) -> type:
+    return type("Catalog", (Schema,), {"fields": [Field(**row) for row in rows]})
+
+def main(size: int = 10_000, number: int = 5) -> None:
+    rows = _rows(size)
+    order = ("name", "type", "description", "required", "default", "enum", "range",
+             "exclusive_range", "length_range", "items_range")
+    tuples = [tuple(row.get(param, True if param == "required" else "" if param == "description" else None) for param in order) for row in rows]
+
+    for label, build in (
+        ("Field", lambda: _with_field(rows)),
+        ("from_spec dicts", lambda: Schema.from_spec(rows, name="Catalog")),
+        ("from_spec tuples", lambda: Schema.from_spec(tuples, name="Catalog")),
+    ):
+        start = perf_counter()
+        for _ in range(number):
+            build()
+        elapsed = (perf_counter() - start) / number
+        print(f"{label:17} {elapsed * 1e3:8.2f} ms   {elapsed / size * 1e6:6.2f} us/field")
+
+if __name__ == "__main__":
+    main()
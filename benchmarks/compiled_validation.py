@@ -0,0 +1,61 @@
+"""
+Compiled validator benchmark.
+
+Compares `validate_schema`, which re-interprets the schema on every call,
+with the validator built once by `SchemaProcessor.compile_validator`.
+
+Run with: `python benchmarks/compiled_validation.py`
+"""
+
+from timeit import repeat
+from typing import List
+
+from belso import Schema, Field, SchemaProcessor
+from belso.tools import validate_schema
+
+class Address(Schema):
+    fields = [
+        Field("street", type=str, description="Street and number"),
+        Field("city", type=str, description="City"),
+        Field("zip", type=str, description="Postal code"),
+    ]
+
+class Item(Schema):
+    fields = [
+        Field("sku", type=str, description="Item code"),
+        Field("price", type=float, description="Unit price"),
+        Field("quantity", type=int, description="Units ordered"),
+    ]
+
+class Order(Schema):
+    fields = [
+        Field("id", type=str, description="Order id"),
+        Field("customer", type=str, description="Customer name"),
+        Field("paid", type=bool, description="Whether the order is paid"),
+        Field("shipping", type=Address, description="Shipping address"),
+        Field("items", type=List[Item], description="Ordered items"),
+        Field("tags", type=List[str], description="Labels"),
+        Field("notes", type=str, description="Free text", required=False),
+    ]
+
+_RECORD = {
+    "id": "A-1",
+    "customer": "ACME",
+    "paid": True,
+    "shipping": {"street": "Main St 1", "city": "Springfield", "zip": "12345"},
+    "items": [{"sku": f"S{i}", "price": 1.5, "quantity": i} for i in range(5)],
+    "tags": ["priority", "gift"],
+}
+
+def main(number: int = 20_000) -> None:
+    validator = SchemaProcessor.compile_validator(Order)
+
+    interpreted = min(repeat(lambda: validate_schema(_RECORD, Order), number=number, repeat=5)) / number
+    compiled = min(repeat(lambda: validator(_RECORD), number=number, repeat=5)) / number
+
+    print(f"validate_schema:    {interpreted * 1e6:8.2f} us/record")
+    print(f"compiled validator: {compiled * 1e6:8.2f} us/record")
+    print(f"speed-up:           {interpreted / compiled:8.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Constraint validation benchmark.
+
+Measures what enforcing field constraints (enum, ranges, length, pattern,
+format, multiple_of) adds to a compiled validator, by validating the same
+records against a schema with and without constraints.
+
+Run with: `python benchmarks/constraint_validation.py`
+"""
+
+from timeit import repeat
+from typing import List
+
+from belso import Schema, Field, SchemaProcessor
+
+def _item(constrained: bool) -> type:
+    extra = lambda **kwargs: kwargs if constrained else {}
+    return type("Item", (Schema,), {"fields": [
+        Field("sku", type=str, description="Item code", **extra(regex=r"^S\d+$", length_range=(2, 8))),
+        Field("price", type=float, description="Unit price", **extra(range=(0, 10_000), multiple_of=0.01)),
+        Field("quantity", type=int, description="Units ordered", **extra(range=(0, 100))),
+    ]})
+
+def _order(constrained: bool) -> type:
+    extra = lambda **kwargs: kwargs if constrained else {}
+    return type("Order", (Schema,), {"fields": [
+        Field("id", type=str, description="Order id", **extra(format="uuid")),
+        Field("status", type=str, description="Order status", **extra(enum=["new", "paid", "shipped"])),
+        Field("email", type=str, description="Customer e-mail", **extra(format="email")),
+        Field("items", type=List[_item(constrained)], description="Ordered items"),
+    ]})
+
+# Constraint checks run per record: 4 on the order, 5 on each of its 5 items
+_RECORD = {
+    "id": "1b4e28ba-2fa1-11d2-883f-0016d3cca427",
+    "status": "paid",
+    "email": "buyer@example.com",
+    "items": [{"sku": f"S{i}", "price": 1.5, "quantity": i} for i in range(5)],
+}
+_CHECKS = 4 + 5 * 5
+
+def main(number: int = 20_000) -> None:
+    plain = SchemaProcessor.compile_validator(_order(False))
+    constrained = SchemaProcessor.compile_validator(_order(True))
+
+    plain_time = min(repeat(lambda: plain(_RECORD), number=number, repeat=5)) / number
+    constrained_time = min(repeat(lambda: constrained(_RECORD), number=number, repeat=5)) / number
+    overhead = constrained_time - plain_time
+
+    print(f"types only:       {plain_time * 1e6:8.2f} us/record")
+    print(f"with constraints: {constrained_time * 1e6:8.2f} us/record")
+    print(f"overhead:         {overhead * 1e9 / _CHECKS:8.1f} ns/check ({_CHECKS} checks per record)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Conversion cache benchmark.
+
+Times `SchemaProcessor.convert` on the same schema with and without the
+conversion cache, for each provider format.
+
+Run with: `python benchmarks/conversion_cache.py`
+"""
+
+from time import perf_counter
+from typing import List
+
+from belso import Schema, Field, SchemaProcessor
+
+class Item(Schema):
+    fields = [
+        Field("sku", type=str, description="Item code"),
+        Field("price", type=float, description="Unit price"),
+    ]
+
+class Order(Schema):
+    fields = [
+        Field("id", type=str, description="Order id"),
+        Field("customer", type=str, description="Customer name"),
+        Field("items", type=List[Item], description="Ordered items"),
+    ]
+
+def _time(to: str, cache: bool, number: int) -> float:
+    start = perf_counter()
+    for _ in range(number):
+        SchemaProcessor.convert(Order, to=to, cache=cache)
+    return (perf_counter() - start) / number
+
+def main(number: int = 200) -> None:
+    for to in ("openai", "anthropic", "ollama", "mistral", "huggingface"):
+        # Warm up imports and the cache
+        SchemaProcessor.convert(Order, to=to)
+        uncached = _time(to, False, number)
+        cached = _time(to, True, number)
+        print(f"{to:12} uncached {uncached * 1e6:10.1f} us   cached {cached * 1e6:6.2f} us   speed-up {uncached / cached:8.0f}x")
+    print(SchemaProcessor.cache_info())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Multi-target conversion benchmark.
+
+Times the conversion of one schema to OpenAI, Anthropic, Google and Ollama
+formats with sequential `SchemaProcessor.convert` calls and with a single
+`SchemaProcessor.convert_all` call, for a belso schema and for a JSON schema
+input that has to be detected and standardized. Caches are disabled.
+
+Run with: `python benchmarks/convert_all.py`
+"""
+
+from time import perf_counter
+from typing import Any, List
+
+from belso import Schema, Field, SchemaProcessor
+
+_TARGETS = ("openai", "anthropic", "google", "ollama")
+
+class Item(Schema):
+    fields = [
+        Field("sku", type=str, description="Item code"),
+        Field("price", type=float, description="Unit price"),
+        Field("tags", type=List[str], description="Tags"),
+    ]
+
+class Order(Schema):
+    fields = [Field(f"note{i}", type=str, description="Note") for i in range(20)] + [
+        Field("id", type=str, description="Order id"),
+        Field("items", type=List[Item], description="Ordered items"),
+    ]
+
+def _sequential(schema: Any) -> None:
+    for to in _TARGETS:
+        SchemaProcessor.convert(schema, to=to, cache=False)
+
+def _fan_out(schema: Any) -> None:
+    SchemaProcessor.convert_all(schema, _TARGETS, cache=False)
+
+def main(number: int = 50) -> None:
+    json_schema = SchemaProcessor.convert(Order, to="anthropic", cache=False)
+    # Warm up imports
+    _fan_out(Order)
+
+    for label, schema in (("belso schema", Order), ("JSON schema", json_schema)):
+        start = perf_counter()
+        for _ in range(number):
+            _sequential(schema)
+        sequential = (perf_counter() - start) / number
+        start = perf_counter()
+        for _ in range(number):
+            _fan_out(schema)
+        fan_out = (perf_counter() - start) / number
+        print(f"{label:13} sequential {sequential * 1e3:8.2f} ms   convert_all {fan_out * 1e3:8.2f} ms   speed-up {sequential / fan_out:5.2f}x")
+
+if __name__ == "__main__":
+    main()
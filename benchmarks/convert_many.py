@@ -0,0 +1,56 @@
+"""
+Bulk conversion benchmark.
+
+Times the conversion of a catalog of JSON schemas to Anthropic, Google and
+Ollama formats with one `SchemaProcessor.convert` call per schema and format,
+and with `SchemaProcessor.convert_many`, in-process and on process pools of
+increasing size. Caches are disabled.
+
+Run with: `python benchmarks/convert_many.py`
+"""
+
+import os
+from time import perf_counter
+from typing import Any, Dict, List
+
+from belso import Schema, Field, SchemaProcessor
+
+_TARGETS = ("anthropic", "google", "ollama")
+
+def _catalog(size: int) -> List[Dict[str, Any]]:
+    schemas = []
+    for n in range(size):
+        class Item(Schema):
+            fields = [
+                Field("sku", type=str, description="Item code"),
+                Field("price", type=float, description="Unit price"),
+                Field(f"extra{n % 7}", type=int, description="Extra"),
+            ]
+
+        class Order(Schema):
+            fields = [Field(f"note{i}", type=str, description="Note") for i in range(10 + n % 10)] + [
+                Field("items", type=List[Item], description="Ordered items"),
+            ]
+
+        schemas.append(SchemaProcessor.convert(Order, to="anthropic", cache=False))
+    return schemas
+
+def main(size: int = 2000) -> None:
+    schemas = _catalog(size)
+
+    start = perf_counter()
+    for schema in schemas:
+        for to in _TARGETS:
+            SchemaProcessor.convert(schema, to=to, cache=False)
+    baseline = perf_counter() - start
+    print(f"convert         {baseline:7.2f} s")
+
+    for workers in sorted({1, 2, os.cpu_count() or 1}):
+        start = perf_counter()
+        for _ in SchemaProcessor.convert_many(schemas, to=_TARGETS, workers=workers):
+            pass
+        elapsed = perf_counter() - start
+        print(f"workers={workers:<6} {elapsed:7.2f} s   speed-up {baseline / elapsed:5.2f}x")
+
+if __name__ == "__main__":
+    main()
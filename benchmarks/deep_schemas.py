@@ -0,0 +1,67 @@
+"""
+Deep schema benchmark.
+
+Builds chains of schemas nested 10, 100 and 1,000 levels deep (alternating
+nested objects and arrays of objects) and times their fingerprint, their
+conversion to several formats and the validation of a matching document.
+Traversals run on an explicit stack, so no depth hits the recursion limit.
+
+Run with: `python benchmarks/deep_schemas.py`
+"""
+
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Type
+
+from belso import Schema, Field, SchemaProcessor
+from belso.core import schema_fingerprint
+from belso.tools import validate_schema
+
+_TARGETS = ("anthropic", "ollama", "openai", "json")
+
+def _chain(depth: int) -> Type[Schema]:
+    schema = type(f"Level{depth}", (Schema,), {"fields": [Field("value", type=int, description="Value")]})
+    for level in range(depth - 1, -1, -1):
+        child_type = List[schema] if level % 2 else schema
+        schema = type(f"Level{level}", (Schema,), {"fields": [
+            Field("id", type=str, description="Identifier"),
+            Field("child", type=child_type, description="Nested level"),
+        ]})
+    return schema
+
+def _document(depth: int) -> Dict[str, Any]:
+    document = {"value": 1}
+    for level in range(depth - 1, -1, -1):
+        document = {"id": str(level), "child": [document] if level % 2 else document}
+    return document
+
+def _time(func: Callable[[], Any], number: int) -> str:
+    try:
+        start = perf_counter()
+        for _ in range(number):
+            func()
+    except RecursionError:
+        return "RecursionError"
+    return f"{(perf_counter() - start) / number * 1e3:.2f} ms"
+
+def main(number: int = 5) -> None:
+    # Warm up imports
+    SchemaProcessor.convert(_chain(1), to="openai")
+
+    for depth in (10, 100, 1000):
+        schema = _chain(depth)
+        document = _document(depth)
+        timings = {
+            # Cached on the class after the first call
+            "fingerprint": _time(lambda: schema_fingerprint(_chain(depth)), 1),
+        }
+        for to in _TARGETS:
+            timings[to] = _time(lambda: SchemaProcessor.convert(schema, to=to, cache=False), number)
+        timings["validate"] = _time(lambda: SchemaProcessor.validate(document, schema), number)
+        timings["collect_errors"] = _time(lambda: SchemaProcessor.collect_errors(document, schema), number)
+        timings["validate_schema"] = _time(lambda: validate_schema(document, schema), number)
+        print(f"depth {depth}")
+        for name, timing in timings.items():
+            print(f"  {name:16} {timing}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Schema derivation benchmark.
+
+Builds 200 variants of a schema with 300 fields and 20 nested schemas,
+each changing one field, by copying the whole schema graph, by copying the
+fields of the schema, and with `Schema.derive`. Reports the memory held by
+the variants, and the time to fingerprint each variant and convert it to
+OpenAI format (pydantic models of unchanged nested schemas are reused when
+their fingerprint is known). Every variant is a new class converted once,
+so the conversion cache never hits.
+
+Run with: `python benchmarks/derive.py`
+"""
+
+import tracemalloc
+from copy import copy
+from time import perf_counter
+from typing import Callable, List
+
+from belso import Schema, Field, SchemaProcessor
+from belso.core import schema_to_spec, schema_from_spec
+from belso.providers.base.pydantic_model import clear_model_cache
+
+def _base() -> type:
+    nested = [
+        type(f"Part{i}", (Schema,), {"fields": [Field(f"value{j}", type=str, description="Value") for j in range(30)]})
+        for i in range(20)
+    ]
+    fields = [Field(f"field{i}", type=int, description="Count") for i in range(300)]
+    fields += [Field(f"part{i}", type=schema, description="Part") for i, schema in enumerate(nested)]
+    return type("Base", (Schema,), {"fields": fields})
+
+def _graph_copy(base: type, i: int) -> type:
+    variant = schema_from_spec(schema_to_spec(base))
+    field = copy(variant.fields[i])
+    field.required = False
+    variant.fields[i] = field
+    return variant
+
+def _fields_copy(base: type, i: int) -> type:
+    fields = [copy(field) for field in base.fields]
+    fields[i].required = False
+    return type("Base", (Schema,), {"fields": fields})
+
+def _derive(base: type, i: int) -> type:
+    return base.derive(override={f"field{i}": {"required": False}})
+
+def _run(label: str, make: Callable[[type, int], type], count: int) -> None:
+    base = _base()
+    clear_model_cache()
+    SchemaProcessor.convert(base, to="openai")
+
+    tracemalloc.start()
+    variants: List[type] = [make(base, i) for i in range(count)]
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = perf_counter()
+    for variant in variants:
+        variant.fingerprint()
+        SchemaProcessor.convert(variant, to="openai")
+    elapsed = (perf_counter() - start) / count
+    print(f"{label:12} memory {memory / count / 1024:8.1f} KiB/variant   fingerprint + openai {elapsed * 1e3:7.2f} ms/variant")
+
+def main(count: int = 200) -> None:
+    _run("graph copy", _graph_copy, count)
+    _run("fields copy", _fields_copy, count)
+    _run("derive", _derive, count)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Disk cache benchmark.
+
+Starts worker processes that each convert the same catalog of schemas to
+several formats, as a fleet does at startup: without the disk cache, with a
+cold one (converting and writing) and with a warm one (reading only).
+
+Run with: `python benchmarks/disk_cache.py`
+"""
+
+import os
+import sys
+import tempfile
+import subprocess
+from time import perf_counter
+from typing import List, Optional, Type
+
+from belso import Schema, Field, SchemaProcessor
+
+TARGETS = ("google", "anthropic", "ollama", "yaml")
+
+def _catalog(size: int = 200) -> List[Type[Schema]]:
+    schemas = []
+    for i in range(size):
+        address = type(f"Address{i}", (Schema,), {"fields": [
+            Field("street", type=str, description="Street"),
+            Field("city", type=str, description="City"),
+            Field("zip", type=str, description="Postal code", required=False),
+        ]})
+        schemas.append(type(f"Customer{i}", (Schema,), {"fields": [
+            Field("name", type=str, description="Full name"),
+            Field("age", type=int, description="Age", range=(0, 130)),
+            Field("tier", type=str, description="Tier", enum=["free", "pro"]),
+            Field("address", type=address, description="Home address"),
+            Field("tags", type=List[str], description="Tags", required=False),
+        ]}))
+    return schemas
+
+def worker() -> None:
+    schemas = _catalog()
+    start = perf_counter()
+    for schema in schemas:
+        for to in TARGETS:
+            SchemaProcessor.convert(schema, to=to)
+    print(f"{perf_counter() - start:.4f}")
+
+def _run(cache_dir: Optional[str]) -> float:
+    env = dict(os.environ)
+    env.pop("BELSO_CACHE_DIR", None)
+    if cache_dir is not None:
+        env["BELSO_CACHE_DIR"] = cache_dir
+    start = perf_counter()
+    out = subprocess.run([sys.executable, __file__, "--worker"], env=env, check=True, capture_output=True, text=True)
+    return float(out.stdout.split()[-1]), perf_counter() - start
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for label, directory in (("no disk cache", None), ("cold disk cache", cache_dir), ("warm disk cache", cache_dir)):
+            convert, total = _run(directory)
+            print(f"{label:16} conversions {convert * 1e3:8.1f} ms   process {total * 1e3:8.1f} ms")
+
+if __name__ == "__main__":
+    if "--worker" in sys.argv:
+        worker()
+    else:
+        main()
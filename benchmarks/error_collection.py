@@ -0,0 +1,74 @@
+"""
+Error collection benchmark.
+
+Compares finding every problem of invalid records by repeatedly calling
+`validate_schema` and fixing the reported field (one round trip per error)
+with a single `SchemaProcessor.collect_errors` pass per record.
+
+Run with: `python benchmarks/error_collection.py`
+"""
+
+import copy
+from time import perf_counter
+from typing import List
+
+from belso import Schema, Field, SchemaProcessor
+from belso.tools import validate_schema
+
+class Item(Schema):
+    fields = [
+        Field("sku", type=str, description="Item code"),
+        Field("price", type=float, description="Unit price"),
+        Field("quantity", type=int, description="Units ordered"),
+    ]
+
+class Order(Schema):
+    fields = [
+        Field("id", type=str, description="Order id"),
+        Field("customer", type=str, description="Customer name"),
+        Field("items", type=List[Item], description="Ordered items"),
+    ]
+
+def _make_record(errors: int) -> dict:
+    # Each item carries one invalid quantity, up to `errors` of them
+    return {
+        "id": "A-1",
+        "customer": "ACME",
+        "items": [
+            {"sku": f"S{j}", "price": 1.5, "quantity": "many" if j < errors else j}
+            for j in range(10)
+        ],
+    }
+
+def _round_trips(record: dict) -> int:
+    # Validate, "repair" the reported item, and try again until the record passes
+    found = 0
+    while True:
+        try:
+            validate_schema(record, Order)
+            return found
+        except (ValueError, TypeError):
+            found += 1
+            next(item for item in record["items"] if not isinstance(item["quantity"], int))["quantity"] = 0
+
+def main(count: int = 2_000, errors: int = 5) -> None:
+    records = [_make_record(errors) for _ in range(count)]
+
+    copies = copy.deepcopy(records)
+    start = perf_counter()
+    found = sum(_round_trips(record) for record in copies)
+    loop_time = perf_counter() - start
+
+    start = perf_counter()
+    collected = sum(len(SchemaProcessor.collect_errors(record, Order)) for record in records)
+    collect_time = perf_counter() - start
+
+    assert found == collected == count * errors
+
+    print(f"{count} records, {errors} errors each")
+    print(f"validate_schema round trips: {loop_time * 1000:8.1f} ms")
+    print(f"collect_errors:              {collect_time * 1000:8.1f} ms")
+    print(f"speed-up:                    {loop_time / collect_time:8.1f}x")
+
+if __name__ == "__main__":
+    main()
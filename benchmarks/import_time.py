@@ -0,0 +1,74 @@
+"""
+Import-time regression benchmark.
+
+Asserts that `import belso` does not load the optional heavy backends
+(pydantic, the Google protobuf stack, PyYAML, rich) and that each of them is
+loaded only once the matching feature is used.
+
+Run with: `python benchmarks/import_time.py`
+"""
+
+import sys
+import json
+import subprocess
+from statistics import median
+
+# Modules that must not be imported by a bare `import belso`
+_HEAVY_MODULES = (
+    "google.ai.generativelanguage_v1beta",
+    "google.protobuf",
+    "pydantic",
+    "yaml",
+    "rich",
+)
+
+_PROBE = """
+import sys, json, time
+baseline = set(sys.modules)
+start = time.perf_counter()
+import belso
+elapsed = time.perf_counter() - start
+{action}
+print(json.dumps({{"elapsed": elapsed, "loaded": sorted(set(sys.modules) - baseline)}}))
+"""
+
+def _run(action: str = "") -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(action=action)],
+        check=True,
+        capture_output=True,
+        text=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+def _heavy(loaded: list) -> set:
+    return {m for m in _HEAVY_MODULES if any(l == m or l.startswith(m + ".") for l in loaded)}
+
+def main(runs: int = 5) -> None:
+    timings = []
+    for _ in range(runs):
+        result = _run()
+        assert not _heavy(result["loaded"]), f"`import belso` loaded {_heavy(result['loaded'])}"
+        timings.append(result["elapsed"])
+    print(f"import belso: median {median(timings) * 1000:.1f} ms over {runs} runs")
+
+    # Each backend must be loaded on first use, and only that backend
+    cases = {
+        "ollama": ("belso.SchemaProcessor.convert(S, to='ollama')", set()),
+        "yaml": ("belso.SchemaProcessor.convert(S, to='yaml')", {"yaml"}),
+        "openai": ("belso.SchemaProcessor.convert(S, to='openai')", {"pydantic"}),
+        "google": ("belso.SchemaProcessor.convert(S, to='google')", {"google.ai.generativelanguage_v1beta", "google.protobuf"}),
+        "display": ("belso.SchemaProcessor.display(S)", {"rich"}),
+    }
+    for name, (call, expected) in cases.items():
+        action = (
+            "class S(belso.Schema):\n"
+            "    fields = [belso.Field('x', type=int)]\n"
+            f"{call}"
+        )
+        heavy = _heavy(_run(action)["loaded"])
+        assert heavy == expected, f"{name}: expected {expected or 'nothing'}, loaded {heavy or 'nothing'}"
+        print(f"{name:>8}: loads {', '.join(sorted(heavy)) or 'no heavy backend'}")
+
+if __name__ == "__main__":
+    main()
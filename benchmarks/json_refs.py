@@ -0,0 +1,45 @@
+"""
+JSON Schema `$defs`/`$ref` benchmark.
+
+Converts "diamond" schema graphs, where every level refers to the next one
+twice, to the Ollama JSON Schema format with nested schemas inlined and with
+`use_refs=True`, then reads the output back.
+
+Run with: `python benchmarks/json_refs.py`
+"""
+
+import json
+from time import perf_counter
+from typing import List, Type
+
+from belso import Schema, Field, SchemaProcessor
+
+def _diamond(depth: int) -> Type[Schema]:
+    schema = type("Leaf", (Schema,), {"fields": [Field("value", type=str, description="Value")]})
+    for level in range(depth):
+        schema = type(f"Level{level}", (Schema,), {"fields": [
+            Field("left", type=schema, description="Left branch"),
+            Field("right", type=List[schema], description="Right branches", required=False),
+        ]})
+    return schema
+
+def _time(func) -> float:
+    start = perf_counter()
+    func()
+    return perf_counter() - start
+
+def main() -> None:
+    for depth in (4, 8, 12):
+        schema = _diamond(depth)
+        for use_refs in (False, True):
+            output = SchemaProcessor.convert(schema, "ollama", cache=False, use_refs=use_refs)
+            convert = _time(lambda: SchemaProcessor.convert(schema, "ollama", cache=False, use_refs=use_refs))
+            standardize = _time(lambda: SchemaProcessor.standardize(output, "ollama"))
+            label = "refs" if use_refs else "inline"
+            print(
+                f"depth {depth:3} {label:6}  convert {convert * 1e3:9.2f} ms   "
+                f"read back {standardize * 1e3:9.2f} ms   {len(json.dumps(output)):10} bytes"
+            )
+
+if __name__ == "__main__":
+    main()
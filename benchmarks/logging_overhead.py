@@ -0,0 +1,81 @@
+"""
+Logging overhead benchmark.
+
+Measures schema conversion and validation with belso's logger in production
+mode (no handler, WARNING level) and with DEBUG logging routed to a handler
+that formats every record and discards it. The difference is the share of
+the cost spent on logging.
+
+Run with: `python benchmarks/logging_overhead.py`
+"""
+
+import io
+import logging
+from timeit import timeit
+from typing import List
+
+from belso import Schema, Field, SchemaProcessor
+from belso.utils import FORMATS, get_logger
+from belso.tools import validate_schema
+
+class Item(Schema):
+    fields = [
+        Field("sku", type=str, description="Item code"),
+        Field("price", type=float, description="Unit price"),
+        Field("quantity", type=int, description="Units ordered"),
+    ]
+
+class Order(Schema):
+    fields = [
+        Field("id", type=str, description="Order id"),
+        Field("customer", type=str, description="Customer name"),
+        Field("paid", type=bool, description="Whether the order is paid"),
+        Field("items", type=List[Item], description="Ordered items"),
+        Field("notes", type=str, description="Free text", required=False),
+    ]
+
+_RECORD = {
+    "id": "A-1",
+    "customer": "ACME",
+    "paid": True,
+    "items": [{"sku": f"S{i}", "price": 1.5, "quantity": i} for i in range(10)],
+}
+
+def _workloads():
+    return {
+        "convert (ollama)": lambda: SchemaProcessor.convert(Order, to=FORMATS.OLLAMA),
+        "convert (json)": lambda: SchemaProcessor.convert(Order, to=FORMATS.JSON),
+        "validate": lambda: validate_schema(_RECORD, Order),
+    }
+
+def _measure(number: int) -> dict:
+    results = {}
+    for name, func in _workloads().items():
+        timeit(func, number=number // 10)  # warm-up
+        results[name] = timeit(func, number=number) / number
+    return results
+
+def main(number: int = 5_000) -> None:
+    logger = get_logger()
+
+    logger.setLevel(logging.WARNING)
+    production = _measure(number)
+
+    handler = logging.StreamHandler(io.StringIO())
+    handler.setFormatter(logging.Formatter("[%(levelname)s][%(name)s] %(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+    try:
+        debug = _measure(number)
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(logging.WARNING)
+
+    print(f"{'workload':<18} {'production':>12} {'debug':>12} {'logging share':>14}")
+    for name in production:
+        prod_us, debug_us = production[name] * 1e6, debug[name] * 1e6
+        share = (debug_us - prod_us) / debug_us * 100
+        print(f"{name:<18} {prod_us:>10.1f}us {debug_us:>10.1f}us {share:>13.1f}%")
+
+if __name__ == "__main__":
+    main()
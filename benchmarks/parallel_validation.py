@@ -0,0 +1,68 @@
+"""
+Parallel validation benchmark.
+
+Validates a synthetic workload of JSON records with `validate_many` on
+1 to N worker processes and reports the throughput of each configuration.
+
+Run with: `python benchmarks/parallel_validation.py [records]`
+"""
+
+import os
+import sys
+import json
+from time import perf_counter
+from typing import List
+
+from belso import Schema, Field, SchemaProcessor
+
+class Item(Schema):
+    fields = [
+        Field("sku", type=str, description="Item code"),
+        Field("price", type=float, description="Unit price"),
+        Field("quantity", type=int, description="Units ordered"),
+    ]
+
+class Order(Schema):
+    fields = [
+        Field("id", type=str, description="Order id"),
+        Field("customer", type=str, description="Customer name"),
+        Field("paid", type=bool, description="Whether the order is paid"),
+        Field("items", type=List[Item], description="Ordered items"),
+    ]
+
+def _make_records(count: int) -> list:
+    template = {
+        "id": "",
+        "customer": "ACME",
+        "paid": True,
+        "items": [{"sku": f"S{j}", "price": 1.5, "quantity": j} for j in range(3)],
+    }
+    records = []
+    for i in range(count):
+        template["id"] = f"A-{i}"
+        # Every 10th record is invalid
+        template["paid"] = "yes" if i % 10 == 0 else True
+        records.append(json.dumps(template))
+    return records
+
+def main(count: int = 1_000_000, chunk_size: int = 20_000) -> None:
+    records = _make_records(count)
+    cpus = os.cpu_count() or 1
+    worker_counts = sorted({1, *(n for n in (2, 4, 8, 16, 32) if n <= cpus), cpus})
+
+    print(f"{count} records, {cpus} CPUs")
+    baseline = None
+    for workers in worker_counts:
+        start = perf_counter()
+        result = SchemaProcessor.validate_many(records, Order, workers=workers, chunk_size=chunk_size)
+        elapsed = perf_counter() - start
+        assert len(result.errors) == (count + 9) // 10
+        baseline = baseline or elapsed
+        print(
+            f"workers={workers:<3} {elapsed:7.2f} s  "
+            f"{count / elapsed / 1000:8.1f} k records/s  "
+            f"speed-up {baseline / elapsed:5.2f}x"
+        )
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,52 @@
+"""
+Schema fingerprint benchmark.
+
+Times the fingerprint of a 1,000-field nested schema, cold and cached,
+against converting the same schema to JSON and OpenAI formats.
+
+Run with: `python benchmarks/schema_fingerprint.py`
+"""
+
+from time import perf_counter
+from typing import Type
+
+from belso import Schema, Field, SchemaProcessor
+from belso.core import schema_fingerprint
+
+def _build(depth: int = 10, width: int = 100) -> Type[Schema]:
+    schema = None
+    for level in range(depth):
+        fields = [
+            Field(f"field_{level}_{i}", type=(str, int, float, bool)[i % 4], description=f"Field {i}")
+            for i in range(width - 1)
+        ]
+        if schema is not None:
+            fields.append(Field("child", type=schema, description="Nested level"))
+        schema = type(f"Level{level}", (Schema,), {"fields": fields})
+    return schema
+
+def _time(func, number: int) -> float:
+    start = perf_counter()
+    for _ in range(number):
+        func()
+    return (perf_counter() - start) / number
+
+def main(number: int = 20) -> None:
+    schema = _build()
+
+    def cold_fingerprint() -> None:
+        # Drop the fingerprint cached on the class
+        schema.__dict__.get("_fingerprint") and delattr(schema, "_fingerprint")
+        schema_fingerprint(schema)
+
+    cold = _time(cold_fingerprint, number)
+    cached = _time(lambda: schema_fingerprint(schema), number * 100)
+    print(f"fingerprint  cold {cold * 1e3:8.2f} ms   cached {cached * 1e6:6.2f} us")
+
+    for to in ("json", "openai", "anthropic"):
+        SchemaProcessor.convert(schema, to=to, cache=False)
+        elapsed = _time(lambda: SchemaProcessor.convert(schema, to=to, cache=False), number)
+        print(f"{to:12} convert {elapsed * 1e3:8.2f} ms   ({elapsed / cold:5.1f}x the cold fingerprint)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Compiled schema IR benchmark.
+
+Times the compilation of a wide, nested schema into its flat description,
+and a conversion to every uncached target format, where each converter
+reuses the IR compiled by the first one.
+
+Run with: `python benchmarks/schema_ir.py`
+"""
+
+from time import perf_counter
+from typing import List
+
+from belso import Schema, Field, SchemaProcessor
+from belso.core.ir import SchemaIR, compile_ir
+
+_TARGETS = ("openai", "anthropic", "google", "ollama", "json", "yaml", "xml")
+
+class Address(Schema):
+    fields = [Field(f"line{i}", type=str, description="Address line") for i in range(10)]
+
+class Item(Schema):
+    fields = [
+        Field("sku", type=str, description="Item code"),
+        Field("price", type=float, description="Unit price", range=(0, 1e6)),
+        Field("tags", type=List[str], description="Tags"),
+    ]
+
+class Order(Schema):
+    fields = [Field(f"note{i}", type=str, description="Note") for i in range(50)] + [
+        Field("billing", type=Address, description="Billing address"),
+        Field("shipping", type=Address, description="Shipping address"),
+        Field("items", type=List[Item], description="Ordered items"),
+    ]
+
+def main(number: int = 200) -> None:
+    start = perf_counter()
+    for _ in range(number):
+        SchemaIR(Order)
+    build = (perf_counter() - start) / number
+    compile_ir(Order)
+    start = perf_counter()
+    for _ in range(number):
+        compile_ir(Order)
+    cached = (perf_counter() - start) / number
+    print(f"compile  {build * 1e6:10.1f} us   cached {cached * 1e6:6.2f} us")
+
+    # Warm up imports
+    for to in _TARGETS:
+        SchemaProcessor.convert(Order, to=to, cache=False)
+    start = perf_counter()
+    for _ in range(number // 10):
+        for to in _TARGETS:
+            SchemaProcessor.convert(Order, to=to, cache=False)
+    total = (perf_counter() - start) / (number // 10)
+    print(f"{len(_TARGETS)} targets {total * 1e3:8.2f} ms per schema")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Schema lifetime check.
+
+Builds schemas dynamically, as `Schema.from_spec`, `Schema.derive` and the
+deserializers do, compiles, fingerprints, converts (uncached) and
+validates them, then drops them and counts the classes the garbage
+collector could not free. Per-schema caches are stored on the schema
+classes, so none should survive. Reports the memory still held, and fails
+if a schema is kept alive.
+
+Run with: `python benchmarks/schema_lifetime.py`
+"""
+
+import gc
+import json
+import tracemalloc
+import weakref
+from typing import List
+
+from belso import Schema, SchemaProcessor
+from belso.core import compile_ir
+from belso.tools import validate_schema, IncrementalValidator
+
+def _use(schema: type, record: dict) -> None:
+    compile_ir(schema)
+    schema.fingerprint()
+    SchemaProcessor.convert(schema, to="anthropic", cache=False)
+    SchemaProcessor.validate(record, schema)
+    validate_schema(record, schema)
+    validator = IncrementalValidator(schema)
+    validator.feed(json.dumps(record))
+    validator.close()
+
+def main(count: int = 2_000) -> None:
+    rows = [{"name": f"field{i}", "type": (str, int, float)[i % 3], "description": "Value"} for i in range(20)]
+    refs: List[weakref.ref] = []
+    base = {row["name"]: row["type"]() for row in rows}
+    record = dict(base, parent=base)
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(count):
+        schema = Schema.from_spec(rows, name=f"Dynamic{i}")
+        variant = schema.derive(add=[{"name": "parent", "type": schema, "description": "Base"}])
+        _use(variant, record)
+        refs += [weakref.ref(schema), weakref.ref(variant)]
+        del schema, variant
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    alive = sum(ref() is not None for ref in refs)
+    print(f"{len(refs)} schemas built   {alive} still alive   {held / 1024:8.1f} KiB held")
+    if alive:
+        raise SystemExit(f"{alive} schemas were not freed.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Shared pydantic model benchmark.
+
+Converts "diamond" schema graphs, where every level refers to the next one
+twice, to a pydantic model. Each distinct schema becomes a single model, so
+the conversion grows linearly with depth rather than doubling per level.
+
+Run with: `python benchmarks/shared_models.py`
+"""
+
+from time import perf_counter
+from typing import List, Type
+
+from belso import Schema, Field
+from belso.providers.base.pydantic_model import to_pydantic_model, clear_model_cache
+
+def _diamond(depth: int) -> Type[Schema]:
+    schema = type("Leaf", (Schema,), {"fields": [Field("value", type=str, description="Value")]})
+    for level in range(depth):
+        schema = type(f"Level{level}", (Schema,), {"fields": [
+            Field("left", type=schema, description="Left branch"),
+            Field("right", type=List[schema], description="Right branches", required=False),
+        ]})
+    return schema
+
+def main() -> None:
+    # Warm up pydantic
+    to_pydantic_model(_diamond(1))
+    for depth in (4, 8, 12, 16):
+        schema = _diamond(depth)
+        clear_model_cache()
+        start = perf_counter()
+        to_pydantic_model(schema)
+        cold = perf_counter() - start
+        start = perf_counter()
+        to_pydantic_model(schema)
+        warm = perf_counter() - start
+        print(f"depth {depth:3}   {2 ** depth:6} leaf uses   cold {cold * 1e3:8.2f} ms   warm {warm * 1e3:6.3f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Streaming fields benchmark.
+
+Feeds a JSON document to `SchemaProcessor.stream_fields` in small chunks,
+as an LLM would stream it, and compares it with re-parsing the growing
+buffer with `json.loads` on every chunk. Reports the time to the first
+field and the total time.
+
+Run with: `python benchmarks/streaming_fields.py [items]`
+"""
+
+import sys
+import json
+from time import perf_counter
+from typing import List
+
+from belso import Schema, Field, SchemaProcessor
+
+class Item(Schema):
+    fields = [
+        Field("sku", type=str, description="Item code"),
+        Field("price", type=float, description="Unit price"),
+        Field("quantity", type=int, description="Units ordered"),
+    ]
+
+class Order(Schema):
+    fields = [
+        Field("id", type=str, description="Order id"),
+        Field("items", type=List[Item], description="Ordered items"),
+    ]
+
+def _chunks(count: int, size: int = 4) -> List[str]:
+    text = json.dumps({
+        "id": "A-1",
+        "items": [{"sku": f"S{i}", "price": 1.5, "quantity": i} for i in range(count)],
+    })
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+def _reparse(chunks: List[str]) -> tuple:
+    # Every chunk re-parses the whole buffer, and nothing is known until the end
+    start = perf_counter()
+    buffer = ""
+    for chunk in chunks:
+        buffer += chunk
+        try:
+            data = json.loads(buffer)
+        except json.JSONDecodeError:
+            continue
+    SchemaProcessor.validate(data, Order)
+    total = perf_counter() - start
+    return total, total
+
+def _stream(chunks: List[str]) -> tuple:
+    start = perf_counter()
+    first = None
+    for _ in SchemaProcessor.stream_fields(chunks, Order):
+        if first is None:
+            first = perf_counter() - start
+    return first, perf_counter() - start
+
+def main(count: int = 500) -> None:
+    chunks = _chunks(count)
+    reparse_first, reparse_total = _reparse(chunks)
+    stream_first, stream_total = _stream(chunks)
+
+    print(f"{count} items, {len(chunks)} chunks")
+    print(f"json.loads on every chunk: first field {reparse_first * 1000:9.2f} ms, total {reparse_total * 1000:9.1f} ms")
+    print(f"stream_fields:             first field {stream_first * 1000:9.2f} ms, total {stream_total * 1000:9.1f} ms")
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
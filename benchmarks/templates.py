@@ -0,0 +1,49 @@
+"""
+Schema template benchmark.
+
+Times converting a schema to Anthropic format with per-tenant `enum`
+values, by rebuilding the schema with `type()` and `Field` and converting
+it, and by instantiating a `SchemaTemplate`. Every tenant has distinct
+values, so the template cache never hits: only the patching is timed.
+
+Run with: `python benchmarks/templates.py`
+"""
+
+from time import perf_counter
+from typing import List
+
+from belso import Schema, Field, SchemaProcessor
+from belso.core import SchemaTemplate
+
+class Item(Schema):
+    fields = [
+        Field("sku", type=str, description="Item code"),
+        Field("price", type=float, description="Unit price", range=(0.0, 1e6)),
+    ]
+
+def _fields(categories: List[str]) -> list:
+    return [Field(f"note{i}", type=str, description="Note", length_range=(0, 200)) for i in range(50)] + [
+        Field("category", type=str, description="Ticket category", enum=categories),
+        Field("items", type=List[Item], description="Ordered items", items_range=(1, 20)),
+    ]
+
+def main(tenants: int = 500) -> None:
+    categories = [[f"category{tenant}-{i}" for i in range(10)] for tenant in range(tenants)]
+
+    start = perf_counter()
+    for values in categories:
+        schema = type("Ticket", (Schema,), {"fields": _fields(values)})
+        SchemaProcessor.convert(schema, to="anthropic", cache=False)
+    rebuild = (perf_counter() - start) / tenants
+
+    template = SchemaTemplate(type("Ticket", (Schema,), {"fields": _fields(["default"])}), {"categories": "category.enum"})
+    template.convert("anthropic")
+    start = perf_counter()
+    for values in categories:
+        template.convert("anthropic", categories=values)
+    patch = (perf_counter() - start) / tenants
+
+    print(f"rebuild and convert {rebuild * 1e3:7.3f} ms   template {patch * 1e3:7.3f} ms   speed-up {rebuild / patch:5.1f}x")
+
+if __name__ == "__main__":
+    main()